@@ -1,4 +1,4 @@
 from .celery import app
-from .redis import redis
+from .redis import redis, redis_key
 
-__all__ = ("redis", "app")
+__all__ = ("redis", "redis_key", "app")
@@ -13,7 +13,10 @@ class BaseModel(models.Model):
 
 
 class TrackingleModel(BaseModel):
-    modified = models.DateTimeField(null=True, blank=True, default=None)
+    # Last content change, bulk writes only set it when `content_hash` changes
+    modified = models.DateTimeField(null=True, blank=True, default=None, db_index=True)
+    # Hash of the written content, lets bulk writes skip unchanged rows
+    content_hash = models.TextField(null=True, blank=True, default=None)
 
     class Meta(BaseModel.Meta):
         abstract = True
@@ -0,0 +1,92 @@
+import gzip
+import threading
+from typing import Callable
+
+import brotli
+import zstandard
+from django.conf import settings
+
+# Supported content codings in the order of preference (on equal quality)
+COMPRESSORS: dict[str, Callable[[bytes, int], bytes]] = {
+    "zstd": lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+    "br": lambda data, level: brotli.compress(data, quality=level),
+    "gzip": lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+}
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick the content coding for the `Accept-Encoding` request header.
+
+    Args:
+        accept_encoding: Header value, e.g. `gzip, br;q=0.9, *;q=0`
+
+    Returns:
+        Supported coding with the highest quality, None if none is acceptable
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in COMPRESSORS:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with the configured level of the content coding.
+
+    Args:
+        data: Raw response body
+        encoding: Content coding from `COMPRESSORS`
+
+    Returns:
+        Compressed body
+    """
+    return COMPRESSORS[encoding](data, settings.COMPRESSION_LEVELS[encoding])
+
+
+class EncodedPayload:
+    """Immutable response body together with its lazily compressed variants.
+
+    Each variant is compressed at most once, so long-lived payloads (e.g. of
+    the dataset snapshot) are compressed once per dataset version.
+    """
+
+    __slots__ = ("content", "_variants", "_lock")
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self._variants: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def compressed(self, encoding: str) -> bytes:
+        """Get the body compressed with the content coding.
+
+        Args:
+            encoding: Content coding from `COMPRESSORS`
+
+        Returns:
+            Compressed body
+        """
+        variant = self._variants.get(encoding)
+        if variant is None:
+            with self._lock:
+                variant = self._variants.get(encoding)
+                if variant is None:
+                    variant = self._variants[encoding] = compress(
+                        self.content, encoding
+                    )
+        return variant
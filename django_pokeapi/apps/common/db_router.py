@@ -0,0 +1,169 @@
+import contextlib
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+_log = logging.getLogger(__name__)
+
+
+class _RequestRouting:
+    """Routing state of a read-only API request."""
+
+    __slots__ = ("wrote", "alias")
+
+    def __init__(self) -> None:
+        self.wrote = False
+        # Database chosen by the first read, later reads of the request use it
+        # too (so e.g. a count and its page see the same data)
+        self.alias: str | None = None
+
+
+# Set for read-only API requests only, so ingestion, commands and tasks (and
+# requests that may write) read from the primary
+_request_routing: ContextVar[_RequestRouting | None] = ContextVar(
+    "request_routing", default=None
+)
+# Set inside `use_primary` blocks
+_primary_only: ContextVar[bool] = ContextVar("primary_only", default=False)
+
+# Seconds a measured replica lag is reused before it is queried again
+LAG_CHECK_INTERVAL = 1.0
+
+# Caught up replicas report no lag (even when nothing was written for a while),
+# others the age of the last replayed transaction. Replicas not streaming from
+# the primary report NULL (unusable): they have replayed all they received, but
+# can't tell how much they missed. `status` is only visible to roles with
+# `pg_read_all_stats`, others rely on the WAL receiver running at all.
+_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN NOT EXISTS (
+        SELECT FROM pg_stat_wal_receiver
+        WHERE coalesce(status, 'streaming') = 'streaming'
+    ) THEN NULL
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+def replica_aliases() -> list[str]:
+    """Get database aliases of the configured read replicas."""
+    return [alias for alias in settings.DATABASES if alias != DEFAULT_DB_ALIAS]
+
+
+@contextlib.contextmanager
+def replica_reads() -> Iterator[None]:
+    """Let reads inside the block go to replicas until the block writes.
+
+    Used for read-only API requests (see `ReplicaReadsMiddleware`).
+    """
+    token = _request_routing.set(_RequestRouting())
+    try:
+        yield
+    finally:
+        _request_routing.reset(token)
+
+
+@contextlib.contextmanager
+def use_primary() -> Iterator[None]:
+    """Send all reads inside the block to the primary.
+
+    Use for values cached beyond the request (e.g. per dataset version) and
+    for read positions handed to clients (e.g. the `/changes` cursor), which
+    must not come from a lagging replica.
+    """
+    token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+class _LagMonitor:
+    """Replication lag of each replica, measured at most once per interval."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # alias -> (measured at, lag in seconds or None when unreachable)
+        self._lags: dict[str, tuple[float, float | None]] = {}
+
+    def lag(self, alias: str) -> float | None:
+        now = time.monotonic()
+        entry = self._lags.get(alias)
+        if entry and now - entry[0] < LAG_CHECK_INTERVAL:
+            return entry[1]
+
+        with self._lock:
+            entry = self._lags.get(alias)
+            if entry and now - entry[0] < LAG_CHECK_INTERVAL:
+                return entry[1]
+
+            lag = self._measure(alias)
+            self._lags[alias] = (time.monotonic(), lag)
+            return lag
+
+    @staticmethod
+    def _measure(alias: str) -> float | None:
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(_LAG_QUERY)
+                row = cursor.fetchone()
+        except DatabaseError as error:
+            _log.warning("Unable to read lag of replica %s: %s", alias, error)
+            return None
+
+        if row[0] is None:
+            _log.warning("Replica %s is not streaming from the primary", alias)
+            return None
+        return float(row[0])
+
+
+_lag_monitor = _LagMonitor()
+
+
+class ReplicaRouter:
+    """Route reads of API requests to read replicas, everything else to the primary.
+
+    Requests are spread over replicas lagging at most `DB_REPLICA_MAX_LAG`
+    seconds (each request reads from one of them), they fall back to the
+    primary when there is none. Once a request writes, its following reads
+    stick to the primary too.
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> str:
+        routing = _request_routing.get()
+        if routing is None or routing.wrote or _primary_only.get():
+            return DEFAULT_DB_ALIAS
+
+        if routing.alias is None:
+            replicas = [
+                alias
+                for alias in replica_aliases()
+                if (lag := _lag_monitor.lag(alias)) is not None
+                and lag <= settings.DB_REPLICA_MAX_LAG
+            ]
+            routing.alias = random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+        return routing.alias
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        # Reads after a write have to see it
+        if routing := _request_routing.get():
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: str | None = None, **hints: Any
+    ) -> bool:
+        # Replicas get the schema through replication
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,164 @@
+import contextlib
+import logging
+import random
+import time
+from typing import Callable
+
+import orjson
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from django_pokeapi.apps.common.compression import (
+    EncodedPayload,
+    compress,
+    negotiate_encoding,
+)
+from django_pokeapi.apps.common.db_router import replica_aliases, replica_reads
+from django_pokeapi.apps.common.profiling import (
+    BUILD,
+    RENDER,
+    dump_path,
+    profile_request,
+    run_profiled,
+)
+
+_log = logging.getLogger(__name__)
+
+# Methods of requests whose reads may go to replicas (they should not write)
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CompressionMiddleware:
+    """Compress responses with gzip, brotli or zstd based on `Accept-Encoding`.
+
+    Responses carrying an `EncodedPayload` (`response.payload`) reuse its cached
+    compressed variants, other responses are compressed per request. Bodies
+    smaller than `COMPRESSION_MIN_SIZE` are sent as they are.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+
+        # Vary even when not compressed, caches must not mix the variants
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        payload: EncodedPayload | None = getattr(response, "payload", None)
+        if payload is not None:
+            content = payload.compressed(encoding)
+        else:
+            content = compress(response.content, encoding)
+
+        # Not worth it (e.g. already compressed data)
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response["Content-Length"] = str(len(content))
+        response["Content-Encoding"] = encoding
+
+        # The compressed representation is no longer byte-identical
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+
+        return response
+
+
+class ReplicaReadsMiddleware:
+    """Send reads of read-only requests to replicas (see `ReplicaRouter`).
+
+    Not used when no replicas are configured.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not replica_aliases():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method not in SAFE_METHODS:
+            return self.get_response(request)
+
+        with replica_reads():
+            return self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """Measure where requests spend their time (opt-in via `PROFILING`).
+
+    Records the query count and database time, DTO building time, JSON
+    rendering time, the rest of the request time (other Python code and
+    compression) and the response size as sent (compressed when it is). They are reported in the `Server-Timing` header and logged as JSON.
+    A `PROFILING_SAMPLE_RATE` share of requests runs under cProfile, with
+    stats dumped to `PROFILING_DIR`. Not used when profiling is off.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.PROFILING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        dump_to = None
+        if random.random() < settings.PROFILING_SAMPLE_RATE:
+            dump_to = dump_path(settings.PROFILING_DIR, request.method, request.path)
+
+        with profile_request() as profile, contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile.record_query))
+
+            start = time.perf_counter()
+            if dump_to is not None:
+                response = run_profiled(lambda: self.get_response(request), dump_to)
+            else:
+                response = self.get_response(request)
+            total = time.perf_counter() - start
+
+        build = profile.phases.get(BUILD, 0.0)
+        render = profile.phases.get(RENDER, 0.0)
+        other = max(total - profile.db_time - build - render, 0.0)
+        size = None if response.streaming else len(response.content)
+
+        response["Server-Timing"] = ", ".join(
+            (
+                f'db;dur={profile.db_time * 1000:.2f};desc="{profile.queries} queries"',
+                f"{BUILD};dur={build * 1000:.2f}",
+                f"{RENDER};dur={render * 1000:.2f}",
+                f"other;dur={other * 1000:.2f}",
+                f"total;dur={total * 1000:.2f}",
+            )
+        )
+        fields = {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "status": response.status_code,
+            "queries": profile.queries,
+            "db_ms": round(profile.db_time * 1000, 2),
+            "build_ms": round(build * 1000, 2),
+            "render_ms": round(render * 1000, 2),
+            "other_ms": round(other * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+            "size": size,
+            "profile": str(dump_to) if dump_to is not None else None,
+        }
+        _log.info(
+            "Request profile %s",
+            orjson.dumps(fields).decode(),
+            extra={"profile": fields},
+        )
+        return response
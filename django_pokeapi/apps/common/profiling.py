@@ -0,0 +1,121 @@
+import contextlib
+import cProfile
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator
+
+# Construction of response DTOs from model instances
+BUILD = "build"
+# Serialization of the response body to JSON
+RENDER = "render"
+
+
+@dataclass
+class RequestProfile:
+    """Measurements of one request collected by `ProfilingMiddleware`."""
+
+    queries: int = 0
+    db_time: float = 0.0
+    # Phase name -> seconds (without database time spent inside the phase)
+    phases: dict[str, float] = field(default_factory=dict)
+    # Phases being timed, nested blocks of the same phase are counted once
+    active: set[str] = field(default_factory=set)
+
+    def record_query(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        """Database execute wrapper counting queries and their time."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+_current: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile", default=None
+)
+# Shared no-op of blocks not timed (no profiled request, or a nested phase)
+_NOT_TIMED = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    """Collect measurements of the code inside the block into a new profile."""
+    profile = RequestProfile()
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+def timed(phase: str) -> ContextManager[None]:
+    """Add time spent inside the block to a phase of the profiled request.
+
+    Costs a context variable lookup and entering a shared no-op context
+    manager when no request is profiled.
+
+    Args:
+        phase: Phase name (e.g. `RENDER`)
+    """
+    profile = _current.get()
+    if profile is None or phase in profile.active:
+        return _NOT_TIMED
+    return _timed(profile, phase)
+
+
+@contextlib.contextmanager
+def _timed(profile: RequestProfile, phase: str) -> Iterator[None]:
+    profile.active.add(phase)
+    db_time = profile.db_time
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start - (profile.db_time - db_time)
+        profile.phases[phase] = profile.phases.get(phase, 0.0) + elapsed
+        profile.active.discard(phase)
+
+
+def dump_path(directory: str, method: str, path: str) -> Path:
+    """Build a unique file path for the cProfile dump of a request.
+
+    Args:
+        directory: Directory of the dumps (created when missing)
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        Path of a `.prof` file (readable with `pstats` or snakeviz)
+    """
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_") or "root"
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    return target / f"{time.time_ns()}_{method.lower()}_{slug[:100]}.prof"
+
+
+def run_profiled(func: Callable[[], Any], dump_to: Path) -> Any:
+    """Run function under cProfile and dump the stats to a file.
+
+    Args:
+        func: Function to run
+        dump_to: File the stats are written to
+
+    Returns:
+        Result of the function
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(dump_to)
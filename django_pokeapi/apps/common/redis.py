@@ -1,3 +1,4 @@
+from django.conf import settings as django_settings
 from redis.client import Redis
 
 from django_pokeapi import settings
@@ -6,3 +7,11 @@ redis: Redis = Redis(
     db=0,
     decode_responses=True,
 ).from_url(url=f"{settings.REDIS_URL}")
+
+
+def redis_key(*parts: object) -> str:
+    """Build a key (or channel name) under `REDIS_KEY_PREFIX`.
+
+    The prefix is read on every call, so it can be overridden at runtime.
+    """
+    return ":".join((django_settings.REDIS_KEY_PREFIX, *map(str, parts)))
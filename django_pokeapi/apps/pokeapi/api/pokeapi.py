@@ -1,15 +1,46 @@
-from django.http import Http404, HttpRequest
+from django.http import Http404, HttpRequest, HttpResponse
 from ninja import Query, Router
+from ninja.errors import HttpError
 
-from django_pokeapi.apps.pokeapi import operations
+from django_pokeapi.apps.pokeapi import dataset, operations
+from django_pokeapi.apps.pokeapi.api.responses import (
+    parse_projection,
+    pokemon_batch_response,
+    prerendered_response,
+    projected_response,
+    trusted_response,
+)
 from django_pokeapi.apps.pokeapi.dto.api_dto import (
     AbilityDTO,
+    AbilityLanguageRequestDTO,
+    AbilitySearchRequestDTO,
+    AbilitySearchResultDTO,
+    ChangesDTO,
+    ChangesRequestDTO,
+    DamageRankingDTO,
+    DamageRankingRequestDTO,
+    DefensiveProfileDTO,
+    PokemonBatchComparisonDTO,
+    PokemonBatchComparisonRequestDTO,
+    PokemonBatchItemDTO,
+    PokemonBatchRequestDTO,
     PokemonComparisonDTO,
+    PokemonLeaderboardRequestDTO,
     PokemonListDTO,
     PokemonRequestDTO,
+    PokemonSearchRequestDTO,
+    PokemonSimilarRequestDTO,
+    PokemonStatFilterRequestDTO,
+    PokemonStatsDTO,
+    SharedMovesDTO,
+    SimilarPokemonDTO,
+    TeamCoverageDTO,
+    TeamRequestDTO,
     TypeDTO,
+    TypeEffectivenessDTO,
 )
 from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
+from django_pokeapi.apps.pokeapi.models import Move, Pokemon, PokemonType
 
 router = Router(tags=["pokemon"])
 
@@ -17,27 +48,121 @@ router = Router(tags=["pokemon"])
 # Pokemon endpoints
 @router.get("/pokemon/all", response=list[PokemonListDTO])
 def get_pokemon_list(
-    request: HttpRequest, offset: int = 0, limit: int = 100
-) -> list[PokemonListDTO]:
+    request: HttpRequest,
+    offset: int = 0,
+    limit: int = 100,
+    fields: str | None = None,
+    exclude: str | None = None,
+) -> list[PokemonListDTO] | HttpResponse:
     """Get list of all Pokemon with pagination.
 
     Args:
         request (HttpRequest): Request object (not used)
         offset (int): Starting position (which Pokemon ID to start from)
         limit (int): Maximum number of Pokemon to return (when set to 0, all Pokemon are returned)
+        fields (str | None): Comma separated fields to return (e.g. `id,name,types`)
+        exclude (str | None): Comma separated fields to leave out (e.g. `sprites`)
+
+    Returns:
+        list[PokemonListDTO]: List with applied pagination
+    """
+    projection = parse_projection(PokemonListDTO, fields, exclude)
+    # Pages always come encoded (projected ones bypass the response schema)
+    return prerendered_response(operations.get_pokemon_list(offset, limit, projection))
+
+
+@router.get("/pokemon/search", response=list[PokemonListDTO])
+def search_pokemon(
+    request: HttpRequest,
+    search: Query[PokemonSearchRequestDTO],
+    offset: int = 0,
+    limit: int = 100,
+) -> list[PokemonListDTO] | HttpResponse:
+    """Search Pokemon by types and/or abilities with pagination.
+
+    Repeat `types`/`abilities` to pass multiple names. `type_match` and
+    `ability_match` select AND (`all`) or OR (`any`) semantics within each group,
+    the groups themselves are always combined with AND.
+
+    Args:
+        request (HttpRequest): Request object (not used)
+        search (PokemonSearchRequestDTO): Type/ability names and match modes
+        offset (int): Starting position
+        limit (int): Maximum number of Pokemon to return (when set to 0, all Pokemon are returned)
 
     Returns:
-        list[PokemonListDTO]: List with prefetched relations and applied pagination
+        list[PokemonListDTO]: Matching Pokemon ordered by ID
     """
-    return operations.get_pokemon_list(offset, limit)
+    if not search.types and not search.abilities:
+        raise HttpError(400, "At least one type or ability must be provided")
+
+    return trusted_response(operations.search_pokemon(search, offset, limit))
+
+
+@router.get("/pokemon/stats", response=list[PokemonStatsDTO])
+def filter_pokemon_by_stats(
+    request: HttpRequest,
+    filters: Query[PokemonStatFilterRequestDTO],
+    offset: int = 0,
+    limit: int = 100,
+) -> list[PokemonStatsDTO] | HttpResponse:
+    """Filter Pokemon by base stat ranges with pagination.
+
+    Use `min_<stat>`/`max_<stat>` (inclusive) for any of hp, attack, defense,
+    special_attack, special_defense, speed and total. Results can be
+    narrowed by types/abilities and sorted by a stat via `order_by`.
+
+    Args:
+        request (HttpRequest): Request object (not used)
+        filters (PokemonStatFilterRequestDTO): Stat ranges, type/ability criteria, ordering
+        offset (int): Starting position
+        limit (int): Maximum number of Pokemon to return (when set to 0, all Pokemon are returned)
+
+    Returns:
+        list[PokemonStatsDTO]: Matching Pokemon with their base stats
+    """
+    return trusted_response(operations.filter_pokemon_by_stats(filters, offset, limit))
+
+
+@router.get("/pokemon/leaderboard", response=list[PokemonStatsDTO])
+def get_stat_leaderboard(
+    request: HttpRequest, leaderboard: Query[PokemonLeaderboardRequestDTO]
+) -> list[PokemonStatsDTO] | HttpResponse:
+    """Get top-k Pokemon by a base stat (e.g. top 10 attack among fire types)."""
+    return trusted_response(operations.get_stat_leaderboard(leaderboard))
 
 
 @router.get("/pokemon", response=PokemonDTO)
-def get_pokemon_detail(request, pokemonrouter: Query[PokemonRequestDTO]) -> PokemonDTO:
+def get_pokemon_detail(
+    request,
+    pokemonrouter: Query[PokemonRequestDTO],
+    fields: str | None = None,
+    exclude: str | None = None,
+) -> PokemonDTO | HttpResponse:
     """Get detailed information about a specific Pokemon by ID or name.
     Either name or id must be provided.
+
+    Use `fields` or `exclude` (comma separated) to return only some fields,
+    e.g. `exclude=moves,held_items`. Columns of omitted fields are not loaded.
+    """
+    projection = parse_projection(PokemonDTO, fields, exclude)
+    pokemon = operations.get_pokemon(pokemonrouter, projection)
+    if projection is not None:
+        return projected_response(pokemon)
+
+    return prerendered_response(pokemon)
+
+
+@router.get("/pokemon/batch", response=list[PokemonBatchItemDTO])
+def get_pokemon_batch(
+    request: HttpRequest, batch: Query[PokemonBatchRequestDTO]
+) -> HttpResponse:
+    """Get details of up to 100 Pokemon at once.
+
+    Repeat `pokemon` with names or IDs. Results follow the request order,
+    Pokemon which don't exist have `found` set to false.
     """
-    return operations.get_pokemon(pokemonrouter)
+    return pokemon_batch_response(operations.get_pokemon_batch(batch.pokemon))
 
 
 @router.get(
@@ -46,13 +171,62 @@ def get_pokemon_detail(request, pokemonrouter: Query[PokemonRequestDTO]) -> Poke
 )
 def compare_pokemon(
     request: HttpRequest, pokemon1_name: str, pokemon2_name: str
-) -> PokemonComparisonDTO:
+) -> PokemonComparisonDTO | HttpResponse:
     """Compare Pokemon 1 stats with Pokemon 2 stats."""
-    comparison = operations.compare_pokemon_stats(pokemon1_name, pokemon2_name)
-    if not comparison:
-        raise Http404("One or both Pokemon not found")
+    try:
+        return trusted_response(
+            operations.compare_pokemon_stats(pokemon1_name, pokemon2_name)
+        )
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
+
+
+@router.get("/pokemon/compare/batch", response=PokemonBatchComparisonDTO)
+def compare_pokemon_batch(
+    request: HttpRequest, comparison: Query[PokemonBatchComparisonRequestDTO]
+) -> PokemonBatchComparisonDTO | HttpResponse:
+    """Compare base stats of multiple Pokemon (e.g. a whole team) pairwise.
+
+    Repeat `pokemon` with names or IDs. `stat_differences[stat][i][j]` is the
+    stat of the i-th requested Pokemon minus the stat of the j-th one.
+    """
+    try:
+        return trusted_response(operations.compare_pokemon_batch(comparison.pokemon))
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
 
-    return comparison
+
+@router.get("/pokemon/similar", response=list[SimilarPokemonDTO])
+def get_similar_pokemon(
+    request: HttpRequest, similar: Query[PokemonSimilarRequestDTO]
+) -> list[SimilarPokemonDTO] | HttpResponse:
+    """Get the `k` Pokemon with the most similar base stats.
+    Either name or id must be provided.
+
+    `include_types`/`include_size` add type and height/weight differences to
+    the distance, `same_type` and `max_base_experience` (e.g. to leave out
+    legendaries, Pokemon without a base experience are left out as well)
+    filter the candidates.
+    """
+    try:
+        return trusted_response(operations.get_similar_pokemon(similar))
+    except ValueError as error:
+        raise HttpError(400, str(error)) from error
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
+
+
+@router.get("/pokemon/moves/shared", response=SharedMovesDTO)
+def get_shared_moves(
+    request: HttpRequest, pokemon1_name: str, pokemon2_name: str
+) -> SharedMovesDTO | HttpResponse:
+    """Get moves learned by both Pokemon (names or IDs)."""
+    try:
+        return trusted_response(
+            operations.get_shared_moves(pokemon1_name, pokemon2_name)
+        )
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
 
 
 # Type endpoints
@@ -60,43 +234,220 @@ def compare_pokemon(
 def list_types(request: HttpRequest):
     """Get list of all Pokemon types."""
     types = operations.get_all_types()
-    return types
+    return prerendered_response(types)
 
 
 @router.get("/types/{type_name}", response=TypeDTO)
-def get_type_details(request: HttpRequest, type_name: str) -> TypeDTO:
+def get_type_details(request: HttpRequest, type_name: str) -> TypeDTO | HttpResponse:
     """Get detailed type information."""
     type_data = operations.get_type_details(type_name)
     if not type_data:
         raise Http404("Type not found")
 
-    return type_data
+    return prerendered_response(type_data)
+
+
+@router.get("/types/{type_name}/effectiveness", response=list[TypeEffectivenessDTO])
+def get_type_effectiveness(
+    request: HttpRequest,
+    type_name: str,
+    min_multiplier: float | None = None,
+    offset: int = 0,
+    limit: int = 100,
+) -> list[TypeEffectivenessDTO] | HttpResponse:
+    """Get damage multiplier of an attacking type against every Pokemon.
+
+    Args:
+        request (HttpRequest): Request object (not used)
+        type_name (str): Attacking type name
+        min_multiplier (float | None): Only Pokemon taking at least this multiplier
+            (e.g. 2 for Pokemon weak to the type)
+        offset (int): Starting position
+        limit (int): Maximum number of Pokemon to return (when set to 0, all Pokemon are returned)
+
+    Returns:
+        list[TypeEffectivenessDTO]: Pokemon with the multiplier, ordered by ID
+    """
+    try:
+        return trusted_response(
+            operations.get_type_effectiveness(type_name, min_multiplier, offset, limit)
+        )
+    except PokemonType.DoesNotExist as error:
+        raise Http404(str(error)) from error
+
+
+@router.get("/pokemon/damage", response=DamageRankingDTO)
+def get_damage_ranking(
+    request: HttpRequest, ranking: Query[DamageRankingRequestDTO]
+) -> DamageRankingDTO | HttpResponse:
+    """Rank every Pokemon by expected damage of its best STAB type against a defender.
+    Either name or id must be provided.
+
+    Damage is estimated for a move of `power` with all Pokemon at `level`
+    (the better of the physical and special split, mean random roll).
+    `limit=0` returns all attackers.
+    """
+    try:
+        return trusted_response(operations.get_damage_ranking(ranking))
+    except ValueError as error:
+        raise HttpError(400, str(error)) from error
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
+
+
+@router.get("/pokemon/weaknesses", response=DefensiveProfileDTO)
+def get_defensive_profile(
+    request: HttpRequest, pokemonrouter: Query[PokemonRequestDTO]
+) -> DefensiveProfileDTO | HttpResponse:
+    """Get damage multipliers of every attacking type against a Pokemon.
+    Either name or id must be provided.
+    """
+    identifier = str(pokemonrouter.id) if pokemonrouter.id else pokemonrouter.name
+    if not identifier:
+        raise HttpError(400, "Either id or name must be provided")
+
+    try:
+        return trusted_response(operations.get_defensive_profile(identifier))
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
+
+
+@router.get("/team/coverage", response=TeamCoverageDTO)
+def get_team_coverage(
+    request: HttpRequest, team: Query[TeamRequestDTO]
+) -> TeamCoverageDTO | HttpResponse:
+    """Summarize team type weaknesses and offensive coverage of its STAB types.
+
+    Repeat `pokemon` with names or IDs of the team members.
+    """
+    try:
+        return trusted_response(operations.get_team_coverage(team.pokemon))
+    except Pokemon.DoesNotExist as error:
+        raise Http404(str(error)) from error
+
+
+# Move endpoints
+@router.get("/moves/{move_name}/pokemon", response=list[PokemonListDTO])
+def get_pokemon_learning_move(
+    request: HttpRequest, move_name: str, offset: int = 0, limit: int = 100
+) -> list[PokemonListDTO] | HttpResponse:
+    """Get Pokemon which learn the move.
+
+    Args:
+        request (HttpRequest): Request object (not used)
+        move_name (str): Move name
+        offset (int): Starting position
+        limit (int): Maximum number of Pokemon to return (when set to 0, all Pokemon are returned)
+
+    Returns:
+        list[PokemonListDTO]: Pokemon ordered by id
+    """
+    try:
+        return trusted_response(
+            operations.get_pokemon_learning_move(move_name, offset, limit)
+        )
+    except Move.DoesNotExist as error:
+        raise Http404("Move not found") from error
 
 
 # Ability endpoints
 @router.get("/abilities", response=list[AbilityDTO])
-def list_abilities(request: HttpRequest, offset: int = 0, limit: int = 20):
+def list_abilities(
+    request: HttpRequest,
+    localization: Query[AbilityLanguageRequestDTO],
+    offset: int = 0,
+    limit: int = 20,
+    fields: str | None = None,
+    exclude: str | None = None,
+):
     """Get list of all Pokemon abilities with pagination.
 
     Args:
         request (HttpRequest): Request object (not used)
+        localization (AbilityLanguageRequestDTO): `lang` (default `en`) and
+            optional `version_group` of the effect and flavor texts
         offset (int): Starting position (which Ability ID to start from)
         limit (int): Maximum number of Abilities to return
             (when set to 0, all Abilities are returned)
+        fields (str | None): Comma separated fields to return
+        exclude (str | None): Comma separated fields to leave out
 
     Returns:
         list[AbilityDTO]: List with applied pagination
     """
-    abilities = operations.get_all_abilities(offset, limit)
+    projection = parse_projection(AbilityDTO, fields, exclude)
+    abilities = operations.get_all_abilities(offset, limit, localization, projection)
+    if projection is not None:
+        return projected_response(abilities)
+
+    return prerendered_response(abilities)
 
-    return abilities
+
+@router.get("/abilities/search", response=list[AbilitySearchResultDTO])
+def search_abilities(
+    request: HttpRequest,
+    search: Query[AbilitySearchRequestDTO],
+    offset: int = 0,
+    limit: int = 20,
+) -> list[AbilitySearchResultDTO] | HttpResponse:
+    """Search abilities by what they do, e.g. `q=raises speed&lang=en`.
+
+    `q` supports web search syntax (quoted phrases, `or`, `-excluded`). Results
+    are ranked (name matches first, then effect and flavor text) and carry
+    a highlighted snippet.
+    """
+    return trusted_response(operations.search_abilities(search, offset, limit))
 
 
 @router.get("/abilities/{ability_name}", response=AbilityDTO)
-def get_ability_details(request: HttpRequest, ability_name: str) -> AbilityDTO:
-    """Get detailed ability information."""
-    ability_data = operations.get_ability_details(ability_name)
+def get_ability_details(
+    request: HttpRequest,
+    ability_name: str,
+    localization: Query[AbilityLanguageRequestDTO],
+    fields: str | None = None,
+    exclude: str | None = None,
+) -> AbilityDTO | HttpResponse:
+    """Get detailed ability information.
+
+    Effect and flavor texts are in `lang` (default `en`), optionally only of
+    one `version_group`.
+    """
+    projection = parse_projection(AbilityDTO, fields, exclude)
+    ability_data = operations.get_ability_details(
+        ability_name, localization, projection
+    )
     if not ability_data:
         raise Http404("Ability not found")
 
-    return ability_data
+    if projection is not None:
+        return projected_response(ability_data)
+
+    return prerendered_response(ability_data)
+
+
+@router.get("/changes", response=ChangesDTO)
+def get_changes(
+    request: HttpRequest, changes_request: Query[ChangesRequestDTO]
+) -> ChangesDTO | HttpResponse:
+    """Get Pokemon, abilities and types created, updated or deleted since a time.
+
+    `since` is an ISO datetime or a dataset version (publish time in
+    milliseconds). Poll again with the returned `until` as `since` to get
+    only newer changes. `until` never passes the start of a running
+    ingestion, so changes committed later are not skipped.
+
+    Args:
+        request (HttpRequest): Request object (not used)
+        changes_request (ChangesRequestDTO): Time window and pagination
+
+    Returns:
+        ChangesDTO: Changes ordered by change time
+    """
+    if changes_request.until and changes_request.until < changes_request.since:
+        raise HttpError(400, "until must not be before since")
+
+    committed_until = dataset.get_committed_until()
+    if committed_until is None:
+        raise HttpError(503, "Changes are temporarily unavailable")
+
+    return trusted_response(operations.get_changes(changes_request, committed_until))
@@ -0,0 +1,115 @@
+from typing import Any
+
+import orjson
+from django.conf import settings
+from django.http import HttpResponse
+from ninja.errors import HttpError
+from pydantic import BaseModel
+
+from django_pokeapi.apps.common.compression import EncodedPayload
+from django_pokeapi.apps.common.profiling import RENDER, timed
+from django_pokeapi.apps.pokeapi.dto.encoded import dump_json
+from django_pokeapi.apps.pokeapi.dto.projection import parse_fields
+
+
+def parse_projection(
+    dto_class: Any, fields: str | None, exclude: str | None
+) -> frozenset[str] | None:
+    """Parse `fields`/`exclude` query parameters of a projectable endpoint.
+
+    Args:
+        dto_class: Response DTO class with `PROJECTED_FIELDS`
+        fields: Comma separated fields to include
+        exclude: Comma separated fields to leave out
+
+    Returns:
+        Requested field names, None when the full response is requested
+
+    Raises:
+        HttpError: 400 if the parameters are invalid
+    """
+    try:
+        return parse_fields(dto_class.PROJECTED_FIELDS, fields, exclude)
+    except ValueError as error:
+        raise HttpError(400, str(error)) from error
+
+
+def projected_response(data: BaseModel | list[BaseModel]) -> HttpResponse:
+    """Render projected DTO(s) with only their set fields.
+
+    Projected DTOs are partial, so they bypass the endpoint's response schema.
+
+    Args:
+        data: DTO or list of DTOs built with a field projection
+
+    Returns:
+        JSON response
+    """
+    return HttpResponse(
+        dump_json(data, exclude_unset=True), content_type="application/json"
+    )
+
+
+def prerendered_response(data: Any) -> Any:
+    """Reuse pre-encoded JSON of snapshot DTO(s) when available.
+
+    Args:
+        data: DTO or list of DTOs returned by the operation
+
+    Returns:
+        JSON response built from the pre-encoded payload (its compressed
+        variants are reused by `CompressionMiddleware`), otherwise the
+        `trusted_response` of the data
+    """
+    payload: EncodedPayload | None = getattr(data, "_encoded", None)
+    if payload is None:
+        return trusted_response(data)
+
+    response = HttpResponse(payload.content, content_type="application/json")
+    response.payload = payload
+    return response
+
+
+def pokemon_batch_response(items: list[tuple[str, bytes | None]]) -> HttpResponse:
+    """Render batch lookup results around the already encoded Pokemon.
+
+    Args:
+        items: (identifier, encoded `PokemonDTO` JSON or None) pairs
+
+    Returns:
+        JSON response matching `list[PokemonBatchItemDTO]`
+    """
+    with timed(RENDER):
+        content = orjson.dumps(
+            [
+                {
+                    "query": query,
+                    "found": pokemon is not None,
+                    "pokemon": (
+                        orjson.Fragment(pokemon) if pokemon is not None else None
+                    ),
+                }
+                for query, pokemon in items
+            ]
+        )
+    return HttpResponse(content, content_type="application/json")
+
+
+def trusted_response(data: BaseModel | list[BaseModel]) -> Any:
+    """Render complete DTO(s) built by our operations as they are.
+
+    Skips validating the (possibly large) response against the endpoint's
+    response schema once more and converting it to dicts for the renderer.
+    The schema still documents the endpoint.
+
+    Args:
+        data: Complete DTO or list of DTOs of one class
+
+    Returns:
+        JSON response, the data unchanged (to be validated and rendered by the
+        endpoint) when `TRUSTED_RESPONSES` is off
+    """
+    if not settings.TRUSTED_RESPONSES:
+        return data
+
+    return HttpResponse(dump_json(data), content_type="application/json")
@@ -0,0 +1,228 @@
+import dataclasses
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measured values of one benchmark case (metric name -> value or None)."""
+
+    benchmark: str
+    case: str
+    metrics: dict[str, float | None] = field(default_factory=dict)
+
+
+def best_time(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Measure the fastest of several runs (least disturbed by other processes).
+
+    Args:
+        func: Function to measure
+        repeat: Number of runs
+
+    Returns:
+        Duration of the fastest run in seconds
+    """
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def retained_memory(func: Callable[[], Any]) -> tuple[int, int]:
+    """Measure memory retained by the result of a function (and its peak).
+
+    Args:
+        func: Function whose result is kept alive while measuring
+
+    Returns:
+        (retained bytes, peak bytes) allocated while the function ran
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return retained, peak
+
+
+def call_allocations(func: Callable[[], Any]) -> tuple[int, int]:
+    """Count memory blocks allocated by one call (and its peak memory).
+
+    Blocks freed before the call returns are not counted (they are covered by
+    the peak).
+
+    Args:
+        func: Function whose result is kept alive while measuring
+
+    Returns:
+        (blocks still allocated after the call, peak bytes) of the call
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks, peak
+
+
+def _format_value(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:,}" if isinstance(value, int) else f"{value:,.2f}"
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Format results as an aligned text table (one row per case).
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        Table text
+    """
+    metrics = list(dict.fromkeys(name for result in results for name in result.metrics))
+    rows = [["benchmark", "case", *metrics]] + [
+        [
+            result.benchmark,
+            result.case,
+            *(_format_value(result.metrics.get(name)) for name in metrics),
+        ]
+        for result in results
+    ]
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            value.ljust(width) if column < 2 else value.rjust(width)
+            for column, (value, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
+
+
+def save_results(results: list[BenchmarkResult], path: Path) -> None:
+    """Write results to a JSON file (e.g. a baseline for `find_regressions`).
+
+    Args:
+        results: Benchmark results
+        path: Target file (parent directories are created when missing)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(
+        orjson.dumps(
+            [dataclasses.asdict(result) for result in results],
+            option=orjson.OPT_INDENT_2,
+        )
+    )
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    """Read results written by `save_results`.
+
+    Args:
+        path: Results file
+
+    Returns:
+        Benchmark results
+    """
+    return [BenchmarkResult(**result) for result in orjson.loads(path.read_bytes())]
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    checked: dict[str, bool],
+    tolerance: float,
+) -> list[str]:
+    """Compare results with a baseline of the same cases.
+
+    Cases and metrics missing in either of them are skipped.
+
+    Args:
+        results: Current results
+        baseline: Results to compare with
+        checked: Compared metric -> whether higher values are better
+        tolerance: Allowed relative change for the worse (e.g. 0.2 for 20 %)
+
+    Returns:
+        Description of each regressed metric
+    """
+    previous = {(result.benchmark, result.case): result for result in baseline}
+    regressions = []
+    for result in results:
+        if (reference := previous.get((result.benchmark, result.case))) is None:
+            continue
+
+        for metric, higher_is_better in checked.items():
+            value = result.metrics.get(metric)
+            expected = reference.metrics.get(metric)
+            if value is None or not expected:
+                continue
+
+            change = (value - expected) / expected
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    f"{result.benchmark} {result.case}: {metric} {value:,.2f}"
+                    f" (baseline {expected:,.2f}, {change:+.0%})"
+                )
+    return regressions
+
+
+def compare_results(
+    results: list[BenchmarkResult], baseline: list[BenchmarkResult]
+) -> list[BenchmarkResult]:
+    """Pair each metric with its value in a baseline of the same case.
+
+    Args:
+        results: Current results
+        baseline: Results to compare with
+
+    Returns:
+        One result per metric found in both (`case metric`: baseline, current
+        and change in %)
+    """
+    previous = {(result.benchmark, result.case): result for result in baseline}
+    comparison = []
+    for result in results:
+        if (reference := previous.get((result.benchmark, result.case))) is None:
+            continue
+
+        for metric, value in result.metrics.items():
+            expected = reference.metrics.get(metric)
+            if expected is None:
+                continue
+
+            comparison.append(
+                BenchmarkResult(
+                    benchmark=result.benchmark,
+                    case=f"{result.case} {metric}",
+                    metrics={
+                        "baseline": expected,
+                        "current": value,
+                        "change %": (
+                            (value - expected) / expected * 100 if expected else 0.0
+                        ),
+                    },
+                )
+            )
+    return comparison
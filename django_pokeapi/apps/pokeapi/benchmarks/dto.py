@@ -0,0 +1,130 @@
+"""Cost of DTO conversions on the hot paths of API reads and ingestion."""
+
+import timeit
+from typing import Any, Callable
+
+from django.db import transaction
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.benchmarks.base import (
+    BenchmarkResult,
+    call_allocations,
+)
+from django_pokeapi.apps.pokeapi.benchmarks.payloads import (
+    ability_payload,
+    pokemon_payload,
+    type_payload,
+)
+from django_pokeapi.apps.pokeapi.dto.api_dto import AbilityDTO, PokemonListDTO
+from django_pokeapi.apps.pokeapi.dto.projection import project_queryset
+from django_pokeapi.apps.pokeapi.ipc import ipc_operations
+from django_pokeapi.apps.pokeapi.ipc.dto.abilities import Ability
+from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
+from django_pokeapi.apps.pokeapi.ipc.dto.types import PokemonType
+from django_pokeapi.apps.pokeapi.ipc.records import PokemonRecord
+
+# Fixture Pokemon by label (ID -> number of moves), IDs are above stored ones
+FIXTURE_POKEMON = {"40 moves": (100_001, 40), "150 moves": (100_002, 150)}
+FIXTURE_ABILITY_ID = 100_001
+FIXTURE_TYPE_ID = 10
+
+
+def _stored_fixtures() -> dict[str, Callable[[], Any]]:
+    """Conversions of model instances loaded like the API loads them.
+
+    The fixtures are saved by ingestion code in a transaction rolled back once
+    they are loaded, so stored data is left untouched.
+    """
+    documents = {
+        label: pokemon_payload(pokemon_id, move_count)
+        for label, (pokemon_id, move_count) in FIXTURE_POKEMON.items()
+    }
+
+    cases: dict[str, Callable[[], Any]] = {}
+    with transaction.atomic():
+        ipc_operations.bulk_save_all_data(
+            [PokemonType(**type_payload(FIXTURE_TYPE_ID))],
+            [Ability(**ability_payload(FIXTURE_ABILITY_ID))],
+            [PokemonRecord.from_json(document) for document in documents.values()],
+        )
+
+        for label, document in documents.items():
+            pokemon = project_queryset(
+                models.Pokemon.objects.all(), PokemonDTO.PROJECTED_FIELDS
+            ).get(id=document["id"])
+            cases[f"PokemonDTO.from_model ({label})"] = (
+                lambda pokemon=pokemon: PokemonDTO.from_model(pokemon)
+            )
+
+        list_item = project_queryset(
+            models.Pokemon.objects.all(), PokemonListDTO.PROJECTED_FIELDS
+        ).get(id=FIXTURE_POKEMON["40 moves"][0])
+        cases["PokemonListDTO.from_model"] = lambda: PokemonListDTO.from_model(
+            list_item
+        )
+
+        ability = project_queryset(
+            models.PokemonAbility.objects.localized("en"), AbilityDTO.PROJECTED_FIELDS
+        ).get(id=FIXTURE_ABILITY_ID)
+        cases["AbilityDTO.from_model"] = lambda: AbilityDTO.from_model(ability)
+
+        transaction.set_rollback(True)
+    return cases
+
+
+def _parsed_fixtures() -> dict[str, Callable[[], Any]]:
+    """Parsing of decoded PokeAPI documents and dumps made while saving them."""
+    pokemon_document = pokemon_payload(*FIXTURE_POKEMON["150 moves"])
+    type_document = type_payload(FIXTURE_TYPE_ID)
+    ability_document = ability_payload(FIXTURE_ABILITY_ID)
+
+    pokemon_type = PokemonType(**type_document)
+    ability = Ability(**ability_document)
+    entries = [*ability.effect_entries, *ability.flavor_text_entries]
+
+    return {
+        # AsyncPokeAPIClient
+        "PokemonDTO parse (150 moves)": lambda: PokemonDTO(**pokemon_document),
+        "PokemonRecord.from_json (150 moves)": lambda: PokemonRecord.from_json(
+            pokemon_document
+        ),
+        "PokemonType parse": lambda: PokemonType(**type_document),
+        "Ability parse": lambda: Ability(**ability_document),
+        # ipc_operations
+        "damage_relations.model_dump": pokemon_type.damage_relations.model_dump,
+        "ability entries model_dump": lambda: [entry.model_dump() for entry in entries],
+    }
+
+
+def run(count: int = 1000, repeat: int = 3) -> list[BenchmarkResult]:
+    """Measure DTO conversions of fixture payloads (sizes don't depend on `count`).
+
+    Each case is called in a loop long enough to time it reliably (see
+    `timeit.Timer.autorange`), the fastest loop counts.
+
+    Args:
+        count: Not used, fixtures have fixed sizes
+        repeat: Number of timed loops per case
+
+    Returns:
+        One result per conversion
+    """
+    results = []
+    for case, func in {**_stored_fixtures(), **_parsed_fixtures()}.items():
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        duration = min(timer.repeat(repeat, number)) / number
+        blocks, peak = call_allocations(func)
+        results.append(
+            BenchmarkResult(
+                benchmark="dto",
+                case=case,
+                metrics={
+                    "ops/s": 1 / duration,
+                    "us/op": duration * 1e6,
+                    "allocs/call": blocks,
+                    "peak KB/call": peak / 1024,
+                },
+            )
+        )
+    return results
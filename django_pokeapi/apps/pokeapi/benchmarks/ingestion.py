@@ -0,0 +1,59 @@
+"""Memory and parsing time of fetched Pokemon kept alive during `populate_db`."""
+
+import json
+from typing import Any, Callable
+
+from django_pokeapi.apps.pokeapi.benchmarks.base import (
+    BenchmarkResult,
+    best_time,
+    retained_memory,
+)
+from django_pokeapi.apps.pokeapi.benchmarks.payloads import pokemon_payload
+from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
+from django_pokeapi.apps.pokeapi.ipc.records import PokemonRecord
+
+# How a decoded `pokemon/{id}/` document is kept until it is saved
+PARSERS: dict[str, Callable[[dict], Any]] = {
+    "pydantic": lambda data: PokemonDTO(**data),
+    "record": PokemonRecord.from_json,
+}
+
+
+def run(count: int = 1000, repeat: int = 3) -> list[BenchmarkResult]:
+    """Compare pydantic DTOs and lean records of fetched Pokemon.
+
+    Documents are decoded from JSON bytes (as the client does) and parsed, all
+    parsed Pokemon are kept alive like during a full load.
+
+    Args:
+        count: Number of Pokemon
+        repeat: Number of timed runs
+
+    Returns:
+        One result per parser
+    """
+    documents = [
+        json.dumps(pokemon_payload(pokemon_id)).encode()
+        for pokemon_id in range(1, count + 1)
+    ]
+
+    results = []
+    for case, parse in PARSERS.items():
+
+        def parse_all(parse: Callable[[dict], Any] = parse) -> list:
+            return [parse(json.loads(document)) for document in documents]
+
+        retained, peak = retained_memory(parse_all)
+        duration = best_time(parse_all, repeat)
+        results.append(
+            BenchmarkResult(
+                benchmark="ingestion",
+                case=case,
+                metrics={
+                    "retained KB/pokemon": retained / count / 1024,
+                    "peak MB": peak / 1024**2,
+                    "us/pokemon": duration / count * 1e6,
+                },
+            )
+        )
+    return results
@@ -0,0 +1,98 @@
+"""Cost of `/pokemon/all` reads of stored Pokemon."""
+
+from django.db import connection
+from django.db.models import Model
+from django.test import Client, override_settings
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.benchmarks.base import BenchmarkResult, best_time
+from django_pokeapi.apps.pokeapi.dto.api_dto import PokemonListDTO
+
+# Columns read by the list endpoint
+LIST_COLUMNS = tuple(
+    column
+    for field in PokemonListDTO.PROJECTED_FIELDS.values()
+    for column in field.columns
+)
+# What a list read carried before heavy JSON moved to `PokemonDetails`
+DETAILS_COLUMNS = tuple(
+    f"details__{field.name}"
+    for field in models.PokemonDetails._meta.concrete_fields
+    if not field.primary_key
+)
+
+
+def _table_kb(model: type[Model]) -> float:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_table_size(%s::regclass)", [model._meta.db_table])
+        return cursor.fetchone()[0] / 1024
+
+
+def run(count: int = 1000, repeat: int = 3) -> list[BenchmarkResult]:
+    """Measure list reads of stored Pokemon (run `populate_db` first).
+
+    Scans of the summary table (read by the endpoint), the `pokemon` table and
+    the `pokemon` table joined with details (the width of list reads before
+    the split) are measured, the endpoint without snapshot reads.
+
+    Args:
+        count: Page size (`limit`) of the list reads
+        repeat: Number of timed runs
+
+    Returns:
+        One result per case
+
+    Raises:
+        ValueError: If no Pokemon are stored
+    """
+    stored = models.Pokemon.objects.count()
+    if not stored:
+        raise ValueError("No Pokemon stored, run populate_db first")
+    rows = min(count, stored)
+
+    table_kb = {
+        "summary": _table_kb(models.PokemonSummary),
+        "pokemon": _table_kb(models.Pokemon),
+        "pokemon+details": _table_kb(models.Pokemon) + _table_kb(models.PokemonDetails),
+    }
+    queries = {
+        "summary": models.PokemonSummary.objects.order_by("pokemon_id").values_list(
+            *(field.attname for field in models.PokemonSummary._meta.concrete_fields)
+        ),
+        "pokemon": models.Pokemon.objects.order_by("id").values_list(*LIST_COLUMNS),
+        "pokemon+details": models.Pokemon.objects.order_by("id").values_list(
+            *LIST_COLUMNS, *DETAILS_COLUMNS
+        ),
+    }
+
+    results = []
+    for case, query in queries.items():
+        duration = best_time(lambda query=query: list(query[:rows]), repeat)
+        results.append(
+            BenchmarkResult(
+                benchmark="pokemon_list",
+                case=f"scan {case}",
+                metrics={
+                    "ms/request": duration * 1000,
+                    "us/pokemon": duration / rows * 1e6,
+                    "table KB/pokemon": table_kb[case] / stored,
+                },
+            )
+        )
+
+    client = Client()
+    with override_settings(SNAPSHOT_READS=False):
+        duration = best_time(
+            lambda: client.get(f"/api/v1/pokemon/all?limit={rows}"), repeat
+        )
+    results.append(
+        BenchmarkResult(
+            benchmark="pokemon_list",
+            case="GET /pokemon/all",
+            metrics={
+                "ms/request": duration * 1000,
+                "us/pokemon": duration / rows * 1e6,
+            },
+        )
+    )
+    return results
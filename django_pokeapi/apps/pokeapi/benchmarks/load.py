@@ -0,0 +1,256 @@
+"""Throughput and tail latency of API requests under concurrent load.
+
+The WSGI and ASGI applications of the project are served in-process (no HTTP
+server is a dependency) and driven by an asyncio load generator through httpx
+transports, so measurements cover the whole Django stack (middleware, views,
+database and rendering) but not socket handling.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import httpx
+from django.test import override_settings
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.benchmarks.base import BenchmarkResult
+from django_pokeapi.apps.pokeapi.benchmarks.payloads import (
+    ABILITY_COUNT,
+    TYPE_NAMES,
+    ability_payload,
+    pokemon_payload,
+    type_payload,
+)
+from django_pokeapi.apps.pokeapi.ipc import ipc_operations
+from django_pokeapi.apps.pokeapi.ipc.dto.abilities import Ability
+from django_pokeapi.apps.pokeapi.ipc.dto.types import PokemonType
+from django_pokeapi.apps.pokeapi.ipc.records import PokemonRecord
+
+API_URL = "http://localhost/api/v1"
+SERVERS = ("wsgi", "asgi")
+# Compared with a baseline: metric -> whether higher values are better
+CHECKED_METRICS = {"req/s": True, "p50 ms": False, "p95 ms": False}
+
+
+class _Names:
+    """Names of stored resources requests are built from."""
+
+    def __init__(self) -> None:
+        self.pokemon = list(
+            models.Pokemon.objects.order_by("id").values_list("name", flat=True)
+        )
+        self.types = list(models.PokemonType.objects.values_list("name", flat=True))
+        self.abilities = list(
+            models.PokemonAbility.objects.values_list("name", flat=True)
+        )
+        if len(self.pokemon) < 2 or not self.types or not self.abilities:
+            raise ValueError("Not enough data stored to build requests")
+
+
+# Endpoint -> (share of requests, path builder taking a random generator and
+# the stored names)
+RequestMix = dict[str, tuple[int, Callable[[random.Random, _Names], str]]]
+
+
+MIX: RequestMix = {
+    "/pokemon": (30, lambda rnd, names: f"/pokemon?name={rnd.choice(names.pokemon)}"),
+    "/pokemon/all": (
+        15,
+        lambda rnd, names: (
+            f"/pokemon/all?offset={rnd.randrange(len(names.pokemon))}&limit=100"
+        ),
+    ),
+    "/pokemon/compare": (
+        20,
+        lambda rnd, names: (
+            "/pokemon/compare?pokemon1_name={}&pokemon2_name={}".format(
+                *rnd.sample(names.pokemon, 2)
+            )
+        ),
+    ),
+    "/types": (5, lambda rnd, names: "/types"),
+    "/types/{type}": (10, lambda rnd, names: f"/types/{rnd.choice(names.types)}"),
+    "/abilities": (
+        5,
+        lambda rnd, names: f"/abilities?offset={rnd.randrange(0, 200, 20)}&limit=20",
+    ),
+    "/abilities/{ability}": (
+        15,
+        lambda rnd, names: f"/abilities/{rnd.choice(names.abilities)}",
+    ),
+}
+
+
+def seed_synthetic(count: int) -> None:
+    """Save synthetic types, abilities and `count` Pokemon to the database.
+
+    Args:
+        count: Number of Pokemon
+    """
+    ipc_operations.bulk_save_all_data(
+        [PokemonType(**type_payload(index)) for index in range(1, len(TYPE_NAMES) + 1)],
+        [Ability(**ability_payload(index)) for index in range(1, ABILITY_COUNT + 1)],
+        [
+            PokemonRecord.from_json(pokemon_payload(pokemon_id))
+            for pokemon_id in range(1, count + 1)
+        ],
+    )
+
+
+class _ThreadedWSGITransport(httpx.AsyncBaseTransport):
+    """Serve requests by a WSGI application on a thread pool (like a threaded server)."""
+
+    def __init__(self, app: Any, threads: int) -> None:
+        self._transport = httpx.WSGITransport(app=app)
+        self._executor = ThreadPoolExecutor(threads, thread_name_prefix="wsgi")
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        # Reading closes the WSGI response, which finishes the request
+        content = b"".join(response.iter_raw())
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=content
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._handle, request)
+
+    async def aclose(self) -> None:
+        self._executor.shutdown()
+
+
+def _transport(server: str, concurrency: int) -> httpx.AsyncBaseTransport:
+    # Imported late, creating the applications sets up Django
+    if server == "wsgi":
+        from django_pokeapi.wsgi import application as wsgi_application
+
+        return _ThreadedWSGITransport(wsgi_application, concurrency)
+
+    from django_pokeapi.asgi import application as asgi_application
+
+    return httpx.ASGITransport(app=asgi_application)
+
+
+async def _drive(
+    server: str, paths: list[tuple[str, str]], concurrency: int
+) -> tuple[dict[str, list[float]], int, float]:
+    """Send requests from `concurrency` clients, each waiting for its responses.
+
+    Returns:
+        (latencies in seconds by endpoint, number of failed requests,
+        duration in seconds)
+    """
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors = 0
+    pending = iter(paths)
+
+    async with httpx.AsyncClient(
+        transport=_transport(server, concurrency), base_url=API_URL, timeout=None
+    ) as client:
+        # Warm up caches built on first use (and connections)
+        for endpoint, path in dict(paths).items():
+            await client.get(path)
+
+        async def worker() -> None:
+            nonlocal errors
+            for endpoint, path in pending:
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies[endpoint].append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - start
+
+    return latencies, errors, duration
+
+
+def _metrics(latencies: list[float], duration: float) -> dict[str, float | None]:
+    # Percentiles need 2 samples at least, otherwise they are not available
+    # (shown as "-" and not compared with a baseline)
+    percentiles: list[float | None] = [None] * 99
+    if len(latencies) >= 2:
+        # 99 cut points, the n-th is the n-th percentile
+        percentiles = [
+            cut * 1000
+            for cut in statistics.quantiles(latencies, n=100, method="inclusive")
+        ]
+    return {
+        "requests": len(latencies),
+        "req/s": len(latencies) / duration if duration else 0.0,
+        "p50 ms": percentiles[49],
+        "p95 ms": percentiles[94],
+        "p99 ms": percentiles[98],
+    }
+
+
+def run(
+    requests: int = 2000,
+    concurrency: int = 16,
+    servers: tuple[str, ...] = SERVERS,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """Load the API with a mix of read requests of the stored data.
+
+    Every server gets the same request sequence (`MIX`, drawn from `seed`).
+    `DEBUG` is off, so queries are not recorded.
+
+    Args:
+        requests: Number of measured requests per server
+        concurrency: Number of concurrent clients (and WSGI threads)
+        servers: Served applications (`wsgi`, `asgi`)
+        seed: Seed of the request sequence
+
+    Returns:
+        Result of all requests and of each endpoint, per server
+
+    Raises:
+        ValueError: If not enough data is stored or a request fails
+    """
+    names = _Names()
+    rnd = random.Random(seed)
+    endpoints = list(MIX)
+    weights = [MIX[endpoint][0] for endpoint in endpoints]
+    paths = [
+        (endpoint, MIX[endpoint][1](rnd, names))
+        for endpoint in rnd.choices(endpoints, weights, k=requests)
+    ]
+
+    results = []
+    for server in servers:
+        with override_settings(DEBUG=False):
+            latencies, errors, duration = asyncio.run(
+                _drive(server, paths, concurrency)
+            )
+        if errors:
+            raise ValueError(f"{server}: {errors} of {requests} requests failed")
+
+        results.append(
+            BenchmarkResult(
+                benchmark="load",
+                case=f"{server} all",
+                metrics=_metrics(
+                    [latency for values in latencies.values() for latency in values],
+                    duration,
+                ),
+            )
+        )
+        results.extend(
+            BenchmarkResult(
+                benchmark="load",
+                case=f"{server} {endpoint}",
+                metrics=_metrics(latencies[endpoint], duration),
+            )
+            for endpoint in endpoints
+            if latencies[endpoint]
+        )
+    return results
@@ -0,0 +1,261 @@
+"""Synthetic PokeAPI documents shaped (and sized) like the real responses."""
+
+import random
+
+BASE_URL = "https://pokeapi.co/api/v2/"
+SPRITES_URL = (
+    "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/"
+)
+
+TYPE_NAMES = (
+    "normal",
+    "fighting",
+    "flying",
+    "poison",
+    "ground",
+    "rock",
+    "bug",
+    "ghost",
+    "steel",
+    "fire",
+    "water",
+    "grass",
+    "electric",
+    "psychic",
+    "ice",
+    "dragon",
+    "dark",
+    "fairy",
+)
+STAT_NAMES = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+VERSION_GROUPS = (
+    "red-blue",
+    "yellow",
+    "gold-silver",
+    "crystal",
+    "ruby-sapphire",
+    "emerald",
+    "firered-leafgreen",
+    "diamond-pearl",
+    "platinum",
+    "heartgold-soulsilver",
+    "black-white",
+    "black-2-white-2",
+    "x-y",
+    "omega-ruby-alpha-sapphire",
+    "sun-moon",
+    "ultra-sun-ultra-moon",
+    "sword-shield",
+    "scarlet-violet",
+)
+LEARN_METHODS = ("level-up", "machine", "egg", "tutor")
+LANGUAGES = (("en", 9), ("de", 6), ("fr", 5), ("es", 7), ("it", 8), ("ja", 1))
+
+MOVE_COUNT = 900
+ABILITY_COUNT = 300
+ITEM_COUNT = 2000
+
+
+def resource(kind: str, resource_id: int, name: str) -> dict[str, str]:
+    """Build a NamedAPIResource reference."""
+    return {"name": name, "url": f"{BASE_URL}{kind}/{resource_id}/"}
+
+
+def type_payload(type_id: int) -> dict:
+    """Build a `type/{id}/` document (damage relations derived from the ID).
+
+    Args:
+        type_id: Type ID (1-based index into `TYPE_NAMES`)
+
+    Returns:
+        Decoded JSON document
+    """
+    rnd = random.Random(type_id)
+    others = [index for index in range(1, len(TYPE_NAMES) + 1) if index != type_id]
+    relations = {
+        relation: [
+            resource("type", index, TYPE_NAMES[index - 1])
+            for index in rnd.sample(others, rnd.randint(0, 4))
+        ]
+        for relation in (
+            "no_damage_to",
+            "half_damage_to",
+            "double_damage_to",
+            "no_damage_from",
+            "half_damage_from",
+            "double_damage_from",
+        )
+    }
+    return {
+        "id": type_id,
+        "name": TYPE_NAMES[type_id - 1],
+        "damage_relations": relations,
+        "pokemon": [],
+        "moves": [],
+        "generation": resource("generation", 1, "generation-i"),
+        "move_damage_class": resource("move-damage-class", 2, "physical"),
+    }
+
+
+def ability_payload(ability_id: int) -> dict:
+    """Build an `ability/{id}/` document with texts in several languages.
+
+    Args:
+        ability_id: Ability ID
+
+    Returns:
+        Decoded JSON document
+    """
+    return {
+        "id": ability_id,
+        "name": f"ability-{ability_id}",
+        "is_main_series": True,
+        "generation": resource("generation", 3, "generation-iii"),
+        "effect_entries": [
+            {
+                "effect": f"Ability {ability_id} raises a stat when hit ({language}).",
+                "short_effect": "Raises a stat when hit.",
+                "language": resource("language", language_id, language),
+            }
+            for language, language_id in LANGUAGES[:2]
+        ],
+        "effect_changes": [],
+        "flavor_text_entries": [
+            {
+                "flavor_text": f"Ability {ability_id}\nin {version_group}.",
+                "language": resource("language", language_id, language),
+                "version_group": resource("version-group", group_id + 1, version_group),
+            }
+            for language, language_id in LANGUAGES
+            for group_id, version_group in enumerate(VERSION_GROUPS[4:], start=4)
+        ],
+        "pokemon": [],
+    }
+
+
+def _sprites(pokemon_id: int) -> dict:
+    front = f"{SPRITES_URL}{pokemon_id}.png"
+    variants = {
+        "front_default": front,
+        "front_shiny": f"{SPRITES_URL}shiny/{pokemon_id}.png",
+        "front_female": None,
+        "front_shiny_female": None,
+        "back_default": f"{SPRITES_URL}back/{pokemon_id}.png",
+        "back_shiny": f"{SPRITES_URL}back/shiny/{pokemon_id}.png",
+        "back_female": None,
+        "back_shiny_female": None,
+    }
+    return {
+        **variants,
+        "other": {
+            artwork: {"front_default": front, "front_shiny": front}
+            for artwork in ("dream_world", "home", "official-artwork", "showdown")
+        },
+        "versions": {
+            f"generation-{generation}": {
+                version_group: dict(variants)
+                for version_group in VERSION_GROUPS[generation - 1 : generation + 1]
+            }
+            for generation in range(1, 9)
+        },
+    }
+
+
+def pokemon_payload(pokemon_id: int, move_count: int | None = None) -> dict:
+    """Build a `pokemon/{id}/` document.
+
+    Moves carry learn details for several version groups and sprites carry the
+    nested "other" and "versions" trees, like the real (~300 KB) documents.
+
+    Args:
+        pokemon_id: Pokemon ID
+        move_count: Number of learnable moves (random 20-120 when not set)
+
+    Returns:
+        Decoded JSON document
+    """
+    rnd = random.Random(pokemon_id)
+    if move_count is None:
+        move_count = rnd.randint(20, 120)
+    type_ids = rnd.sample(range(1, len(TYPE_NAMES) + 1), rnd.choice((1, 2)))
+    ability_ids = rnd.sample(range(1, ABILITY_COUNT + 1), rnd.choice((1, 2, 3)))
+
+    return {
+        "id": pokemon_id,
+        "name": f"pokemon-{pokemon_id}",
+        "base_experience": rnd.randint(40, 340),
+        "height": rnd.randint(2, 100),
+        "is_default": True,
+        "order": pokemon_id,
+        "weight": rnd.randint(10, 5000),
+        "abilities": [
+            {
+                "is_hidden": slot == 3,
+                "slot": slot,
+                "ability": resource("ability", ability_id, f"ability-{ability_id}"),
+            }
+            for slot, ability_id in enumerate(ability_ids, start=1)
+        ],
+        "forms": [resource("pokemon-form", pokemon_id, f"pokemon-{pokemon_id}")],
+        "game_indices": [
+            {
+                "game_index": pokemon_id,
+                "version": resource("version", version_id, f"version-{version_id}"),
+            }
+            for version_id in range(1, 21)
+        ],
+        "held_items": [
+            {
+                "item": resource("item", item_id, f"item-{item_id}"),
+                "version_details": [
+                    {
+                        "rarity": rnd.choice((5, 50, 100)),
+                        "version": resource(
+                            "version", version_id, f"version-{version_id}"
+                        ),
+                    }
+                    for version_id in range(1, rnd.randint(2, 8))
+                ],
+            }
+            for item_id in rnd.sample(range(1, ITEM_COUNT + 1), rnd.randint(0, 2))
+        ],
+        "location_area_encounters": f"{BASE_URL}pokemon/{pokemon_id}/encounters",
+        "moves": [
+            {
+                "move": resource("move", move_id, f"move-{move_id}"),
+                "version_group_details": [
+                    {
+                        "level_learned_at": rnd.randint(0, 60),
+                        "move_learn_method": resource(
+                            "move-learn-method",
+                            method_id,
+                            LEARN_METHODS[method_id - 1],
+                        ),
+                        "version_group": resource(
+                            "version-group", group_id + 1, VERSION_GROUPS[group_id]
+                        ),
+                    }
+                    for method_id in (rnd.randint(1, len(LEARN_METHODS)),)
+                    for group_id in sorted(
+                        rnd.sample(range(len(VERSION_GROUPS)), rnd.randint(1, 10))
+                    )
+                ],
+            }
+            for move_id in sorted(rnd.sample(range(1, MOVE_COUNT + 1), move_count))
+        ],
+        "species": resource("pokemon-species", pokemon_id, f"pokemon-{pokemon_id}"),
+        "sprites": _sprites(pokemon_id),
+        "stats": [
+            {
+                "base_stat": rnd.randint(20, 160),
+                "effort": rnd.randint(0, 2),
+                "stat": resource("stat", stat_id, stat_name),
+            }
+            for stat_id, stat_name in enumerate(STAT_NAMES, start=1)
+        ],
+        "types": [
+            {"slot": slot, "type": resource("type", type_id, TYPE_NAMES[type_id - 1])}
+            for slot, type_id in enumerate(type_ids, start=1)
+        ],
+        "past_types": [],
+    }
@@ -0,0 +1,102 @@
+"""Response rendering cost per endpoint, with and without `TRUSTED_RESPONSES`."""
+
+from django.test import Client, override_settings
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.benchmarks.base import BenchmarkResult, best_time
+
+API_PREFIX = "/api/v1"
+
+
+def endpoints(count: int) -> dict[str, str]:
+    """Build request paths of the benchmarked endpoints from the stored data.
+
+    Args:
+        count: Page size (`limit`) of list endpoints
+
+    Returns:
+        Path by endpoint
+
+    Raises:
+        ValueError: If not enough Pokemon are stored
+    """
+    pokemon = list(
+        models.Pokemon.objects.order_by("id").values_list("name", flat=True)[:6]
+    )
+    if len(pokemon) < 2:
+        raise ValueError("Not enough Pokemon stored, run populate_db first")
+
+    type_name = (
+        models.PokemonType.objects.order_by("id").values_list("name", flat=True).first()
+    )
+    move_name = (
+        models.Move.objects.filter(pokemon_relations__isnull=False)
+        .order_by("id")
+        .values_list("name", flat=True)
+        .first()
+    )
+    team = "&".join(f"pokemon={name}" for name in pokemon)
+
+    paths = {
+        "/pokemon/search": f"/pokemon/search?types={type_name}&limit={count}",
+        "/pokemon/stats": f"/pokemon/stats?limit={count}",
+        "/pokemon/leaderboard": "/pokemon/leaderboard?k=100",
+        "/pokemon/compare": (
+            f"/pokemon/compare?pokemon1_name={pokemon[0]}&pokemon2_name={pokemon[1]}"
+        ),
+        "/pokemon/compare/batch": f"/pokemon/compare/batch?{team}",
+        "/pokemon/similar": f"/pokemon/similar?name={pokemon[0]}&k=100",
+        "/pokemon/moves/shared": (
+            f"/pokemon/moves/shared?pokemon1_name={pokemon[0]}"
+            f"&pokemon2_name={pokemon[1]}"
+        ),
+        "/types/{type}/effectiveness": (
+            f"/types/{type_name}/effectiveness?limit={count}"
+        ),
+        "/pokemon/damage": f"/pokemon/damage?name={pokemon[0]}&limit={count}",
+        "/pokemon/weaknesses": f"/pokemon/weaknesses?name={pokemon[0]}",
+        "/team/coverage": f"/team/coverage?{team}",
+        "/moves/{move}/pokemon": f"/moves/{move_name}/pokemon?limit={count}",
+        "/abilities/search": "/abilities/search?q=ability",
+        "/changes": "/changes?since=1970-01-01T00:00:00Z",
+    }
+    return {endpoint: API_PREFIX + path for endpoint, path in paths.items()}
+
+
+def run(count: int = 1000, repeat: int = 3) -> list[BenchmarkResult]:
+    """Compare schema validated and trusted responses of stored data.
+
+    Snapshot reads are off, so both variants run the same queries.
+
+    Args:
+        count: Page size (`limit`) of list endpoints
+        repeat: Number of timed runs
+
+    Returns:
+        One result per endpoint
+
+    Raises:
+        ValueError: If not enough Pokemon are stored
+    """
+    client = Client()
+    results = []
+    for endpoint, path in endpoints(count).items():
+        durations = {}
+        for trusted in (False, True):
+            with override_settings(SNAPSHOT_READS=False, TRUSTED_RESPONSES=trusted):
+                # Warm up caches built on first use (e.g. type and damage tables)
+                client.get(path)
+                durations[trusted] = best_time(lambda: client.get(path), repeat)
+
+        results.append(
+            BenchmarkResult(
+                benchmark="responses",
+                case=endpoint,
+                metrics={
+                    "validated ms": durations[False] * 1000,
+                    "trusted ms": durations[True] * 1000,
+                    "saved %": (1 - durations[True] / durations[False]) * 100,
+                },
+            )
+        )
+    return results
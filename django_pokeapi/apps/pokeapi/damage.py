@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.dataset import cached_per_version
+from django_pokeapi.apps.pokeapi.type_chart import TypeMatchups, get_type_matchups
+
+# Column of each stat in `DamageTables.stats`
+HP, ATTACK, DEFENSE, SPECIAL_ATTACK, SPECIAL_DEFENSE, SPEED = range(6)
+
+# Same-type attack bonus and the mean of the 0.85-1.0 random damage roll
+STAB_MULTIPLIER = 1.5
+MEAN_RANDOM_MULTIPLIER = 0.925
+
+# Individual values assumed for every stat (effort values are left out)
+IV = 31
+
+
+@dataclass(frozen=True)
+class DamageEstimates:
+    """Expected damage of every Pokemon (as attacker) against one defender.
+
+    All arrays are indexed by the rows of `TypeMatchups`.
+    """
+
+    damage: np.ndarray  # (pokemon,) float, expected damage of the best STAB hit
+    damage_percent: np.ndarray  # (pokemon,) float, damage relative to defender HP
+    multiplier: np.ndarray  # (pokemon,) float, type multiplier of the STAB type
+    stab_type: np.ndarray  # (pokemon,) int, STAB type index (neutral if none)
+    special: np.ndarray  # (pokemon,) bool, whether the special split is better
+    defender_hp: int
+
+
+@dataclass(frozen=True)
+class DamageTables:
+    """Type matchups with base stats of every Pokemon (in `matchups` row order)."""
+
+    matchups: TypeMatchups
+    stats: np.ndarray  # (pokemon, 6) float64, base stats in STAT_COLUMNS order
+
+    def estimate(self, defender: int, level: int, power: int) -> DamageEstimates:
+        """Estimate damage of every Pokemon hitting the defender with its best STAB type.
+
+        Uses the main series damage formula with stats computed for the level
+        (31 IVs, no EVs), the better of the physical and special split and the
+        mean random roll. Critical hits, items and abilities are ignored.
+
+        Args:
+            defender: Row of the defending Pokemon
+            level: Level of all Pokemon
+            power: Power of the move
+
+        Returns:
+            DamageEstimates instance
+        """
+        stats = np.floor((2 * self.stats + IV) * level / 100)
+        battle_stats = stats + 5
+        defender_hp = int(stats[defender, HP]) + level + 10
+
+        physical = battle_stats[:, ATTACK] / battle_stats[defender, DEFENSE]
+        special = (
+            battle_stats[:, SPECIAL_ATTACK] / battle_stats[defender, SPECIAL_DEFENSE]
+        )
+        ratio = np.maximum(physical, special)
+
+        # Multiplier of every type against the defender, 0 for the padding type
+        type_multipliers = np.append(
+            self.matchups.defending_multipliers(
+                np.arange(len(self.matchups.type_names)),
+                self.matchups.pokemon_types[[defender]],
+            )[:, 0],
+            0.0,
+        )
+        stab_multipliers = type_multipliers[self.matchups.pokemon_types]
+        best_slot = stab_multipliers.argmax(axis=1)
+        rows = np.arange(len(best_slot))
+        multiplier = stab_multipliers[rows, best_slot]
+
+        base_damage = (np.floor(2 * level / 5 + 2) * power * ratio) / 50 + 2
+        damage = base_damage * STAB_MULTIPLIER * MEAN_RANDOM_MULTIPLIER * multiplier
+
+        return DamageEstimates(
+            damage=damage,
+            damage_percent=damage * 100 / defender_hp,
+            multiplier=multiplier,
+            stab_type=self.matchups.pokemon_types[rows, best_slot],
+            special=special > physical,
+            defender_hp=defender_hp,
+        )
+
+
+def build_damage_tables(
+    matchups: TypeMatchups, base_stats: dict[int, tuple[int, ...]]
+) -> DamageTables:
+    """Align base stats with the rows of the type matchups.
+
+    Args:
+        matchups: Type matchups of the current dataset version
+        base_stats: Base stats (in `models.STAT_COLUMNS` order) by Pokemon ID
+
+    Returns:
+        DamageTables instance
+    """
+    missing = (0,) * len(models.STAT_COLUMNS)
+    stats = np.array(
+        [
+            base_stats.get(int(pokemon_id), missing)
+            for pokemon_id in matchups.pokemon_ids
+        ],
+        dtype=np.float64,
+    )
+    return DamageTables(
+        matchups=matchups,
+        stats=stats.reshape(len(matchups.pokemon_ids), len(models.STAT_COLUMNS)),
+    )
+
+
+@cached_per_version
+def get_damage_tables() -> DamageTables:
+    """Get damage calculation tables for the current dataset version."""
+    base_stats = {
+        pokemon_id: stats
+        for pokemon_id, *stats in models.Pokemon.objects.values_list(
+            "id", *models.STAT_COLUMNS.values()
+        )
+    }
+    return build_damage_tables(get_type_matchups(), base_stats)
@@ -0,0 +1,129 @@
+import contextlib
+import functools
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Iterator, TypeVar
+
+from redis.exceptions import RedisError
+
+from django_pokeapi.apps.common import redis, redis_key
+from django_pokeapi.apps.common.db_router import use_primary
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Names under `REDIS_KEY_PREFIX` (see `redis_key`)
+DATASET_VERSION_KEY = "dataset-version"
+DATASET_VERSION_CHANNEL = "dataset-version"
+# Ingestion runs writing change-tracked resources (run ID -> start time)
+INGESTIONS_KEY = "ingestions"
+# Seconds after which a run that never finished is considered crashed
+INGESTION_TIMEOUT = 6 * 3600
+
+
+def get_dataset_version() -> int | None:
+    """Get current dataset version published by the last `populate_db` run.
+
+    Returns:
+        Version (publish time in milliseconds), 0 if never published,
+        None if Redis is not reachable
+    """
+    try:
+        return int(redis.get(redis_key(DATASET_VERSION_KEY)) or 0)
+    except RedisError as error:
+        _log.warning("Unable to read dataset version: %s", error)
+        return None
+
+
+def publish_dataset_version() -> int:
+    """Mark the stored dataset as changed so version-scoped caches get rebuilt.
+
+    The version is also published on `DATASET_VERSION_CHANNEL` so workers
+    holding a dataset snapshot can reload it right away.
+
+    Returns:
+        New dataset version (publish time in milliseconds)
+    """
+    version = int(time.time() * 1000)
+    redis.set(redis_key(DATASET_VERSION_KEY), version)
+    redis.publish(redis_key(DATASET_VERSION_CHANNEL), version)
+    _log.info("Published dataset version %d", version)
+    return version
+
+
+@contextlib.contextmanager
+def ingestion() -> Iterator[None]:
+    """Mark writes of change-tracked resources inside the block as in progress.
+
+    Changes are stamped with their write time but become visible on commit,
+    so the changes feed only reports changes older than the start of any
+    running ingestion (of any host). Leave the block after the writes commit.
+    """
+    run = uuid.uuid4().hex
+    redis.zadd(redis_key(INGESTIONS_KEY), {run: time.time()})
+    try:
+        yield
+    finally:
+        redis.zrem(redis_key(INGESTIONS_KEY), run)
+
+
+def get_committed_until() -> datetime | None:
+    """Get time up to which all changes written by ingestion are committed.
+
+    Returns:
+        Start of the oldest running ingestion or the current time when none
+        runs, None if Redis is not reachable
+    """
+    now = time.time()
+    try:
+        redis.zremrangebyscore(
+            redis_key(INGESTIONS_KEY), "-inf", now - INGESTION_TIMEOUT
+        )
+        oldest = redis.zrange(redis_key(INGESTIONS_KEY), 0, 0, withscores=True)
+    except RedisError as error:
+        _log.warning("Unable to read running ingestions: %s", error)
+        return None
+
+    started = oldest[0][1] if oldest else now
+    return datetime.fromtimestamp(min(started, now), tz=timezone.utc)
+
+
+def cached_per_version(builder: Callable[[], T]) -> Callable[[], T]:
+    """Cache result of `builder` in-process until the dataset version changes.
+
+    When the version can't be read, the last built value is reused.
+
+    Args:
+        builder: Function building the value from the database
+
+    Returns:
+        Function returning the cached value
+    """
+    lock = threading.Lock()
+    cache: dict[str, tuple[int | None, T]] = {}
+
+    @functools.wraps(builder)
+    def wrapper() -> T:
+        version = get_dataset_version()
+        entry = cache.get("value")
+        if entry and (version is None or entry[0] == version):
+            return entry[1]
+
+        with lock:
+            # Another thread may have rebuilt it while we were waiting
+            entry = cache.get("value")
+            if entry and (version is None or entry[0] == version):
+                return entry[1]
+
+            # Kept for the whole version, must not come from a lagging replica
+            with use_primary():
+                value = builder()
+            cache["value"] = (version, value)
+            return value
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
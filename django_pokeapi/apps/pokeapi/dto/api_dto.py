@@ -1,8 +1,18 @@
-from typing import Optional
+from datetime import datetime
+from typing import ClassVar, Literal, Optional
 
-from ninja import Schema
+from ninja import Field, Schema
 
+from django_pokeapi.apps.common.profiling import BUILD, timed
 from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.dto.encoded import PreEncodedMixin
+from django_pokeapi.apps.pokeapi.dto.projection import (
+    ProjectedField,
+    build_projected,
+    column,
+)
+from django_pokeapi.apps.pokeapi.enums import PokemonStat, SearchMatch
+from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
 
 
 # Request schemas
@@ -11,13 +21,96 @@ class PokemonRequestDTO(Schema):
     id: int | None = None
 
 
+class PokemonSearchRequestDTO(Schema):
+    types: list[str] = []
+    abilities: list[str] = []
+    type_match: SearchMatch = SearchMatch.ALL
+    ability_match: SearchMatch = SearchMatch.ALL
+
+
+class PokemonStatFilterRequestDTO(PokemonSearchRequestDTO):
+    min_hp: int | None = None
+    max_hp: int | None = None
+    min_attack: int | None = None
+    max_attack: int | None = None
+    min_defense: int | None = None
+    max_defense: int | None = None
+    min_special_attack: int | None = None
+    max_special_attack: int | None = None
+    min_special_defense: int | None = None
+    max_special_defense: int | None = None
+    min_speed: int | None = None
+    max_speed: int | None = None
+    min_total: int | None = None
+    max_total: int | None = None
+    order_by: PokemonStat | None = None
+    descending: bool = True
+
+
+class PokemonLeaderboardRequestDTO(PokemonSearchRequestDTO):
+    stat: PokemonStat = PokemonStat.TOTAL
+    k: int = Field(10, ge=1, le=100)
+
+
+class PokemonSimilarRequestDTO(PokemonRequestDTO):
+    k: int = Field(10, ge=1, le=100)
+    # Add type and height/weight differences to the base stat distance
+    include_types: bool = False
+    include_size: bool = False
+    # Filters
+    same_type: bool = False
+    max_base_experience: Optional[int] = None
+
+
+class DamageRankingRequestDTO(PokemonRequestDTO):
+    level: int = Field(50, ge=1, le=100)
+    power: int = Field(80, ge=1, le=250)
+    limit: int = Field(100, ge=0)
+
+
+class PokemonBatchComparisonRequestDTO(Schema):
+    pokemon: list[str] = Field(..., min_length=2, max_length=50)
+
+
+class PokemonBatchRequestDTO(Schema):
+    pokemon: list[str] = Field(..., min_length=1, max_length=100)
+
+
+class AbilityLanguageRequestDTO(Schema):
+    # Letters, digits and dashes only, the language is part of a JSON path
+    lang: str = Field(models.DEFAULT_LANGUAGE, pattern=r"^[a-z0-9-]+$")
+    version_group: Optional[str] = Field(None, pattern=r"^[a-z0-9-]+$")
+
+    @property
+    def is_default(self) -> bool:
+        return self.lang == models.DEFAULT_LANGUAGE and self.version_group is None
+
+
+class AbilitySearchRequestDTO(Schema):
+    q: str = Field(..., min_length=1, max_length=200)
+    lang: str = "en"
+
+
+class TeamRequestDTO(Schema):
+    pokemon: list[str] = Field(..., min_length=1, max_length=6)
+
+
 class PokemonComparisonRequestDTO(Schema):
     pokemon1: PokemonRequestDTO
     pokemon2: PokemonRequestDTO
 
 
 # Response schemas
-class PokemonListDTO(Schema):
+class ChangesRequestDTO(Schema):
+    # ISO datetime or dataset version (publish time in milliseconds)
+    since: datetime
+    # Defaults to (and is capped at) the start of the oldest running ingestion
+    until: Optional[datetime] = None
+    offset: int = Field(0, ge=0)
+    limit: int = Field(1000, ge=1, le=10000)
+
+
+class PokemonListDTO(Schema, PreEncodedMixin):
     """Pokemon list item schema."""
 
     id: int
@@ -28,30 +121,63 @@ class PokemonListDTO(Schema):
     sprites: dict
     types: list[str]
 
+    PROJECTED_FIELDS: ClassVar[dict[str, ProjectedField]] = {
+        "id": column("id"),
+        "name": column("name"),
+        "height": column("height"),
+        "weight": column("weight"),
+        "base_experience": column("base_experience"),
+        "sprites": column("sprites"),
+        "types": ProjectedField(
+            build=lambda pokemon: pokemon.type_names, columns=("type_names",)
+        ),
+    }
+
     @classmethod
-    def from_model(cls, pokemon: models.Pokemon) -> "PokemonListDTO":
+    def from_model(
+        cls, pokemon: models.Pokemon, fields: frozenset[str] | None = None
+    ) -> "PokemonListDTO":
         """Create PokemonListDTO from Django model instance.
 
         Args:
-            pokemon: Pokemon model instance with prefetched relations
+            pokemon: Pokemon model instance (types are read from `type_names`)
+            fields: Fields to build (None for the complete DTO)
 
         Returns:
             PokemonListDTO instance
         """
-        # Extract types from type_relations
-        types = [
-            relation.pokemon_type.name for relation in pokemon.type_relations.all()
-        ]
-
-        return cls(
-            id=pokemon.id,
-            name=pokemon.name,
-            height=pokemon.height,
-            weight=pokemon.weight,
-            base_experience=pokemon.base_experience,
-            sprites=pokemon.sprites,
-            types=types,
-        )
+        return build_projected(cls, cls.PROJECTED_FIELDS, pokemon, fields)
+
+
+class PokemonStatsDTO(Schema):
+    """Pokemon base stats schema."""
+
+    id: int
+    name: str
+    types: list[str]
+    hp: int
+    attack: int
+    defense: int
+    special_attack: int
+    special_defense: int
+    speed: int
+    total: int
+
+    @classmethod
+    def from_model(cls, pokemon: models.Pokemon) -> "PokemonStatsDTO":
+        with timed(BUILD):
+            return cls(
+                id=pokemon.id,
+                name=pokemon.name,
+                types=pokemon.type_names,
+                hp=pokemon.hp,
+                attack=pokemon.attack,
+                defense=pokemon.defense,
+                special_attack=pokemon.special_attack,
+                special_defense=pokemon.special_defense,
+                speed=pokemon.speed,
+                total=pokemon.stat_total,
+            )
 
 
 class PokemonComparisonSummaryDTO(Schema):
@@ -66,7 +192,7 @@ class PokemonComparisonSummaryDTO(Schema):
     types: list[str]
 
 
-class TypeDTO(Schema):
+class TypeDTO(Schema, PreEncodedMixin):
     """Pokemon type schema."""
 
     id: int
@@ -77,16 +203,107 @@ class TypeDTO(Schema):
 
     @classmethod
     def from_model(cls, pokemon_type: models.PokemonType) -> "TypeDTO":
-        return cls(
-            id=pokemon_type.id,
-            name=pokemon_type.name,
-            damage_relations=pokemon_type.damage_relations,
-            generation_id=pokemon_type.generation_id,
-            move_damage_class=pokemon_type.move_damage_class,
-        )
+        with timed(BUILD):
+            return cls(
+                id=pokemon_type.id,
+                name=pokemon_type.name,
+                damage_relations=pokemon_type.damage_relations,
+                generation_id=pokemon_type.generation_id,
+                move_damage_class=pokemon_type.move_damage_class,
+            )
+
+
+class PokemonTypesDTO(Schema):
+    """Pokemon with its type names."""
+
+    id: int
+    name: str
+    types: list[str]
+
+
+class TypeEffectivenessDTO(PokemonTypesDTO):
+    """Damage multiplier of an attacking type against a Pokemon."""
+
+    multiplier: float
+
+
+class SimilarPokemonDTO(PokemonTypesDTO):
+    """Pokemon with its distance from the reference Pokemon."""
+
+    distance: float
+
+
+class DamageEstimateDTO(PokemonTypesDTO):
+    """Expected damage of an attacker hitting with its best STAB type."""
+
+    stab_type: Optional[str] = None
+    category: str
+    multiplier: float
+    damage: float
+    damage_percent: float
+
 
+class DamageRankingDTO(Schema):
+    """Attackers ranked by expected damage against a defender."""
 
-class AbilityDTO(Schema):
+    defender: PokemonTypesDTO
+    defender_hp: int
+    level: int
+    power: int
+    attackers: list[DamageEstimateDTO]
+
+
+class DefensiveProfileDTO(PokemonTypesDTO):
+    """Damage multipliers of every attacking type against a Pokemon."""
+
+    multipliers: dict[str, float]
+
+
+class TeamDefenseSummaryDTO(Schema):
+    """Number of team members weak, resistant and immune to an attacking type."""
+
+    weak: int
+    resistant: int
+    immune: int
+
+
+class TeamOffenseSummaryDTO(Schema):
+    """Number of Pokemon by the best multiplier the team's STAB types achieve."""
+
+    super_effective: int
+    neutral: int
+    not_very_effective: int
+    no_effect: int
+
+
+class TeamCoverageDTO(Schema):
+    """Team type weaknesses and offensive (STAB) coverage."""
+
+    members: list[PokemonTypesDTO]
+    # attacking type -> how the team takes it
+    defense: dict[str, TeamDefenseSummaryDTO]
+    # defending type -> best multiplier of the team's STAB types
+    offense: dict[str, float]
+    # best STAB multiplier against every Pokemon in the dataset
+    pokemon_coverage: TeamOffenseSummaryDTO
+
+
+class MoveDTO(Schema):
+    """Pokemon move schema."""
+
+    id: int
+    name: str
+
+
+class SharedMovesDTO(Schema):
+    """Moves learned by both of two Pokemon."""
+
+    pokemon1: str
+    pokemon2: str
+    moves: list[MoveDTO]
+
+
+class AbilityDTO(Schema, PreEncodedMixin):
     """Pokemon ability schema."""
 
     id: int
@@ -96,16 +313,45 @@ class AbilityDTO(Schema):
     effect_entries: list[dict]
     flavor_text_entries: list[dict]
 
+    PROJECTED_FIELDS: ClassVar[dict[str, ProjectedField]] = {
+        "id": column("id"),
+        "name": column("name"),
+        "is_main_series": column("is_main_series"),
+        "generation_id": column("generation_id"),
+        # Read from annotations of `PokemonAbilityQuerySet.localized()`
+        "effect_entries": ProjectedField(
+            build=lambda ability: ability.localized_effect_entries
+        ),
+        "flavor_text_entries": ProjectedField(
+            build=lambda ability: ability.localized_flavor_text_entries
+        ),
+    }
+
     @classmethod
-    def from_model(cls, ability: models.PokemonAbility) -> "AbilityDTO":
-        return cls(
-            id=ability.id,
-            name=ability.name,
-            is_main_series=ability.is_main_series,
-            generation_id=ability.generation_id,
-            effect_entries=ability.effect_entries,
-            flavor_text_entries=ability.flavor_text_entries,
-        )
+    def from_model(
+        cls, ability: models.PokemonAbility, fields: frozenset[str] | None = None
+    ) -> "AbilityDTO":
+        """Create AbilityDTO from Django model instance.
+
+        Args:
+            ability: Ability loaded with `project_queryset` and `localized()`
+            fields: Fields to build (None for the complete DTO)
+
+        Returns:
+            AbilityDTO instance
+        """
+        return build_projected(cls, cls.PROJECTED_FIELDS, ability, fields)
+
+
+class AbilitySearchResultDTO(Schema):
+    """Ability matching a full-text search."""
+
+    id: int
+    name: str
+    language: str
+    rank: float
+    # Matching part of the effect/flavor text with the terms wrapped in <b></b>
+    headline: str
 
 
 class PokemonComparisonDTO(Schema):
@@ -114,3 +360,41 @@ class PokemonComparisonDTO(Schema):
     pokemon1: PokemonComparisonSummaryDTO
     pokemon2: PokemonComparisonSummaryDTO
     stat_differences: dict
+
+
+class PokemonBatchComparisonDTO(Schema):
+    """Pairwise comparison of multiple Pokemon."""
+
+    pokemon: list[PokemonComparisonSummaryDTO]
+    # stat name -> matrix where [i][j] is pokemon i minus pokemon j
+    stat_differences: dict[str, list[list[int]]]
+
+
+class PokemonBatchItemDTO(Schema):
+    """Result of one Pokemon requested in a batch lookup."""
+
+    # Requested ID or name
+    query: str
+    found: bool
+    pokemon: Optional[PokemonDTO] = None
+
+
+class ChangeDTO(Schema):
+    """Resource created, updated or deleted by ingestion."""
+
+    kind: Literal["pokemon", "ability", "type"]
+    id: int
+    name: str
+    action: Literal["created", "updated", "deleted"]
+    changed: datetime
+
+
+class ChangesDTO(Schema):
+    """Changes of a time window, ordered by change time."""
+
+    since: datetime
+    # Pass as `since` of the next poll
+    until: datetime
+    # Number of changes in the window (not only on this page)
+    count: int
+    changes: list[ChangeDTO]
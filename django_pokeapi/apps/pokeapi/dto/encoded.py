@@ -0,0 +1,83 @@
+import functools
+from typing import Any, Iterable
+
+import orjson
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+
+from django_pokeapi.apps.common.compression import EncodedPayload
+from django_pokeapi.apps.common.profiling import RENDER, timed
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def dump_json(data: BaseModel | list[BaseModel], **options: Any) -> bytes:
+    """Serialize DTO(s) straight to JSON bytes with their pydantic serializer.
+
+    Unlike `orjson.dumps(data.model_dump())` there is no intermediate dict and
+    integers of any size are supported.
+
+    Args:
+        data: DTO or list of DTOs of the same class
+        **options: Options of `TypeAdapter.dump_json` (e.g. `exclude_unset`)
+
+    Returns:
+        JSON bytes
+    """
+    with timed(RENDER):
+        if isinstance(data, list):
+            if not data:
+                return b"[]"
+            return _adapter(list[type(data[0])]).dump_json(data, **options)
+
+        return _adapter(type(data)).dump_json(data, **options)
+
+
+class PreEncodedMixin(BaseModel):
+    """DTO which can carry its own pre-encoded JSON.
+
+    Set for long-lived DTOs (e.g. the dataset snapshot), so responses can reuse
+    the bytes (and their compressed variants) instead of validating and
+    serializing the DTO on every request.
+    """
+
+    _encoded: EncodedPayload | None = PrivateAttr(default=None)
+
+    def encode(self) -> "PreEncodedMixin":
+        """Attach pre-encoded JSON of the DTO.
+
+        Returns:
+            The DTO itself
+        """
+        self._encoded = EncodedPayload(dump_json(self))
+        return self
+
+
+class PreEncodedList(list):
+    """List of pre-encoded DTOs carrying the pre-encoded JSON array."""
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, items: Iterable[PreEncodedMixin]) -> None:
+        super().__init__(items)
+        with timed(RENDER):
+            # pylint: disable=protected-access
+            self._encoded = EncodedPayload(
+                b"[" + b",".join(item._encoded.content for item in self) + b"]"
+            )
+
+
+class EncodedRows(list):
+    """JSON rows (plain dicts) read from the database with their JSON array.
+
+    Lets list endpoints skip building and validating DTOs of trusted rows.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, rows: Iterable[dict]) -> None:
+        super().__init__(rows)
+        with timed(RENDER):
+            self._encoded = EncodedPayload(orjson.dumps(self))
@@ -0,0 +1,154 @@
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, TypeVar
+
+from django.db.models import Prefetch, QuerySet
+from pydantic import BaseModel
+
+from django_pokeapi.apps.common.profiling import BUILD, timed
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class ProjectedField:
+    """How a response field is built from a model instance.
+
+    Attributes:
+        build: Function converting the model instance to the field value
+        columns: Model columns the field is read from
+        prefetch: Prefetch lookups (or `Prefetch` objects) the field is read from
+    """
+
+    build: Callable[[Any], Any]
+    columns: tuple[str, ...] = ()
+    prefetch: tuple[str | Prefetch, ...] = ()
+
+
+def column(name: str) -> ProjectedField:
+    """Response field copied as-is from the model column of the given name."""
+    return ProjectedField(build=operator.attrgetter(name), columns=(name,))
+
+
+def parse_fields(
+    projected_fields: Mapping[str, ProjectedField],
+    fields: str | None,
+    exclude: str | None,
+) -> frozenset[str] | None:
+    """Parse comma separated `fields`/`exclude` query parameters.
+
+    Args:
+        projected_fields: Projectable fields of the response schema
+        fields: Fields to include
+        exclude: Fields to leave out
+
+    Returns:
+        Requested field names, None when the full response is requested
+
+    Raises:
+        ValueError: If both parameters are given or a field is unknown
+    """
+    if fields and exclude:
+        raise ValueError("Only one of fields and exclude can be provided")
+
+    if not fields and not exclude:
+        return None
+
+    names = {name.strip() for name in (fields or exclude or "").split(",")}
+    names.discard("")
+    if unknown := names - projected_fields.keys():
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    if fields:
+        return frozenset(names)
+
+    return frozenset(projected_fields.keys() - names)
+
+
+def project_queryset(
+    query: QuerySet,
+    projected_fields: Mapping[str, ProjectedField],
+    fields: frozenset[str] | None = None,
+) -> QuerySet:
+    """Load only the columns and relations needed by the requested fields.
+
+    Args:
+        query: Queryset to restrict
+        projected_fields: Projectable fields of the response schema
+        fields: Requested field names (None for all of them)
+
+    Returns:
+        Queryset with `only()`, `select_related()` and `prefetch_related()`
+        applied (columns of one-to-one relations are given as `relation__column`)
+    """
+    selected = [
+        projected_fields[name]
+        for name in (projected_fields if fields is None else fields)
+    ]
+    columns = {column for field in selected for column in field.columns}
+    prefetch = dict.fromkeys(lookup for field in selected for lookup in field.prefetch)
+
+    related = dict.fromkeys(
+        column.split("__", 1)[0] for column in columns if "__" in column
+    )
+
+    return (
+        query.only(query.model._meta.pk.name, *columns)
+        .select_related(*related)
+        .prefetch_related(*prefetch)
+    )
+
+
+def build_projected(
+    dto_class: type[T],
+    projected_fields: Mapping[str, ProjectedField],
+    instance: Any,
+    fields: frozenset[str] | None = None,
+) -> T:
+    """Build DTO from model instance evaluating only the requested fields.
+
+    Full DTOs are validated as usual. Projected ones are constructed without
+    validation (values come from our own database) and have only the requested
+    fields set, so they should be serialized with `exclude_unset=True`.
+
+    Args:
+        dto_class: DTO class to build
+        projected_fields: Projectable fields of the DTO
+        instance: Model instance loaded by `project_queryset`
+        fields: Requested field names (None for all of them)
+
+    Returns:
+        DTO instance
+    """
+    with timed(BUILD):
+        if fields is None:
+            return dto_class(
+                **{
+                    name: field.build(instance)
+                    for name, field in projected_fields.items()
+                }
+            )
+
+        return dto_class.model_construct(
+            _fields_set=set(fields),
+            **{name: projected_fields[name].build(instance) for name in fields},
+        )
+
+
+def project_dto(dto: T, fields: frozenset[str] | None = None) -> T:
+    """Restrict an already built DTO to the requested fields.
+
+    Args:
+        dto: Complete DTO
+        fields: Requested field names (None for all of them)
+
+    Returns:
+        The DTO itself or its partial copy with only the requested fields set
+    """
+    if fields is None:
+        return dto
+
+    with timed(BUILD):
+        return type(dto).model_construct(
+            _fields_set=set(fields), **{name: getattr(dto, name) for name in fields}
+        )
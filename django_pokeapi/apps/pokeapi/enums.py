@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class SearchMatch(models.TextChoices):
+    """How multiple search criteria of the same kind are combined."""
+
+    ALL = "all"  # Pokemon must have every given name (AND)
+    ANY = "any"  # Pokemon must have at least one given name (OR)
+
+
+class PokemonStat(models.TextChoices):
+    """Base stat names as used by PokeAPI, plus the sum of all of them."""
+
+    HP = "hp"
+    ATTACK = "attack"
+    DEFENSE = "defense"
+    SPECIAL_ATTACK = "special-attack"
+    SPECIAL_DEFENSE = "special-defense"
+    SPEED = "speed"
+    TOTAL = "total"
+
+    @property
+    def column(self) -> str:
+        """Name of the typed Pokemon column holding this stat."""
+        if self == PokemonStat.TOTAL:
+            return "stat_total"
+        return self.value.replace("-", "_")
@@ -1,12 +1,13 @@
 import asyncio
 import logging
-from typing import Awaitable, Callable, TypeVar, Union
+from typing import Any, Awaitable, Callable, TypeVar, Union
 
 import httpx
 
 from .dto.abilities import Ability, AbilityListResponse
 from .dto.pokemon import PokemonDTO, PokemonListResponseDTO
 from .dto.types import PokemonType, TypeListResponse
+from .records import PokemonRecord
 
 LIMIT = 100000
 OFFSET = 0
@@ -50,24 +51,49 @@ class AsyncPokeAPIClient:
         response.raise_for_status()
         return response.json()
 
+    async def get_resource(self, url: str) -> Any:
+        """Get any PokeAPI resource by its (absolute or relative) URL asynchronously.
+
+        Args:
+            url: Resource URL as referenced by other resources
+
+        Returns:
+            JSON response data
+        """
+        if url.startswith(self.base_url):
+            url = url[len(self.base_url) :]
+        return await self._make_request(url)
+
     async def _make_batch_requests(
         self,
-        ids: list[int],
+        ids: list[int] | list[str],
         request_func: Callable[[int], Awaitable[T]],
         chunk_size: int = 30,
         chunk_delay: float = 0.1,
+        missing_ok: bool = False,
     ) -> list[T]:
         """Make batch requests with chunking to avoid overwhelming the server.
 
         Args:
-            ids: List of IDs to fetch
+            ids: List of IDs (or names) to fetch
             request_func: Async function that takes ID and returns the resource
             chunk_size: Number of requests per chunk
             chunk_delay: Delay between chunks in seconds
+            missing_ok: Skip resources that do not exist (404) instead of failing
 
         Returns:
             List of fetched resources
         """
+
+        async def request(item_id: int) -> T | None:
+            try:
+                return await request_func(item_id)
+            except httpx.HTTPStatusError as error:
+                if not missing_ok or error.response.status_code != 404:
+                    raise
+                _log.warning("Resource %s does not exist, skipping", item_id)
+                return None
+
         all_results = []
 
         for i in range(0, len(ids), chunk_size):
@@ -77,9 +103,9 @@ class AsyncPokeAPIClient:
 
             _log.info("Fetching chunk %d/%d", chunk_num, total_chunks)
 
-            tasks = [request_func(item_id) for item_id in chunk]
+            tasks = [request(item_id) for item_id in chunk]
             chunk_results = await asyncio.gather(*tasks, return_exceptions=False)
-            all_results.extend(chunk_results)
+            all_results.extend(result for result in chunk_results if result is not None)
 
             if i + chunk_size < len(ids):
                 await asyncio.sleep(chunk_delay)
@@ -99,6 +125,18 @@ class AsyncPokeAPIClient:
         data = await self._make_request(f"pokemon/{pokemon_id}/")
         return PokemonDTO(**data)
 
+    async def get_pokemon_record(self, pokemon_id: Union[int, str]) -> PokemonRecord:
+        """Get Pokemon by ID or name asynchronously as a lean ingestion record.
+
+        Args:
+            pokemon_id: Pokemon ID or name
+
+        Returns:
+            Pokemon record
+        """
+        data = await self._make_request(f"pokemon/{pokemon_id}/")
+        return PokemonRecord.from_json(data)
+
     async def get_all_pokemon(
         self, limit: int = LIMIT, offset: int = OFFSET
     ) -> PokemonListResponseDTO:
@@ -128,6 +166,22 @@ class AsyncPokeAPIClient:
             self.get_pokemon,
         )
 
+    async def get_multiple_pokemon_records(
+        self, pokemon_ids: list[int] | list[str], missing_ok: bool = False
+    ) -> list[PokemonRecord]:
+        """Get multiple Pokemon concurrently by their IDs as lean ingestion records.
+
+        Args:
+            pokemon_ids: List of Pokemon IDs (or names) to fetch
+            missing_ok: Skip Pokemon that do not exist instead of failing
+
+        Returns:
+            List of Pokemon records
+        """
+        return await self._make_batch_requests(
+            pokemon_ids, self.get_pokemon_record, missing_ok=missing_ok
+        )
+
     # Type endpoints
     async def get_type_by_id(self, type_id: Union[int, str]) -> PokemonType:
         """Get Type by ID or name asynchronously.
@@ -156,16 +210,21 @@ class AsyncPokeAPIClient:
         data = await self._make_request(f"type/?limit={limit}&offset={offset}")
         return TypeListResponse(**data)
 
-    async def get_multiple_types(self, type_ids: list[int]) -> list[PokemonType]:
+    async def get_multiple_types(
+        self, type_ids: list[int] | list[str], missing_ok: bool = False
+    ) -> list[PokemonType]:
         """Get multiple Types concurrently by their IDs.
 
         Args:
-            type_ids: List of Type IDs to fetch
+            type_ids: List of Type IDs (or names) to fetch
+            missing_ok: Skip Types that do not exist instead of failing
 
         Returns:
             List of Type data
         """
-        return await self._make_batch_requests(type_ids, self.get_type_by_id)
+        return await self._make_batch_requests(
+            type_ids, self.get_type_by_id, missing_ok=missing_ok
+        )
 
     # Ability endpoints
     async def get_ability(self, ability_id: Union[int, str]) -> Ability:
@@ -195,13 +254,18 @@ class AsyncPokeAPIClient:
         data = await self._make_request(f"ability/?limit={limit}&offset={offset}")
         return AbilityListResponse(**data)
 
-    async def get_multiple_abilities(self, ability_ids: list[int]) -> list[Ability]:
+    async def get_multiple_abilities(
+        self, ability_ids: list[int] | list[str], missing_ok: bool = False
+    ) -> list[Ability]:
         """Get multiple Abilities concurrently by their IDs.
 
         Args:
-            ability_ids: List of Ability IDs to fetch
+            ability_ids: List of Ability IDs (or names) to fetch
+            missing_ok: Skip Abilities that do not exist instead of failing
 
         Returns:
             List of Ability data
         """
-        return await self._make_batch_requests(ability_ids, self.get_ability)
+        return await self._make_batch_requests(
+            ability_ids, self.get_ability, missing_ok=missing_ok
+        )
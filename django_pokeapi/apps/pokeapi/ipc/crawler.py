@@ -0,0 +1,316 @@
+import asyncio
+import graphlib
+import itertools
+import logging
+import re
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+from urllib.parse import urlsplit
+
+from . import ipc_operations
+from .async_pokeapi_client import LIMIT, OFFSET, AsyncPokeAPIClient
+from .dto.abilities import Ability
+from .dto.types import PokemonType
+from .records import PokemonRecord
+
+_log = logging.getLogger(__name__)
+
+# Resource URL path, e.g. "/api/v2/pokemon/1/" or "/api/v2/pokemon/1/encounters"
+_RESOURCE_PATH = re.compile(
+    r"/api/v2/(?P<kind>[a-z0-9-]+)/(?P<id>\d+)/?(?:(?P<sub>[a-z0-9-]+)/?)?$"
+)
+
+# Concurrent requests shared by all resource kinds of one crawl
+CONCURRENCY = 30
+
+# Fetched documents (parsed) by kind and resource ID
+CrawlResult = dict[str, dict[int, Any]]
+
+
+def _raw(document: Any) -> Any:
+    return document
+
+
+@dataclass(frozen=True)
+class ResourceKind:
+    """How to fetch, parse and save one kind of PokeAPI resource."""
+
+    # Kind name, a sub-resource is named "<kind>/<sub>" (e.g. "pokemon/encounters")
+    name: str
+    # Builds the saved object from the JSON document
+    parse: Callable[[Any], Any] = _raw
+    # Saves parsed documents by resource ID (None to only follow their links)
+    save: Callable[[dict[int, Any]], None] | None = None
+    # Kinds that have to be saved first (e.g. relations target)
+    depends_on: tuple[str, ...] = ()
+    # Whether the kind has a list endpoint usable as a crawl seed
+    listable: bool = True
+
+
+class ResourceRegistry:
+    """Resource kinds the crawler fetches, other referenced URLs are ignored."""
+
+    def __init__(self, kinds: Iterable[ResourceKind]) -> None:
+        """Initialize registry.
+
+        Args:
+            kinds: Registered resource kinds
+
+        Raises:
+            graphlib.CycleError: If kind dependencies contain a cycle
+        """
+        self.kinds = {kind.name: kind for kind in kinds}
+
+        # Dependencies first, used both as the fetch priority and the save order
+        sorter = graphlib.TopologicalSorter(
+            {
+                kind.name: [name for name in kind.depends_on if name in self.kinds]
+                for kind in self.kinds.values()
+            }
+        )
+        self.order = tuple(sorter.static_order())
+        self.ranks = {name: rank for rank, name in enumerate(self.order)}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.kinds
+
+    def __getitem__(self, name: str) -> ResourceKind:
+        return self.kinds[name]
+
+    @staticmethod
+    def resolve(url: str) -> tuple[str, int] | None:
+        """Get kind name and resource ID of a resource URL.
+
+        Args:
+            url: Absolute or relative resource URL
+
+        Returns:
+            (kind, resource ID), None when the URL is not a resource URL
+        """
+        match = _RESOURCE_PATH.search(urlsplit(url).path)
+        if match is None:
+            return None
+        kind = (
+            match["kind"] if match["sub"] is None else f"{match['kind']}/{match['sub']}"
+        )
+        return kind, int(match["id"])
+
+
+def _urls(document: Any) -> Iterator[str]:
+    """Yield every resource-like URL string nested in a JSON document."""
+    stack = [document]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and "/api/v2/" in value:
+            yield value
+
+
+class ResourceCrawler:
+    """Fetches seed lists and follows references between registered resources.
+
+    Every resource is fetched once (deduplicated by kind and ID). Queued fetches
+    are ordered by the dependency rank of their kind and share one concurrency
+    limit, so dependencies are fetched first without per-kind phases.
+    """
+
+    def __init__(
+        self,
+        client: AsyncPokeAPIClient,
+        registry: ResourceRegistry,
+        concurrency: int = CONCURRENCY,
+        ignore_errors: bool = False,
+    ) -> None:
+        """Initialize crawler.
+
+        Args:
+            client: Async PokeAPI client instance
+            registry: Resource kinds to fetch
+            concurrency: Maximum number of concurrent requests
+            ignore_errors: Skip resources that fail to fetch instead of failing
+        """
+        self.client = client
+        self.registry = registry
+        self.concurrency = concurrency
+        self.ignore_errors = ignore_errors
+        # Endpoints skipped because of ignored errors
+        self.failed: list[str] = []
+
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._seen: set[tuple[str, int]] = set()
+        self._follow: set[str] = set()
+        self._result: CrawlResult = {}
+        self._error: Exception | None = None
+
+    async def crawl(
+        self,
+        seeds: Iterable[str],
+        urls: Iterable[str] = (),
+        follow: Iterable[str] | None = None,
+    ) -> CrawlResult:
+        """Crawl resources reachable from the seeds.
+
+        Args:
+            seeds: Kinds whose whole list endpoint is crawled
+            urls: Additional resource URLs to start from
+            follow: Kinds whose references are followed (None for all registered)
+
+        Returns:
+            Parsed documents by kind and resource ID
+
+        Raises:
+            httpx.HTTPError: If a request fails (unless errors are ignored)
+        """
+        self._follow = set(self.registry.kinds if follow is None else follow)
+        self._result = {}
+
+        for url in urls:
+            self._enqueue(url, seed=True)
+
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        try:
+            for kind in seeds:
+                if self.registry[kind].listable:
+                    endpoint = f"{kind}/?limit={LIMIT}&offset={OFFSET}"
+                    self._queue.put_nowait(
+                        (-1, next(self._sequence), kind, None, endpoint)
+                    )
+            await self._queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self._error is not None:
+            raise self._error
+
+        _log.info(
+            "Crawled %s",
+            ", ".join(
+                f"{len(documents)} {kind}" for kind, documents in self._result.items()
+            ),
+        )
+        return self._result
+
+    def _enqueue(self, url: str, seed: bool = False) -> None:
+        resolved = self.registry.resolve(url)
+        if resolved is None or resolved in self._seen:
+            return
+        kind, resource_id = resolved
+        if kind not in self.registry or (not seed and kind not in self._follow):
+            return
+
+        # Canonical endpoint, references may be absolute or relative URLs
+        base, _, sub = kind.partition("/")
+        endpoint = f"{base}/{resource_id}/{sub}"
+
+        self._seen.add(resolved)
+        self._queue.put_nowait(
+            (
+                self.registry.ranks[kind],
+                next(self._sequence),
+                kind,
+                resource_id,
+                endpoint,
+            )
+        )
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, kind, resource_id, endpoint = await self._queue.get()
+            try:
+                # After a failure the queue is only drained
+                if self._error is None:
+                    await self._fetch(kind, resource_id, endpoint)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                if not self.ignore_errors:
+                    self._error = error
+                else:
+                    _log.warning("Failed to crawl %s: %s", endpoint, error)
+                    self.failed.append(endpoint)
+            finally:
+                self._queue.task_done()
+
+    async def _fetch(self, kind: str, resource_id: int | None, endpoint: str) -> None:
+        document = await self.client.get_resource(endpoint)
+
+        if resource_id is None:
+            # Seed list, its results are resources of the seed kind
+            for reference in document["results"]:
+                self._enqueue(reference["url"], seed=True)
+            return
+
+        self._result.setdefault(kind, {})[resource_id] = self.registry[kind].parse(
+            document
+        )
+        for url in _urls(document):
+            self._enqueue(url)
+
+
+def save_crawled(registry: ResourceRegistry, result: CrawlResult) -> None:
+    """Save crawled documents kind by kind, dependencies first.
+
+    Args:
+        registry: Registry the documents were crawled with
+        result: Parsed documents by kind and resource ID
+    """
+    for name in registry.order:
+        documents = result.get(name)
+        save = registry[name].save
+        if documents and save is not None:
+            _log.info("Saving %d crawled %s resources...", len(documents), name)
+            save(documents)
+
+
+def _save_values(save: Callable[[list[Any]], None], documents: dict[int, Any]) -> None:
+    save(list(documents.values()))
+
+
+def _raw_kind(name: str, listable: bool = True) -> ResourceKind:
+    return ResourceKind(
+        name=name,
+        save=partial(ipc_operations.bulk_save_crawled_resources, name),
+        listable=listable,
+    )
+
+
+def default_registry() -> ResourceRegistry:
+    """Registry of the modelled resources and raw documents of referenced ones.
+
+    Returns:
+        ResourceRegistry instance
+    """
+    return ResourceRegistry(
+        [
+            ResourceKind(
+                name="type",
+                parse=lambda document: PokemonType(**document),
+                save=partial(_save_values, ipc_operations.bulk_save_types),
+            ),
+            ResourceKind(
+                name="ability",
+                parse=lambda document: Ability(**document),
+                save=partial(_save_values, ipc_operations.bulk_save_abilities),
+            ),
+            ResourceKind(
+                name="pokemon",
+                parse=PokemonRecord.from_json,
+                save=partial(
+                    _save_values, ipc_operations.bulk_save_pokemon_with_relations
+                ),
+                depends_on=("type", "ability"),
+            ),
+            _raw_kind("pokemon-species"),
+            _raw_kind("pokemon-form"),
+            _raw_kind("move"),
+            _raw_kind("item"),
+            _raw_kind("generation"),
+            # Encounters are only referenced by Pokemon, there is no list endpoint
+            _raw_kind("pokemon/encounters", listable=False),
+        ]
+    )
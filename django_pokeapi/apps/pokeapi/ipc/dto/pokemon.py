@@ -1,8 +1,15 @@
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
+from django.db.models import Prefetch
 from pydantic import BaseModel
 
 from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.dto.encoded import PreEncodedMixin
+from django_pokeapi.apps.pokeapi.dto.projection import (
+    ProjectedField,
+    build_projected,
+    column,
+)
 
 
 class NamedAPIResource(BaseModel):
@@ -67,7 +74,123 @@ class PokemonHeldItemDTO(BaseModel):
     version_details: list[Dict[str, Any]]
 
 
-class PokemonDTO(BaseModel):
+def _abilities_from_model(pokemon: "models.Pokemon") -> list[PokemonAbilityDTO]:
+    # `.all()` reuses the prefetched (slot ordered) relations, `.order_by()` would not
+    return [
+        PokemonAbilityDTO(
+            is_hidden=relation.is_hidden,
+            slot=relation.slot,
+            ability=NamedAPIResource(
+                name=relation.ability.name,
+                url=f"/api/v2/ability/{relation.ability.id}/",
+            ),
+        )
+        for relation in pokemon.ability_relations.all()
+    ]
+
+
+def _forms_from_model(pokemon: "models.Pokemon") -> list[NamedAPIResource]:
+    return [
+        NamedAPIResource(name=form.get("name", ""), url=form.get("url", ""))
+        for form in pokemon.details.forms
+    ]
+
+
+def _held_items_from_model(pokemon: "models.Pokemon") -> list[PokemonHeldItemDTO]:
+    return [
+        PokemonHeldItemDTO(
+            item=NamedAPIResource(
+                name=item.get("item", {}).get("name", ""),
+                url=item.get("item", {}).get("url", ""),
+            ),
+            version_details=item.get("version_details", []),
+        )
+        for item in pokemon.details.held_items
+    ]
+
+
+def _moves_from_model(pokemon: "models.Pokemon") -> list[PokemonMoveDTO]:
+    return [
+        PokemonMoveDTO(
+            move=NamedAPIResource(
+                name=relation.move.name,
+                url=f"/api/v2/move/{relation.move.id}/",
+            )
+        )
+        for relation in pokemon.move_relations.all()
+    ]
+
+
+def _species_from_model(pokemon: "models.Pokemon") -> NamedAPIResource:
+    return NamedAPIResource(
+        name=pokemon.details.species_data.get("name", ""),
+        url=pokemon.details.species_data.get("url", ""),
+    )
+
+
+def _sprites_from_model(pokemon: "models.Pokemon") -> PokemonSpritesDTO:
+    sprites_data = pokemon.sprites
+    return PokemonSpritesDTO(
+        front_default=sprites_data.get("front_default"),
+        front_shiny=sprites_data.get("front_shiny"),
+        front_female=sprites_data.get("front_female"),
+        front_shiny_female=sprites_data.get("front_shiny_female"),
+        back_default=sprites_data.get("back_default"),
+        back_shiny=sprites_data.get("back_shiny"),
+        back_female=sprites_data.get("back_female"),
+        back_shiny_female=sprites_data.get("back_shiny_female"),
+    )
+
+
+def _stats_from_model(pokemon: "models.Pokemon") -> list[PokemonStatDTO]:
+    return [
+        PokemonStatDTO(
+            base_stat=stat.get("base_stat", 0),
+            effort=stat.get("effort", 0),
+            stat=NamedAPIResource(
+                name=stat.get("stat", {}).get("name", ""),
+                url=stat.get("stat", {}).get("url", ""),
+            ),
+        )
+        for stat in pokemon.details.stats
+    ]
+
+
+def _types_from_model(pokemon: "models.Pokemon") -> list[PokemonTypeDTO]:
+    return [
+        PokemonTypeDTO(
+            slot=relation.slot,
+            type=NamedAPIResource(
+                name=relation.pokemon_type.name,
+                url=f"/api/v2/type/{relation.pokemon_type.id}/",
+            ),
+        )
+        for relation in pokemon.type_relations.all()
+    ]
+
+
+# Relations are prefetched with just the columns the DTO needs
+_ABILITY_RELATIONS_PREFETCH = Prefetch(
+    "ability_relations",
+    queryset=models.PokemonAbilityRelation.objects.select_related("ability")
+    .only("pokemon_id", "slot", "is_hidden", "ability__name")
+    .order_by("slot"),
+)
+_MOVE_RELATIONS_PREFETCH = Prefetch(
+    "move_relations",
+    queryset=models.PokemonMoveRelation.objects.select_related("move")
+    .only("pokemon_id", "position", "move__name")
+    .order_by("position"),
+)
+_TYPE_RELATIONS_PREFETCH = Prefetch(
+    "type_relations",
+    queryset=models.PokemonTypeRelation.objects.select_related("pokemon_type")
+    .only("pokemon_id", "slot", "pokemon_type__name")
+    .order_by("slot"),
+)
+
+
+class PokemonDTO(PreEncodedMixin):
     """Complete Pokemon data from PokeAPI."""
 
     id: int
@@ -87,122 +210,53 @@ class PokemonDTO(BaseModel):
     stats: list[PokemonStatDTO]
     types: list[PokemonTypeDTO]
 
+    # How each field is built from the Pokemon model (used for ?fields= projection)
+    PROJECTED_FIELDS: ClassVar[dict[str, ProjectedField]] = {
+        "id": column("id"),
+        "name": column("name"),
+        "base_experience": column("base_experience"),
+        "height": column("height"),
+        "is_default": column("is_default"),
+        "order": column("order"),
+        "weight": column("weight"),
+        "abilities": ProjectedField(
+            build=_abilities_from_model, prefetch=(_ABILITY_RELATIONS_PREFETCH,)
+        ),
+        "forms": ProjectedField(build=_forms_from_model, columns=("details__forms",)),
+        "held_items": ProjectedField(
+            build=_held_items_from_model, columns=("details__held_items",)
+        ),
+        "location_area_encounters": ProjectedField(
+            build=lambda pokemon: str(pokemon.details.location_area_encounters),
+            columns=("details__location_area_encounters",),
+        ),
+        "moves": ProjectedField(
+            build=_moves_from_model, prefetch=(_MOVE_RELATIONS_PREFETCH,)
+        ),
+        "species": ProjectedField(
+            build=_species_from_model, columns=("details__species_data",)
+        ),
+        "sprites": ProjectedField(build=_sprites_from_model, columns=("sprites",)),
+        "stats": ProjectedField(build=_stats_from_model, columns=("details__stats",)),
+        "types": ProjectedField(
+            build=_types_from_model, prefetch=(_TYPE_RELATIONS_PREFETCH,)
+        ),
+    }
+
     @classmethod
-    def from_model(cls, pokemon: "models.Pokemon") -> "PokemonDTO":
+    def from_model(
+        cls, pokemon: "models.Pokemon", fields: frozenset[str] | None = None
+    ) -> "PokemonDTO":
         """Create Pokemon DTO from Django model instance.
 
         Args:
-            pokemon: Pokemon model instance with prefetched relations
+            pokemon: Pokemon model instance loaded with `project_queryset`
+            fields: Fields to build (None for the complete DTO)
 
         Returns:
             PokemonDTO instance
         """
-        # Get abilities from PokemonAbilityRelation
-        ability_relations = pokemon.ability_relations.all().order_by("slot")
-        abilities = [
-            PokemonAbilityDTO(
-                is_hidden=relation.is_hidden,
-                slot=relation.slot,
-                ability=NamedAPIResource(
-                    name=relation.ability.name,
-                    url=f"/api/v2/ability/{relation.ability.id}/",
-                ),
-            )
-            for relation in ability_relations
-        ]
-
-        # Convert forms from JSON to NamedAPIResource objects
-        forms = [
-            NamedAPIResource(name=form.get("name", ""), url=form.get("url", ""))
-            for form in pokemon.forms
-        ]
-
-        # Convert held_items from JSON to PokemonHeldItem objects
-        held_items = [
-            PokemonHeldItemDTO(
-                item=NamedAPIResource(
-                    name=item.get("item", {}).get("name", ""),
-                    url=item.get("item", {}).get("url", ""),
-                ),
-                version_details=item.get("version_details", []),
-            )
-            for item in pokemon.held_items
-        ]
-
-        # Convert moves from JSON to PokemonMove objects
-        moves = [
-            PokemonMoveDTO(
-                move=NamedAPIResource(
-                    name=move.get("move", {}).get("name", ""),
-                    url=move.get("move", {}).get("url", ""),
-                )
-            )
-            for move in pokemon.moves
-        ]
-
-        # Convert species_data from JSON to NamedAPIResource
-        species = NamedAPIResource(
-            name=pokemon.species_data.get("name", ""),
-            url=pokemon.species_data.get("url", ""),
-        )
-
-        # Convert sprites from JSON to PokemonSprites object
-        sprites_data = pokemon.sprites
-        sprites = PokemonSpritesDTO(
-            front_default=sprites_data.get("front_default"),
-            front_shiny=sprites_data.get("front_shiny"),
-            front_female=sprites_data.get("front_female"),
-            front_shiny_female=sprites_data.get("front_shiny_female"),
-            back_default=sprites_data.get("back_default"),
-            back_shiny=sprites_data.get("back_shiny"),
-            back_female=sprites_data.get("back_female"),
-            back_shiny_female=sprites_data.get("back_shiny_female"),
-        )
-
-        # Convert stats from JSON to PokemonStat objects
-        stats = [
-            PokemonStatDTO(
-                base_stat=stat.get("base_stat", 0),
-                effort=stat.get("effort", 0),
-                stat=NamedAPIResource(
-                    name=stat.get("stat", {}).get("name", ""),
-                    url=stat.get("stat", {}).get("url", ""),
-                ),
-            )
-            for stat in pokemon.stats
-        ]
-
-        # Get types from PokemonTypeRelation
-        type_relations = pokemon.type_relations.all().order_by("slot")
-        types = [
-            PokemonTypeDTO(
-                slot=relation.slot,
-                type=NamedAPIResource(
-                    name=relation.pokemon_type.name,
-                    url=f"/api/v2/type/{relation.pokemon_type.id}/",
-                ),
-            )
-            for relation in type_relations
-        ]
-
-        return cls(
-            id=pokemon.id,
-            name=pokemon.name,
-            base_experience=pokemon.base_experience,
-            height=pokemon.height,
-            is_default=pokemon.is_default,
-            order=pokemon.order,
-            weight=pokemon.weight,
-            abilities=abilities,
-            forms=forms,
-            held_items=held_items,
-            location_area_encounters=str(pokemon.location_area_encounters),
-            moves=moves,
-            species=species,
-            sprites=sprites,
-            stats=stats,
-            types=types,
-        )
+        return build_projected(cls, cls.PROJECTED_FIELDS, pokemon, fields)
 
 
 class PokemonListResponseDTO(BaseModel):
@@ -1,27 +1,63 @@
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Collection
 
-from django.db import transaction
+import orjson
+from django.contrib.postgres.search import SearchVector
+from django.db import connection, transaction
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.db.models import F, Model
+from django.utils import timezone
 
+from django_pokeapi.apps.common.common_models import TrackingleModel
 from django_pokeapi.apps.pokeapi import models
-from django_pokeapi.apps.pokeapi.ipc.dto.abilities import Ability
-from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
+from django_pokeapi.apps.pokeapi.ipc.dto.abilities import (
+    Ability,
+    AbilityEffectEntry,
+    AbilityFlavorTextEntry,
+)
 from django_pokeapi.apps.pokeapi.ipc.dto.types import PokemonType
+from django_pokeapi.apps.pokeapi.ipc.records import PokemonRecord
 
 _log = logging.getLogger(__name__)
 
+# Pokemon learn up to a few hundred moves each, insert relations in chunks
+# (when COPY is not available)
+RELATIONS_BATCH_SIZE = 5000
+
+# Pokemon per task of the parallel save (rows and their relations)
+POKEMON_WRITE_BATCH_SIZE = 100
+
+# Written by every upsert together with the changed content (see `changed_rows`)
+TRACKING_FIELDS = ("content_hash", "modified")
+
 
 def bulk_save_all_data(
     types_data: list[PokemonType],
     abilities_data: list[Ability],
-    pokemon_data: list[PokemonDTO],
+    pokemon_data: list[PokemonRecord],
+    workers: int = 1,
+    batch_size: int = POKEMON_WRITE_BATCH_SIZE,
 ) -> None:
     """Bulk save all fetched data to database using optimized operations.
 
     Args:
         types_data: List of PokemonType data to save
         abilities_data: List of Ability data to save
-        pokemon_data: List of Pokemon data to save
+        pokemon_data: List of Pokemon records to save
+        workers: Number of database connections writing in parallel (1 saves
+            everything sequentially on the current connection)
+        batch_size: Number of Pokemon per parallel write batch
     """
+    if workers > 1:
+        parallel_save_all_data(
+            types_data, abilities_data, pokemon_data, workers, batch_size
+        )
+        return
+
     # Bulk save types
     if types_data:
         _log.info("Bulk saving %d types...", len(types_data))
@@ -41,6 +77,183 @@ def bulk_save_all_data(
         _log.info("Successfully bulk saved %d Pokemon", len(pokemon_data))
 
 
+def parallel_save_all_data(
+    types_data: list[PokemonType],
+    abilities_data: list[Ability],
+    pokemon_data: list[PokemonRecord],
+    workers: int,
+    batch_size: int = POKEMON_WRITE_BATCH_SIZE,
+) -> None:
+    """Save all fetched data on several database connections in parallel.
+
+    Writes run in dependency stages: types and abilities, then the referenced
+    moves, then Pokemon in batches. Every task commits its own transaction on
+    the connection of its worker thread, so a failure leaves earlier stages and
+    batches saved. A batch writes its rows and relations together, so a saved
+    content hash always comes with the relations it covers.
+
+    Args:
+        types_data: List of PokemonType data to save
+        abilities_data: List of Ability data to save
+        pokemon_data: List of Pokemon records to save
+        workers: Number of database connections writing in parallel
+        batch_size: Number of Pokemon per write batch
+    """
+    batches = [
+        pokemon_data[start : start + batch_size]
+        for start in range(0, len(pokemon_data), batch_size)
+    ]
+
+    type_ability_tasks: list[Callable[[], Any]] = []
+    if types_data:
+        type_ability_tasks.append(partial(bulk_save_types, types_data))
+    if abilities_data:
+        type_ability_tasks.append(partial(bulk_save_abilities, abilities_data))
+
+    # Moves are shared by all batches, they are upserted by a single task
+    reference_tasks: list[Callable[[], Any]] = []
+    if pokemon_data:
+        reference_tasks.append(partial(save_pokemon_references, pokemon_data))
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="db-writer"
+    ) as executor:
+        _run_write_stage(
+            executor,
+            f"{len(types_data)} types and {len(abilities_data)} abilities",
+            type_ability_tasks,
+        )
+        _run_write_stage(executor, "moves referenced by Pokemon", reference_tasks)
+        _run_write_stage(
+            executor,
+            f"{len(pokemon_data)} Pokemon in {len(batches)} batches",
+            [partial(save_pokemon_batch, batch) for batch in batches],
+        )
+
+
+def _run_write_stage(
+    executor: ThreadPoolExecutor, description: str, tasks: list[Callable[[], Any]]
+) -> list[Any]:
+    """Run write tasks in parallel and wait for all of them (first error is raised)."""
+    if not tasks:
+        return []
+
+    _log.info("Saving %s...", description)
+    start = time.perf_counter()
+
+    futures = [executor.submit(_write_in_transaction, task) for task in tasks]
+    try:
+        results = [future.result() for future in futures]
+    except Exception:
+        for future in futures:
+            future.cancel()
+        raise
+
+    _log.info("Saved %s in %.2fs", description, time.perf_counter() - start)
+    return results
+
+
+def _write_in_transaction(task: Callable[[], Any]) -> Any:
+    try:
+        with transaction.atomic():
+            return task()
+    finally:
+        # Connections are thread-local, do not leave them open in pool threads
+        connection.close()
+
+
+def _content_hash(content: Any) -> str:
+    return hashlib.blake2b(
+        orjson.dumps(content, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+def changed_rows(
+    model: type[TrackingleModel],
+    objects: list[TrackingleModel],
+    fields: list[str],
+    extra_contents: list[Any] | None = None,
+) -> list[TrackingleModel]:
+    """Keep objects whose written content differs from the stored rows.
+
+    Kept objects get a new `content_hash` and `modified` (and `created` when
+    new), so bulk upserts with `TRACKING_FIELDS` only touch changed rows.
+
+    Args:
+        model: Model of the objects
+        objects: Unsaved objects with primary keys set
+        fields: Written fields forming the content
+        extra_contents: Additional content per object (e.g. its relations)
+
+    Returns:
+        Created or changed objects
+    """
+    stored = dict(
+        model.objects.filter(id__in=[obj.id for obj in objects]).values_list(
+            "id", "content_hash"
+        )
+    )
+    now = timezone.now()
+
+    changed = []
+    for index, obj in enumerate(objects):
+        content = [getattr(obj, field) for field in fields]
+        if extra_contents is not None:
+            content.append(extra_contents[index])
+        content_hash = _content_hash(content)
+
+        if obj.id in stored and stored[obj.id] == content_hash:
+            continue
+        if obj.id not in stored:
+            obj.created = now
+        obj.content_hash = content_hash
+        obj.modified = now
+        changed.append(obj)
+
+    # Resources that came back upstream are no longer reported as deleted
+    created_ids = [obj.id for obj in changed if obj.id not in stored]
+    for kind, kind_model in models.CHANGE_KINDS.items():
+        if kind_model is model and created_ids:
+            models.Tombstone.objects.filter(
+                kind=kind, resource_id__in=created_ids
+            ).delete()
+
+    return changed
+
+
+@transaction.atomic
+def delete_missing_resources(kind: str, kept_ids: Collection[int]) -> int:
+    """Delete resources no longer present upstream, leaving tombstones.
+
+    Only call with the IDs of a complete (unfiltered) refresh of the kind.
+
+    Args:
+        kind: Resource kind, one of `models.CHANGE_KINDS`
+        kept_ids: IDs of all fetched resources of the kind
+
+    Returns:
+        Number of deleted resources
+    """
+    missing = models.CHANGE_KINDS[kind].objects.exclude(id__in=kept_ids)
+    now = timezone.now()
+    tombstones = [
+        models.Tombstone(kind=kind, resource_id=resource_id, name=name, deleted=now)
+        for resource_id, name in missing.values_list("id", "name")
+    ]
+    if not tombstones:
+        return 0
+
+    models.Tombstone.objects.bulk_create(
+        tombstones,
+        update_conflicts=True,
+        update_fields=["name", "deleted"],
+        unique_fields=["kind", "resource_id"],
+    )
+    missing.delete()
+    _log.info("Deleted %d %s resources missing upstream", len(tombstones), kind)
+    return len(tombstones)
+
+
 @transaction.atomic
 def bulk_save_types(types_data: list[PokemonType]) -> None:
     """Bulk save Pokemon types to database.
@@ -67,14 +280,25 @@ def bulk_save_types(types_data: list[PokemonType]) -> None:
         )
         type_objects.append(type_obj)
 
+    update_fields = ["damage_relations", "generation_id", "move_damage_class"]
     models.PokemonType.objects.bulk_create(
-        type_objects,
+        changed_rows(models.PokemonType, type_objects, update_fields),
         update_conflicts=True,
-        update_fields=["damage_relations", "generation_id", "move_damage_class"],
+        update_fields=[*update_fields, *TRACKING_FIELDS],
         unique_fields=["id"],
     )
 
 
+def _entries_by_language(
+    entries: list[AbilityEffectEntry] | list[AbilityFlavorTextEntry],
+) -> dict[str, list[dict]]:
+    """Group text entries by language, so reads can pick one language in SQL."""
+    by_language: dict[str, list[dict]] = {}
+    for entry in entries:
+        by_language.setdefault(entry.language.name, []).append(entry.model_dump())
+    return by_language
+
+
 @transaction.atomic
 def bulk_save_abilities(abilities_data: list[Ability]) -> None:
     """Bulk save Pokemon abilities to database.
@@ -93,40 +317,185 @@ def bulk_save_abilities(abilities_data: list[Ability]) -> None:
                 if ability_data.generation
                 else None
             ),
-            effect_entries=[
-                entry.model_dump() for entry in ability_data.effect_entries
-            ],
+            effect_entries=_entries_by_language(ability_data.effect_entries),
             effect_changes=ability_data.effect_changes,
-            flavor_text_entries=[
-                entry.model_dump() for entry in ability_data.flavor_text_entries
-            ],
+            flavor_text_entries=_entries_by_language(ability_data.flavor_text_entries),
         )
         ability_objects.append(ability_obj)
 
+    update_fields = [
+        "is_main_series",
+        "generation_id",
+        "effect_entries",
+        "effect_changes",
+        "flavor_text_entries",
+    ]
+    changed = changed_rows(models.PokemonAbility, ability_objects, update_fields)
     models.PokemonAbility.objects.bulk_create(
-        ability_objects,
+        changed,
         update_conflicts=True,
-        update_fields=[
-            "is_main_series",
-            "generation_id",
-            "effect_entries",
-            "effect_changes",
-            "flavor_text_entries",
-        ],
+        update_fields=[*update_fields, *TRACKING_FIELDS],
         unique_fields=["id"],
     )
 
+    # Search documents are derived from the saved texts
+    changed_ids = {ability.id for ability in changed}
+    save_ability_search_documents(
+        [
+            ability_data
+            for ability_data in abilities_data
+            if ability_data.id in changed_ids
+        ]
+    )
+
+
+def save_ability_search_documents(abilities_data: list[Ability]) -> None:
+    """Rebuild full-text search documents (one per language) of the abilities.
+
+    Args:
+        abilities_data: List of Ability data (already saved)
+    """
+    ability_ids = [ability_data.id for ability_data in abilities_data]
+    models.AbilitySearchDocument.objects.filter(ability_id__in=ability_ids).delete()
+
+    documents = []
+    for ability_data in abilities_data:
+        effects: dict[str, list[str]] = {}
+        for effect_entry in ability_data.effect_entries:
+            effects.setdefault(effect_entry.language.name, []).extend(
+                (effect_entry.effect, effect_entry.short_effect)
+            )
+
+        # Flavor texts repeat across version groups and contain hard line breaks
+        flavor_texts: dict[str, dict[str, None]] = {}
+        for flavor_entry in ability_data.flavor_text_entries:
+            flavor_texts.setdefault(flavor_entry.language.name, {})[
+                " ".join(flavor_entry.flavor_text.split())
+            ] = None
+
+        for language in effects.keys() | flavor_texts.keys():
+            documents.append(
+                models.AbilitySearchDocument(
+                    ability_id=ability_data.id,
+                    language=language,
+                    config=models.TEXT_SEARCH_CONFIGS.get(language, "simple"),
+                    name=ability_data.name.replace("-", " "),
+                    effect=" ".join(effects.get(language, ())),
+                    flavor_text=" ".join(flavor_texts.get(language, ())),
+                )
+            )
+
+    models.AbilitySearchDocument.objects.bulk_create(documents)
+
+    # Vectors are built by PostgreSQL with the configuration of each document
+    config = F("config")
+    models.AbilitySearchDocument.objects.filter(ability_id__in=ability_ids).update(
+        search_vector=SearchVector("name", weight="A", config=config)
+        + SearchVector("effect", weight="B", config=config)
+        + SearchVector("flavor_text", weight="C", config=config)
+    )
+
 
 @transaction.atomic
-def bulk_save_pokemon_with_relations(pokemon_data: list[PokemonDTO]) -> None:
-    """Bulk save Pokemon with their type and ability relations.
+def bulk_save_pokemon_with_relations(pokemon_data: list[PokemonRecord]) -> None:
+    """Bulk save Pokemon with their type, ability and move relations.
+
+    Args:
+        pokemon_data: List of Pokemon records to save
+    """
+    save_pokemon_references(pokemon_data)
+    save_pokemon_batch(pokemon_data)
+
+
+def save_pokemon_batch(pokemon_data: list[PokemonRecord]) -> set[int]:
+    """Save changed Pokemon rows and their relations.
+
+    Run both in one transaction: the content hash covers the relations, so
+    rows committed without them would not be rewritten by the next run.
+    Referenced types, abilities and moves have to exist.
+
+    Args:
+        pokemon_data: List of Pokemon records to save
+
+    Returns:
+        IDs of created or changed Pokemon
+    """
+    changed_ids = save_pokemon_rows(pokemon_data)
+    # Only Pokemon whose content changed get their relations rewritten
+    save_pokemon_relations(
+        [pokemon for pokemon in pokemon_data if pokemon.id in changed_ids]
+    )
+    return changed_ids
+
+
+def save_pokemon_references(pokemon_data: list[PokemonRecord]) -> None:
+    """Ensure the types, abilities and moves referenced by the Pokemon exist.
 
     Args:
-        pokemon_data: List of Pokemon data to save
+        pokemon_data: List of Pokemon records to save
+    """
+    now = timezone.now()
+
+    # Types and abilities are normally saved before, only missing ones are added
+    types = {
+        type_id: models.PokemonType(id=type_id, name=type_name, modified=now)
+        for pokemon in pokemon_data
+        for _, type_id, type_name in pokemon.types
+    }
+    if types:
+        models.PokemonType.objects.bulk_create(types.values(), ignore_conflicts=True)
+
+    abilities = {
+        ability_id: models.PokemonAbility(
+            id=ability_id, name=ability_name, modified=now
+        )
+        for pokemon in pokemon_data
+        for _, _, ability_id, ability_name in pokemon.abilities
+    }
+    if abilities:
+        models.PokemonAbility.objects.bulk_create(
+            abilities.values(), ignore_conflicts=True
+        )
+
+    # PokeAPI Pokemon only reference moves by name and URL, upserted in ID order
+    # so concurrent loads lock the rows in the same order
+    moves = {
+        move_id: models.Move(id=move_id, name=move_name)
+        for pokemon in pokemon_data
+        for move_id, move_name in zip(pokemon.move_ids, pokemon.move_names)
+    }
+    changed_moves = changed_rows(
+        models.Move, [moves[move_id] for move_id in sorted(moves)], ["name"]
+    )
+    if changed_moves:
+        models.Move.objects.bulk_create(
+            changed_moves,
+            update_conflicts=True,
+            update_fields=["name", *TRACKING_FIELDS],
+            unique_fields=["id"],
+        )
+
+
+def save_pokemon_rows(pokemon_data: list[PokemonRecord]) -> set[int]:
+    """Bulk create/update changed Pokemon rows, details and list summaries.
+
+    Relations are written separately (`save_pokemon_relations`, in the same
+    transaction, see `save_pokemon_batch`). They are part of the hashed
+    content, so unchanged Pokemon keep theirs.
+
+    Args:
+        pokemon_data: List of Pokemon records to save
+
+    Returns:
+        IDs of created or changed Pokemon
     """
-    # Step 1: Bulk create/update Pokemon objects
     pokemon_objects = []
     for pokemon in pokemon_data:
+        base_stats = {
+            models.STAT_COLUMNS[stat_name]: base_stat
+            for stat_name, base_stat in pokemon.base_stats.items()
+            if stat_name in models.STAT_COLUMNS
+        }
         pokemon_obj = models.Pokemon(
             id=pokemon.id,
             name=pokemon.name,
@@ -135,84 +504,201 @@ def bulk_save_pokemon_with_relations(pokemon_data: list[PokemonDTO]) -> None:
             is_default=pokemon.is_default,
             order=pokemon.order,
             weight=pokemon.weight,
-            forms=[form.model_dump() for form in pokemon.forms],
-            held_items=[hi.model_dump() for hi in pokemon.held_items],
-            location_area_encounters=pokemon.location_area_encounters,
-            moves=[move.model_dump() for move in pokemon.moves],
-            species_data=pokemon.species.model_dump(),
-            sprites=pokemon.sprites.model_dump(),
-            stats=[stat.model_dump() for stat in pokemon.stats],
+            # Record JSON slices are stored as they are, no re-dumping needed
+            sprites=pokemon.sprites,
+            type_names=[type_name for _, _, type_name in pokemon.types],
+            ability_names=[ability_name for _, _, _, ability_name in pokemon.abilities],
+            stat_total=sum(base_stats.values()),
+            **base_stats,
         )
         pokemon_objects.append(pokemon_obj)
 
-    models.Pokemon.objects.bulk_create(
+    update_fields = [
+        "base_experience",
+        "height",
+        "is_default",
+        "order",
+        "weight",
+        "sprites",
+        "type_names",
+        "ability_names",
+        *models.STAT_COLUMNS.values(),
+        "stat_total",
+    ]
+    details_fields = [
+        "forms",
+        "held_items",
+        "location_area_encounters",
+        "species_data",
+        "stats",
+    ]
+    details_objects = {
+        pokemon.id: models.PokemonDetails(
+            pokemon_id=pokemon.id,
+            forms=pokemon.forms,
+            held_items=pokemon.held_items,
+            location_area_encounters=pokemon.location_area_encounters,
+            species_data=pokemon.species,
+            stats=pokemon.stats,
+        )
+        for pokemon in pokemon_data
+    }
+
+    changed = changed_rows(
+        models.Pokemon,
         pokemon_objects,
-        update_conflicts=True,
-        update_fields=[
-            "base_experience",
-            "height",
-            "is_default",
-            "order",
-            "weight",
-            "forms",
-            "held_items",
-            "location_area_encounters",
-            "moves",
-            "species_data",
-            "sprites",
-            "stats",
+        update_fields,
+        [
+            (
+                [
+                    getattr(details_objects[pokemon.id], field)
+                    for field in details_fields
+                ],
+                pokemon.types,
+                pokemon.abilities,
+                pokemon.move_ids.tolist(),
+            )
+            for pokemon in pokemon_data
         ],
+    )
+    models.Pokemon.objects.bulk_create(
+        changed,
+        update_conflicts=True,
+        update_fields=[*update_fields, *TRACKING_FIELDS],
         unique_fields=["id"],
     )
+    models.PokemonDetails.objects.bulk_create(
+        [details_objects[pokemon.id] for pokemon in changed],
+        update_conflicts=True,
+        update_fields=details_fields,
+        unique_fields=["pokemon"],
+    )
+    summary_fields = [
+        "name",
+        "height",
+        "weight",
+        "base_experience",
+        "sprites",
+        "type_names",
+    ]
+    models.PokemonSummary.objects.bulk_create(
+        [
+            models.PokemonSummary(
+                pokemon_id=pokemon.id,
+                **{field: getattr(pokemon, field) for field in summary_fields},
+            )
+            for pokemon in changed
+        ],
+        update_conflicts=True,
+        update_fields=summary_fields,
+        unique_fields=["pokemon"],
+    )
+    return {pokemon.id for pokemon in changed}
 
-    # Step 2: Clear existing relations and bulk create new ones
-    pokemon_ids = [p.id for p in pokemon_data]
 
-    # Clear existing type relations
-    models.PokemonTypeRelation.objects.filter(pokemon_id__in=pokemon_ids).delete()
+def save_pokemon_relations(pokemon_data: list[PokemonRecord]) -> None:
+    """Replace type, ability and move relations of saved Pokemon.
 
-    # Bulk create type relations
-    type_relations = []
-    for pokemon in pokemon_data:
-        for type_data in pokemon.types:
-            # Ensure the type exists (get_or_create the referenced types)
-            pokemon_type, _ = models.PokemonType.objects.get_or_create(
-                name=type_data.type.name,
-                defaults={"id": int(type_data.type.url.split("/")[-2])},
-            )
+    Referenced types, abilities and moves have to exist (see
+    `save_pokemon_references`), relations of other Pokemon are not touched.
 
-            type_relations.append(
-                models.PokemonTypeRelation(
-                    pokemon_id=pokemon.id,
-                    pokemon_type=pokemon_type,
-                    slot=type_data.slot,
-                )
-            )
+    Args:
+        pokemon_data: List of Pokemon records (rows already saved)
+    """
+    pokemon_ids = [pokemon.id for pokemon in pokemon_data]
 
-    if type_relations:
-        models.PokemonTypeRelation.objects.bulk_create(type_relations)
+    models.PokemonTypeRelation.objects.filter(pokemon_id__in=pokemon_ids).delete()
+    _insert_rows(
+        models.PokemonTypeRelation,
+        ("pokemon_id", "pokemon_type_id", "slot"),
+        [
+            (pokemon.id, type_id, slot)
+            for pokemon in pokemon_data
+            for slot, type_id, _ in pokemon.types
+        ],
+    )
 
-    # Clear existing ability relations
     models.PokemonAbilityRelation.objects.filter(pokemon_id__in=pokemon_ids).delete()
+    _insert_rows(
+        models.PokemonAbilityRelation,
+        ("pokemon_id", "ability_id", "slot", "is_hidden"),
+        [
+            (pokemon.id, ability_id, slot, is_hidden)
+            for pokemon in pokemon_data
+            for slot, is_hidden, ability_id, _ in pokemon.abilities
+        ],
+    )
 
-    # Bulk create ability relations
-    ability_relations = []
+    models.PokemonMoveRelation.objects.filter(pokemon_id__in=pokemon_ids).delete()
+    # A move listed twice keeps its first position
+    move_relations: dict[tuple[int, int], int] = {}
     for pokemon in pokemon_data:
-        for ability_data in pokemon.abilities:
-            # Ensure the ability exists
-            ability, _ = models.PokemonAbility.objects.get_or_create(
-                name=ability_data.ability.name,
-                defaults={"id": int(ability_data.ability.url.split("/")[-2])},
-            )
+        for position, move_id in enumerate(pokemon.move_ids):
+            move_relations.setdefault((pokemon.id, move_id), position)
+    _insert_rows(
+        models.PokemonMoveRelation,
+        ("pokemon_id", "move_id", "position"),
+        [
+            (pokemon_id, move_id, position)
+            for (pokemon_id, move_id), position in move_relations.items()
+        ],
+    )
 
-            ability_relations.append(
-                models.PokemonAbilityRelation(
-                    pokemon_id=pokemon.id,
-                    ability=ability,
-                    slot=ability_data.slot,
-                    is_hidden=ability_data.is_hidden,
-                )
-            )
 
-    if ability_relations:
-        models.PokemonAbilityRelation.objects.bulk_create(ability_relations)
+def _insert_rows(
+    model: type[Model], fields: tuple[str, ...], rows: list[tuple]
+) -> None:
+    """Insert plain rows of a relation table.
+
+    Uses COPY with psycopg 3, which avoids most of the per-row Python work of
+    `bulk_create` (dominant for the ~100k move relations of a full load).
+
+    Args:
+        model: Relation model
+        fields: Model fields (attribute names) of the row values
+        rows: Row values in `fields` order
+    """
+    if not rows:
+        return
+
+    if not is_psycopg3:
+        model.objects.bulk_create(
+            [model(**dict(zip(fields, row))) for row in rows],
+            batch_size=RELATIONS_BATCH_SIZE,
+        )
+        return
+
+    columns = ", ".join(
+        connection.ops.quote_name(model._meta.get_field(field).column)
+        for field in fields
+    )
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {model._meta.db_table} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+
+
+@transaction.atomic
+def bulk_save_crawled_resources(kind: str, documents: dict[int, Any]) -> None:
+    """Bulk save raw documents of a crawled resource kind.
+
+    Args:
+        kind: Registry kind of the documents (e.g. "pokemon-species")
+        documents: Raw PokeAPI documents by resource ID
+    """
+    now = timezone.now()
+    models.CrawledResource.objects.bulk_create(
+        [
+            models.CrawledResource(
+                kind=kind,
+                resource_id=resource_id,
+                name=document.get("name") if isinstance(document, dict) else None,
+                data=document,
+                modified=now,
+            )
+            for resource_id, document in documents.items()
+        ],
+        update_conflicts=True,
+        update_fields=["name", "data", "modified"],
+        unique_fields=["kind", "resource_id"],
+    )
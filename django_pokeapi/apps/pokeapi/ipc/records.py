@@ -0,0 +1,123 @@
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Any
+
+from .dto.pokemon import PokemonSpritesDTO
+
+# Top-level sprites that are stored, the nested "other" and "versions" are not
+_SPRITE_KEYS = tuple(PokemonSpritesDTO.model_fields)
+
+
+def _resource_id(url: str) -> int:
+    return int(url.split("/")[-2])
+
+
+def _named_resource(resource: dict) -> dict[str, str]:
+    return {"name": resource["name"], "url": resource["url"]}
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonRecord:
+    """Lean ingestion form of a PokeAPI Pokemon.
+
+    Keeps only what `ipc_operations` stores: JSON columns as plain (already
+    dumpable) dicts and relations as compact tuples. Move IDs are packed in an
+    array and relation names interned, so the hundreds of moves of a Pokemon
+    cost a few bytes each instead of two pydantic models.
+    """
+
+    id: int
+    name: str
+    base_experience: int | None
+    height: int
+    is_default: bool
+    order: int
+    weight: int
+
+    forms: list[dict]
+    held_items: list[dict]
+    location_area_encounters: str
+    species: dict[str, str]
+    sprites: dict[str, str | None]
+    stats: list[dict]
+
+    # (slot, ID, name) ordered by slot
+    types: tuple[tuple[int, int, str], ...]
+    # (slot, is hidden, ID, name) ordered by slot
+    abilities: tuple[tuple[int, bool, int, str], ...]
+    # Learnable moves in PokeAPI order
+    move_ids: array
+    move_names: tuple[str, ...]
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "PokemonRecord":
+        """Create record from a PokeAPI Pokemon document.
+
+        Args:
+            data: Decoded JSON of the `pokemon/{id}/` endpoint
+
+        Returns:
+            PokemonRecord instance
+
+        Raises:
+            KeyError: If a stored field is missing
+        """
+        sprites = data["sprites"]
+        moves = [move_data["move"] for move_data in data["moves"]]
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            base_experience=data.get("base_experience"),
+            height=data["height"],
+            is_default=data["is_default"],
+            order=data["order"],
+            weight=data["weight"],
+            forms=[_named_resource(form) for form in data["forms"]],
+            held_items=[
+                {
+                    "item": _named_resource(held_item["item"]),
+                    "version_details": held_item["version_details"],
+                }
+                for held_item in data["held_items"]
+            ],
+            location_area_encounters=data["location_area_encounters"],
+            species=_named_resource(data["species"]),
+            sprites={key: sprites.get(key) for key in _SPRITE_KEYS},
+            stats=[
+                {
+                    "base_stat": stat["base_stat"],
+                    "effort": stat["effort"],
+                    "stat": _named_resource(stat["stat"]),
+                }
+                for stat in data["stats"]
+            ],
+            types=tuple(
+                sorted(
+                    (
+                        type_data["slot"],
+                        _resource_id(type_data["type"]["url"]),
+                        sys.intern(type_data["type"]["name"]),
+                    )
+                    for type_data in data["types"]
+                )
+            ),
+            abilities=tuple(
+                sorted(
+                    (
+                        ability_data["slot"],
+                        ability_data["is_hidden"],
+                        _resource_id(ability_data["ability"]["url"]),
+                        sys.intern(ability_data["ability"]["name"]),
+                    )
+                    for ability_data in data["abilities"]
+                )
+            ),
+            move_ids=array("i", (_resource_id(move["url"]) for move in moves)),
+            move_names=tuple(sys.intern(move["name"]) for move in moves),
+        )
+
+    @property
+    def base_stats(self) -> dict[str, int]:
+        """Base stat values by PokeAPI stat name."""
+        return {stat["stat"]["name"]: stat["base_stat"] for stat in self.stats}
@@ -0,0 +1,128 @@
+import subprocess
+import typing
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from django_pokeapi.apps.pokeapi.benchmarks import dto, ingestion, listing, responses
+from django_pokeapi.apps.pokeapi.benchmarks.base import (
+    BenchmarkResult,
+    compare_results,
+    format_results,
+    load_results,
+    save_results,
+)
+
+# Benchmark name -> runner(count, repeat)
+BENCHMARKS = {
+    "dto": dto.run,
+    "ingestion": ingestion.run,
+    "pokemon_list": listing.run,
+    "responses": responses.run,
+}
+
+
+def _git(*args: str) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            # The benchmarked code's repository, wherever the command runs
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as error:
+        raise CommandError(f"Unable to run git {' '.join(args)}: {error}") from error
+    return completed.stdout.strip()
+
+
+def current_commit() -> str:
+    """Get short hash of the checked out commit (`-dirty` with local changes)."""
+    commit = _git("rev-parse", "--short", "HEAD")
+    if _git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+    return commit
+
+
+def merge_results(
+    stored: list[BenchmarkResult], results: list[BenchmarkResult]
+) -> list[BenchmarkResult]:
+    """Replace stored results of the same cases, keep the others."""
+    merged = {(result.benchmark, result.case): result for result in stored}
+    merged.update({(result.benchmark, result.case): result for result in results})
+    return list(merged.values())
+
+
+class Command(BaseCommand):
+    """Management command to run local performance benchmarks."""
+
+    help = "Run performance benchmarks on synthetic PokeAPI data"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command line arguments."""
+        parser.add_argument(
+            "benchmarks",
+            nargs="*",
+            metavar="BENCHMARK",
+            help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (all when not set)",
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1000,
+            help="Number of synthetic Pokemon (page size of stored Pokemon reads)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Number of timed runs per case"
+        )
+        parser.add_argument(
+            "--results-dir",
+            type=Path,
+            default=Path("benchmark-results"),
+            help="Directory of results stored per commit",
+        )
+        parser.add_argument(
+            "--save",
+            action="store_true",
+            help="Store the results of the checked out commit in --results-dir",
+        )
+        parser.add_argument(
+            "--compare",
+            metavar="COMMIT",
+            help="Compare with results stored for a commit (e.g. HEAD~1 or main)",
+        )
+
+    def handle(self, *args: typing.Any, **options: typing.Any) -> None:
+        """Execute the command."""
+        unknown = set(options["benchmarks"]) - BENCHMARKS.keys()
+        if unknown:
+            raise CommandError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+        results = []
+        for name in options["benchmarks"] or BENCHMARKS:
+            try:
+                results.extend(BENCHMARKS[name](options["count"], options["repeat"]))
+            except ValueError as error:
+                raise CommandError(f"{name}: {error}") from error
+        self.stdout.write(format_results(results))
+
+        results_dir = options["results_dir"]
+        if options["save"]:
+            path = results_dir / f"{current_commit()}.json"
+            stored = load_results(path) if path.is_file() else []
+            save_results(merge_results(stored, results), path)
+            self.stdout.write(f"Results saved to {path}")
+
+        if options["compare"]:
+            path = results_dir / f"{options['compare']}.json"
+            if not path.is_file():
+                commit = _git("rev-parse", "--short", options["compare"])
+                path = results_dir / f"{commit}.json"
+            if not path.is_file():
+                raise CommandError(f"No results stored for {options['compare']}")
+
+            self.stdout.write(f"\nCompared with {path}:")
+            self.stdout.write(
+                format_results(compare_results(results, load_results(path)))
+            )
@@ -0,0 +1,149 @@
+import typing
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import override_settings
+from django.test.utils import setup_databases, teardown_databases
+from redis.exceptions import RedisError
+
+from django_pokeapi.apps.common import redis
+from django_pokeapi.apps.pokeapi import dataset
+from django_pokeapi.apps.pokeapi.benchmarks import load
+from django_pokeapi.apps.pokeapi.benchmarks.base import (
+    BenchmarkResult,
+    find_regressions,
+    format_results,
+    load_results,
+    save_results,
+)
+
+
+class Command(BaseCommand):
+    """Management command to load test the API on a temporary database."""
+
+    help = (
+        "Load test the API served by the WSGI and ASGI applications on a temporary "
+        "database seeded with synthetic data or a snapshot"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command line arguments."""
+        parser.add_argument(
+            "--server",
+            dest="servers",
+            action="append",
+            choices=load.SERVERS,
+            help="Served application (repeatable, all when not set)",
+        )
+        parser.add_argument(
+            "--count", type=int, default=1000, help="Number of synthetic Pokemon"
+        )
+        parser.add_argument(
+            "--snapshot",
+            type=Path,
+            help="Seed from a `dumpdata pokeapi` fixture instead of synthetic data",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2000,
+            help="Number of measured requests per server",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=16, help="Number of concurrent clients"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed of the request sequence"
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            help="Results file to compare with (fails on regressions)",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Store the results as the new `--baseline` instead of comparing",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Allowed relative regression of throughput, p50 and p95 latency",
+        )
+
+    def handle(self, *args: typing.Any, **options: typing.Any) -> None:
+        """Execute the command."""
+        baseline = options["baseline"]
+        if options["save_baseline"] and baseline is None:
+            raise CommandError("--save-baseline requires --baseline")
+        if options["snapshot"] and not options["snapshot"].is_file():
+            raise CommandError(f"Snapshot not found: {options['snapshot']}")
+
+        # Keys and channels of the run (dataset version, cached Pokemon) are kept
+        # apart from the ones of API workers sharing the Redis
+        prefix = f"{settings.REDIS_KEY_PREFIX}:loadtest:{uuid.uuid4().hex}"
+        with override_settings(REDIS_KEY_PREFIX=prefix):
+            self.stdout.write("Creating test database...")
+            old_config = setup_databases(
+                verbosity=0, interactive=False, serialized_aliases=set()
+            )
+            try:
+                results = self._run(options)
+            except ValueError as error:
+                raise CommandError(str(error)) from error
+            finally:
+                teardown_databases(old_config, verbosity=0)
+                self._delete_keys(prefix)
+
+        self.stdout.write(format_results(results))
+        if baseline is None:
+            return
+
+        if options["save_baseline"]:
+            save_results(results, baseline)
+            self.stdout.write(f"Baseline saved to {baseline}")
+            return
+
+        if not baseline.is_file():
+            raise CommandError(f"Baseline not found: {baseline}")
+
+        regressions = find_regressions(
+            results, load_results(baseline), load.CHECKED_METRICS, options["tolerance"]
+        )
+        if regressions:
+            raise CommandError(
+                "Regressions against the baseline:\n" + "\n".join(regressions)
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
+
+    def _run(self, options: dict[str, typing.Any]) -> list[BenchmarkResult]:
+        """Seed the test database and load the API."""
+        if options["snapshot"]:
+            self.stdout.write(f"Loading {options['snapshot']}...")
+            call_command("loaddata", options["snapshot"], verbosity=0)
+        else:
+            self.stdout.write(f"Seeding {options['count']} synthetic Pokemon...")
+            load.seed_synthetic(options["count"])
+        # Version-scoped caches of the run start empty
+        dataset.publish_dataset_version()
+
+        self.stdout.write("Running requests...")
+        return load.run(
+            options["requests"],
+            options["concurrency"],
+            tuple(options["servers"] or load.SERVERS),
+            options["seed"],
+        )
+
+    def _delete_keys(self, prefix: str) -> None:
+        """Delete Redis keys of the run (failures don't hide the run's outcome)."""
+        try:
+            keys = list(redis.scan_iter(match=f"{prefix}:*"))
+            if keys:
+                redis.delete(*keys)
+        except RedisError as error:
+            self.stderr.write(f"Unable to delete Redis keys {prefix}:*: {error}")
@@ -1,7 +1,9 @@
+import argparse
 import asyncio
 import logging
 import time
 import typing
+import zlib
 
 import httpx
 from asgiref.sync import sync_to_async
@@ -9,15 +11,68 @@ from django.core.management.base import BaseCommand, CommandError, CommandParser
 from django.db import transaction
 from django.utils import timezone
 
-from django_pokeapi.apps.pokeapi.ipc import ipc_operations
+from django_pokeapi.apps.pokeapi import dataset
+from django_pokeapi.apps.pokeapi.ipc import crawler, ipc_operations
 from django_pokeapi.apps.pokeapi.ipc.async_pokeapi_client import AsyncPokeAPIClient
 from django_pokeapi.apps.pokeapi.ipc.dto.abilities import Ability
-from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
 from django_pokeapi.apps.pokeapi.ipc.dto.types import PokemonType
+from django_pokeapi.apps.pokeapi.ipc.records import PokemonRecord
 
 _log = logging.getLogger(__name__)
 
 
+def parse_id_range(value: str) -> range:
+    """Parse an inclusive "FIRST-LAST" ID range.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a valid range
+    """
+    first, separator, last = value.partition("-")
+    if not (separator and first.isdigit() and last.isdigit()):
+        raise argparse.ArgumentTypeError(f"Invalid ID range: {value}")
+    if int(first) > int(last):
+        raise argparse.ArgumentTypeError(f"Empty ID range: {value}")
+    return range(int(first), int(last) + 1)
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a 1-based "K/N" shard into a 0-based (index, count).
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a valid shard
+    """
+    index, separator, count = value.partition("/")
+    if not (separator and index.isdigit() and count.isdigit()):
+        raise argparse.ArgumentTypeError(f"Invalid shard: {value}")
+    if not 1 <= int(index) <= int(count):
+        raise argparse.ArgumentTypeError(f"Shard out of range: {value}")
+    return int(index) - 1, int(count)
+
+
+def parse_positive_int(value: str) -> int:
+    """Parse an integer of at least 1.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    if not value.isascii() or not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f"Not a positive integer: {value}")
+    return int(value)
+
+
+def shard_of(identifier: int | str, count: int) -> int:
+    """Get the 0-based shard of a resource ID or name.
+
+    IDs are split round-robin, names by their CRC32, so every host computes
+    the same split without coordination. Names of listed resources are
+    resolved to IDs first (see `Command._select`), so a resource lands in the
+    same shard whether it is selected by ID or by name.
+    """
+    if isinstance(identifier, int):
+        return (identifier - 1) % count
+    return zlib.crc32(identifier.lower().encode()) % count
+
+
 class Command(BaseCommand):
     """Management command to update database with PokeAPI data using async fetching."""
 
@@ -36,6 +91,68 @@ class Command(BaseCommand):
         parser.add_argument(
             "--pokemon-only", action="store_true", help="Only update Pokemon data"
         )
+        # Selection of refreshed resources (Pokemon unless --types-only or
+        # --abilities-only is given), relations of other Pokemon stay untouched
+        parser.add_argument(
+            "--ids",
+            nargs="+",
+            type=int,
+            metavar="ID",
+            help="Only refresh resources with these IDs",
+        )
+        parser.add_argument(
+            "--names",
+            nargs="+",
+            metavar="NAME",
+            help="Only refresh resources with these names",
+        )
+        parser.add_argument(
+            "--id-range",
+            nargs="+",
+            type=parse_id_range,
+            metavar="FIRST-LAST",
+            help="Only refresh resources with IDs in these inclusive ranges",
+        )
+        parser.add_argument(
+            "--shard",
+            type=parse_shard,
+            metavar="K/N",
+            help=(
+                "Only refresh the K-th of N deterministic shards of the selection, "
+                "so N hosts can split one refresh"
+            ),
+        )
+        parser.add_argument(
+            "--crawl",
+            nargs="+",
+            metavar="KIND",
+            choices=crawler.default_registry().order,
+            help=(
+                "Crawl these resource kinds (following references among them) "
+                "instead of the default phases"
+            ),
+        )
+        parser.add_argument(
+            "--crawl-concurrency",
+            type=int,
+            default=crawler.CONCURRENCY,
+            help="Maximum number of concurrent requests of the crawler",
+        )
+        parser.add_argument(
+            "--db-workers",
+            type=parse_positive_int,
+            default=1,
+            help=(
+                "Number of database connections writing in parallel "
+                "(batches commit separately when above 1)"
+            ),
+        )
+        parser.add_argument(
+            "--db-batch-size",
+            type=parse_positive_int,
+            default=ipc_operations.POKEMON_WRITE_BATCH_SIZE,
+            help="Number of Pokemon per parallel write batch",
+        )
         parser.add_argument(
             "--ignore-errors",
             action="store_true",
@@ -93,9 +210,20 @@ class Command(BaseCommand):
         try:
             client = AsyncPokeAPIClient(async_client)
 
+            if options["crawl"]:
+                await self._crawl(client, options)
+                return
+
             _log.info("Phase 1: Fetching data from PokeAPI...")
             fetch_start_time = time.time()
 
+            # Selection options target Pokemon unless another kind is chosen
+            selection = any(
+                options[option] for option in ("ids", "names", "id_range", "shard")
+            )
+            if selection and not (options["types_only"] or options["abilities_only"]):
+                options["pokemon_only"] = True
+
             if options["types_only"]:
                 types_data = await self._fetch_types_async(client, options)
                 abilities_data = []
@@ -133,8 +261,8 @@ class Command(BaseCommand):
                 len(pokemon_data),
             )
 
-            await sync_to_async(ipc_operations.bulk_save_all_data)(
-                types_data, abilities_data, pokemon_data
+            await sync_to_async(self._save)(
+                types_data, abilities_data, pokemon_data, options, selection
             )
             db_duration = time.time() - db_start_time
 
@@ -146,6 +274,162 @@ class Command(BaseCommand):
         finally:
             await async_client.aclose()
 
+    def _save(
+        self,
+        types_data: list[PokemonType],
+        abilities_data: list[Ability],
+        pokemon_data: list[PokemonRecord],
+        options: dict,
+        selection: bool,
+    ) -> None:
+        """Save fetched data and publish the new dataset version.
+
+        Args:
+            types_data: Fetched types
+            abilities_data: Fetched abilities
+            pokemon_data: Fetched Pokemon
+            options: Command options
+            selection: Whether only selected Pokemon were fetched (nothing is
+                deleted then)
+        """
+        # Every write (including parallel batches) commits before leaving
+        with dataset.ingestion():
+            ipc_operations.bulk_save_all_data(
+                types_data,
+                abilities_data,
+                pokemon_data,
+                workers=options["db_workers"],
+                batch_size=options["db_batch_size"],
+            )
+            if not selection:
+                self._delete_missing(
+                    {
+                        "type": types_data,
+                        "ability": abilities_data,
+                        "pokemon": pokemon_data,
+                    }
+                )
+        # Let API workers rebuild their version-scoped caches
+        dataset.publish_dataset_version()
+
+    def _save_crawled(
+        self, registry: crawler.ResourceRegistry, result: crawler.CrawlResult
+    ) -> None:
+        """Save crawled resources and publish the new dataset version."""
+        with dataset.ingestion():
+            crawler.save_crawled(registry, result)
+        dataset.publish_dataset_version()
+
+    def _delete_missing(self, fetched: dict[str, list]) -> None:
+        """Delete resources missing from a full refresh, leaving tombstones.
+
+        Kinds that were not fetched (or came back empty) are kept untouched.
+
+        Args:
+            fetched: Fetched resources by change kind
+        """
+        for kind, resources in fetched.items():
+            if resources:
+                ipc_operations.delete_missing_resources(
+                    kind, [resource.id for resource in resources]
+                )
+
+    async def _crawl(self, client: AsyncPokeAPIClient, options: dict) -> None:
+        """Crawl the requested resource kinds and save them.
+
+        Args:
+            client: Async PokeAPI client instance
+            options: Command options
+        """
+        registry = crawler.default_registry()
+        resource_crawler = crawler.ResourceCrawler(
+            client,
+            registry,
+            concurrency=options["crawl_concurrency"],
+            ignore_errors=options["ignore_errors"],
+        )
+
+        _log.info("Crawling %s...", ", ".join(options["crawl"]))
+        fetch_start_time = time.time()
+        result = await resource_crawler.crawl(
+            seeds=options["crawl"], follow=options["crawl"]
+        )
+        _log.info(
+            "Crawl completed in %d seconds (%d failed)",
+            int(time.time() - fetch_start_time),
+            len(resource_crawler.failed),
+        )
+
+        db_start_time = time.time()
+        await sync_to_async(self._save_crawled)(registry, result)
+        _log.info(
+            "Saved crawled resources to database in %d seconds",
+            int(time.time() - db_start_time),
+        )
+
+    async def _select(
+        self,
+        options: dict,
+        label: str,
+        get_all: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> tuple[list[int] | list[str], bool]:
+        """Select resources to refresh from the selection and shard options.
+
+        The full list is only fetched when no IDs, names or ranges are given,
+        or to resolve names to IDs before sharding.
+
+        Args:
+            options: Command options
+            label: Resource kind name for logging
+            get_all: Fetches the full resource list
+
+        Returns:
+            (IDs or names to fetch, whether missing resources are skipped)
+        """
+        identifiers: list = [*(options["ids"] or ()), *(options["names"] or ())]
+        for id_range in options["id_range"] or ():
+            identifiers.extend(id_range)
+        # Ranges may span IDs that do not exist
+        missing_ok = bool(options["id_range"])
+
+        if not identifiers:
+            list_response = await get_all()
+            identifiers = [
+                int(resource_ref.url.split("/")[-2])
+                for resource_ref in list_response.results
+            ]
+            _log.info("Found %d %s to process", len(identifiers), label)
+        elif options["shard"] and options["names"]:
+            # Shard by ID however a resource is selected, names missing from
+            # the list keep their own (name based) shard
+            list_response = await get_all()
+            ids_by_name = {
+                resource_ref.name: int(resource_ref.url.split("/")[-2])
+                for resource_ref in list_response.results
+            }
+            identifiers = [
+                (
+                    ids_by_name.get(identifier.lower(), identifier)
+                    if isinstance(identifier, str)
+                    else identifier
+                )
+                for identifier in identifiers
+            ]
+
+        # Deduplicate, keeping the order
+        identifiers = list(dict.fromkeys(identifiers))
+
+        if options["shard"]:
+            index, count = options["shard"]
+            identifiers = [
+                identifier
+                for identifier in identifiers
+                if shard_of(identifier, count) == index
+            ]
+            _log.info("Shard %d/%d: %d %s", index + 1, count, len(identifiers), label)
+
+        return identifiers, missing_ok
+
     async def _fetch_types_async(
         self, client: AsyncPokeAPIClient, options: dict
     ) -> list[PokemonType]:
@@ -160,18 +444,14 @@ class Command(BaseCommand):
         """
         _log.info("Fetching Pokemon types asynchronously...")
 
-        # Get all types list
-        types_response = await client.get_all_types()
-        total_types = len(types_response.results)
-        _log.info("Found %d types to process", total_types)
-
-        # Extract type IDs and fetch all at once
-        type_ids = [
-            int(type_ref.url.split("/")[-2]) for type_ref in types_response.results
-        ]
+        type_ids, missing_ok = await self._select(
+            options, "types", client.get_all_types
+        )
 
-        _log.info("Fetching all %d types...", len(type_ids))
-        all_types_data = await client.get_multiple_types(type_ids)
+        _log.info("Fetching %d types...", len(type_ids))
+        all_types_data = await client.get_multiple_types(
+            type_ids, missing_ok=missing_ok
+        )
 
         _log.info("Successfully fetched %d types", len(all_types_data))
         return all_types_data
@@ -190,26 +470,21 @@ class Command(BaseCommand):
         """
         _log.info("Fetching Pokemon abilities asynchronously...")
 
-        # Get all abilities list
-        abilities_response = await client.get_all_abilities()
-        total_abilities = len(abilities_response.results)
-        _log.info("Found %d abilities to process", total_abilities)
-
-        # Extract ability IDs and fetch all at once
-        ability_ids = [
-            int(ability_ref.url.split("/")[-2])
-            for ability_ref in abilities_response.results
-        ]
+        ability_ids, missing_ok = await self._select(
+            options, "abilities", client.get_all_abilities
+        )
 
-        _log.info("Fetching all %d abilities...", len(ability_ids))
-        all_abilities_data = await client.get_multiple_abilities(ability_ids)
+        _log.info("Fetching %d abilities...", len(ability_ids))
+        all_abilities_data = await client.get_multiple_abilities(
+            ability_ids, missing_ok=missing_ok
+        )
 
         _log.info("Successfully fetched %d abilities", len(all_abilities_data))
         return all_abilities_data
 
     async def _fetch_pokemon_async(
         self, client: AsyncPokeAPIClient, options: dict
-    ) -> list[PokemonDTO]:
+    ) -> list[PokemonRecord]:
         """Asynchronously fetch all Pokemon data.
 
         Args:
@@ -217,23 +492,18 @@ class Command(BaseCommand):
             options: Command options
 
         Returns:
-            List of fetched Pokemon data
+            List of fetched Pokemon records
         """
         _log.info("Fetching Pokemon data asynchronously...")
 
-        # Get Pokemon list
-        pokemon_response = await client.get_all_pokemon()
-        total_pokemon = len(pokemon_response.results)
-        _log.info("Found %d Pokemon to process", total_pokemon)
-
-        # Extract Pokemon IDs and fetch all at once
-        pokemon_ids = [
-            int(pokemon_ref.url.split("/")[-2])
-            for pokemon_ref in pokemon_response.results
-        ]
+        pokemon_ids, missing_ok = await self._select(
+            options, "Pokemon", client.get_all_pokemon
+        )
 
-        _log.info("Fetching all %d Pokemon...", len(pokemon_ids))
-        all_pokemon_data = await client.get_multiple_pokemon(pokemon_ids)
+        _log.info("Fetching %d Pokemon...", len(pokemon_ids))
+        all_pokemon_data = await client.get_multiple_pokemon_records(
+            pokemon_ids, missing_ok=missing_ok
+        )
 
         _log.info("Successfully fetched %d Pokemon", len(all_pokemon_data))
         return all_pokemon_data
@@ -0,0 +1,49 @@
+# Generated by Django 5.0.14 on 2026-10-19 18:50
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pokemon",
+            name="ability_names",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.TextField(), default=list, size=None
+            ),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="type_names",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.TextField(), default=list, size=None
+            ),
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration(
+                "pokeapi", "2026.10.19_1__backfill_pokemon_name_arrays.sql"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="pokemon",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["type_names"], name="pokemon_type_names_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pokemon",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["ability_names"], name="pokemon_ability_names_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.0.14 on 2026-10-19 18:51
+
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0002_pokemon_name_arrays"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pokemon",
+            name="attack",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="defense",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="hp",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="special_attack",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="special_defense",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="speed",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="stat_total",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration(
+                "pokeapi", "2026.10.19_2__backfill_pokemon_stat_columns.sql"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
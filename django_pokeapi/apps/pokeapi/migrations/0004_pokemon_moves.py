@@ -0,0 +1,94 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:04
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0003_pokemon_stat_columns"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Move",
+            fields=[
+                ("id", models.IntegerField(primary_key=True, serialize=False)),
+                ("created", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified", models.DateTimeField(blank=True, default=None, null=True)),
+                ("name", models.TextField(unique=True)),
+            ],
+            options={
+                "db_table": '"pokeapi"."moves"',
+                "ordering": ["id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="PokemonMoveRelation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("position", models.IntegerField()),
+                (
+                    "move",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pokemon_relations",
+                        to="pokeapi.move",
+                    ),
+                ),
+                (
+                    "pokemon",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="move_relations",
+                        to="pokeapi.pokemon",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": '"pokeapi"."pokemon_move_relations"',
+                "ordering": ["pokemon", "position"],
+            },
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="pokemon_moves",
+            field=models.ManyToManyField(
+                through="pokeapi.PokemonMoveRelation", to="pokeapi.move"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pokemonmoverelation",
+            index=models.Index(
+                fields=["move", "pokemon"], name="pokemon_move_rel_move_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="pokemonmoverelation",
+            unique_together={("pokemon", "move")},
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration(
+                "pokeapi", "2026.10.19_3__backfill_pokemon_moves.sql"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RemoveField(
+            model_name="pokemon",
+            name="moves",
+        ),
+    ]
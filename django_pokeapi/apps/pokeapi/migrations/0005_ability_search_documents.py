@@ -0,0 +1,64 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0004_pokemon_moves"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AbilitySearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("language", models.TextField()),
+                ("config", models.TextField()),
+                ("name", models.TextField()),
+                ("effect", models.TextField(default="")),
+                ("flavor_text", models.TextField(default="")),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(null=True),
+                ),
+                (
+                    "ability",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_documents",
+                        to="pokeapi.pokemonability",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": '"pokeapi"."ability_search_documents"',
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["search_vector"], name="ability_search_vector_gin"
+                    )
+                ],
+                "unique_together": {("ability", "language")},
+            },
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration(
+                "pokeapi", "2026.10.19_4__backfill_ability_search_documents.sql"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0005_ability_search_documents"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pokemonability",
+            name="effect_entries",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name="pokemonability",
+            name="flavor_text_entries",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration(
+                "pokeapi", "2026.10.19_5__key_ability_entries_by_language.sql"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0006_ability_entries_by_language"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CrawledResource",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.TextField()),
+                ("resource_id", models.IntegerField()),
+                ("name", models.TextField(blank=True, null=True)),
+                ("data", models.JSONField()),
+                ("created", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": '"pokeapi"."crawled_resources"',
+                "unique_together": {("kind", "resource_id")},
+            },
+        ),
+    ]
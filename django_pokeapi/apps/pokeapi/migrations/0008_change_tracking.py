@@ -0,0 +1,95 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:27
+
+import django.utils.timezone
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0007_crawled_resources"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="move",
+            name="content_hash",
+            field=models.TextField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="pokemon",
+            name="content_hash",
+            field=models.TextField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="pokemonability",
+            name="content_hash",
+            field=models.TextField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="pokemontype",
+            name="content_hash",
+            field=models.TextField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name="move",
+            name="modified",
+            field=models.DateTimeField(
+                blank=True, db_index=True, default=None, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="pokemon",
+            name="modified",
+            field=models.DateTimeField(
+                blank=True, db_index=True, default=None, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="pokemonability",
+            name="modified",
+            field=models.DateTimeField(
+                blank=True, db_index=True, default=None, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="pokemontype",
+            name="modified",
+            field=models.DateTimeField(
+                blank=True, db_index=True, default=None, null=True
+            ),
+        ),
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.TextField()),
+                ("resource_id", models.IntegerField()),
+                ("name", models.TextField()),
+                (
+                    "deleted",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+            options={
+                "db_table": '"pokeapi"."tombstones"',
+                "unique_together": {("kind", "resource_id")},
+            },
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration("pokeapi", "2026.10.19_6__backfill_modified.sql"),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0008_change_tracking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PokemonDetails",
+            fields=[
+                (
+                    "pokemon",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="details",
+                        serialize=False,
+                        to="pokeapi.pokemon",
+                    ),
+                ),
+                ("forms", models.JSONField(default=list)),
+                ("held_items", models.JSONField(default=list)),
+                ("location_area_encounters", models.URLField(max_length=500)),
+                ("species_data", models.JSONField(default=dict)),
+                ("stats", models.JSONField(default=list)),
+            ],
+            options={
+                "db_table": '"pokeapi"."pokemon_details"',
+            },
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration("pokeapi", "2026.10.19_7__split_pokemon_details.sql"),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RemoveField(
+            model_name="pokemon",
+            name="forms",
+        ),
+        migrations.RemoveField(
+            model_name="pokemon",
+            name="held_items",
+        ),
+        migrations.RemoveField(
+            model_name="pokemon",
+            name="location_area_encounters",
+        ),
+        migrations.RemoveField(
+            model_name="pokemon",
+            name="species_data",
+        ),
+        migrations.RemoveField(
+            model_name="pokemon",
+            name="stats",
+        ),
+    ]
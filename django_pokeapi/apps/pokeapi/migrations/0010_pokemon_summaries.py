@@ -0,0 +1,53 @@
+# Generated by Django 5.0.14 on 2026-10-19 19:34
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+from django_pokeapi.utils import load_db_sql_migration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pokeapi", "0009_pokemon_details"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PokemonSummary",
+            fields=[
+                (
+                    "pokemon",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="pokeapi.pokemon",
+                    ),
+                ),
+                ("name", models.TextField()),
+                ("height", models.IntegerField()),
+                ("weight", models.IntegerField()),
+                ("base_experience", models.IntegerField(blank=True, null=True)),
+                ("sprites", models.JSONField(default=dict)),
+                (
+                    "type_names",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(), default=list, size=None
+                    ),
+                ),
+            ],
+            options={
+                "db_table": '"pokeapi"."pokemon_summaries"',
+                "ordering": ["pokemon"],
+            },
+        ),
+        migrations.RunSQL(
+            load_db_sql_migration(
+                "pokeapi", "2026.10.19_8__backfill_pokemon_summaries.sql"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
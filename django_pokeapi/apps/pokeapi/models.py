@@ -1,6 +1,10 @@
 from typing import TYPE_CHECKING
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils import timezone
 
 from django_pokeapi.apps.common.common_models import TrackingleModel
 
@@ -19,19 +23,154 @@ class PokemonType(TrackingleModel):
         ordering = ["id"]
 
 
+# Language of ability texts when none is requested
+DEFAULT_LANGUAGE = "en"
+
+
+def _json_path_query_array(
+    column: str, path: str, variables: dict | None = None
+) -> models.Func:
+    return models.Func(
+        models.F(column),
+        models.Func(models.Value(path), template="%(expressions)s::jsonpath"),
+        models.Value(variables or {}, output_field=models.JSONField()),
+        function="jsonb_path_query_array",
+        output_field=models.JSONField(),
+    )
+
+
+class PokemonAbilityQuerySet(models.QuerySet):
+    def localized(
+        self,
+        language: str,
+        version_group: str | None = None,
+        effects: bool = True,
+        flavor_texts: bool = True,
+    ) -> "QuerySet[PokemonAbility]":
+        """Annotate ability texts of one language (and version group).
+
+        Entries are picked by PostgreSQL, so texts in other languages never
+        leave the database. Annotations are `localized_effect_entries` and
+        `localized_flavor_text_entries`.
+
+        Args:
+            language: PokeAPI language name (letters, digits and dashes only)
+            version_group: PokeAPI version group name of flavor texts (None for all)
+            effects: Whether to annotate effect entries
+            flavor_texts: Whether to annotate flavor text entries
+
+        Returns:
+            Annotated queryset
+        """
+        # The language is part of the JSON path (keys can't be path variables)
+        language_path = f'$."{language}"[*]'
+
+        annotations = {}
+        if effects:
+            annotations["localized_effect_entries"] = _json_path_query_array(
+                "effect_entries", language_path
+            )
+        if flavor_texts:
+            annotations["localized_flavor_text_entries"] = (
+                _json_path_query_array("flavor_text_entries", language_path)
+                if version_group is None
+                else _json_path_query_array(
+                    "flavor_text_entries",
+                    f"{language_path} ? (@.version_group.name == $version_group)",
+                    {"version_group": version_group},
+                )
+            )
+        return self.annotate(**annotations)
+
+
 class PokemonAbility(TrackingleModel):
     name = models.TextField(unique=True)
     is_main_series = models.BooleanField(default=True)
     generation_id = models.IntegerField(null=True, blank=True)
-    effect_entries = models.JSONField(default=list)
+    # Entries keyed by language: {"en": [entry, ...]} (in PokeAPI order)
+    effect_entries = models.JSONField(default=dict)
     effect_changes = models.JSONField(default=list)
-    flavor_text_entries = models.JSONField(default=list)
+    flavor_text_entries = models.JSONField(default=dict)
+
+    objects = PokemonAbilityQuerySet.as_manager()
 
     class Meta:
         db_table = '"pokeapi"."abilities"'
         ordering = ["id"]
 
 
+# PokeAPI language -> PostgreSQL text search configuration ("simple" otherwise)
+TEXT_SEARCH_CONFIGS = {
+    "de": "german",
+    "en": "english",
+    "es": "spanish",
+    "fr": "french",
+    "it": "italian",
+}
+
+
+class AbilitySearchDocument(models.Model):
+    """Searchable text of an ability in one language, maintained by ingestion."""
+
+    ability = models.ForeignKey(
+        PokemonAbility, on_delete=models.CASCADE, related_name="search_documents"
+    )
+    language = models.TextField()
+    # Text search configuration the vector (and queries) are built with
+    config = models.TextField()
+    name = models.TextField()
+    effect = models.TextField(default="")
+    flavor_text = models.TextField(default="")
+    # Weighted vector: name (A), effect (B), flavor text (C)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        db_table = '"pokeapi"."ability_search_documents"'
+        unique_together = ["ability", "language"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="ability_search_vector_gin"),
+        ]
+
+
+class Move(TrackingleModel):
+    name = models.TextField(unique=True)
+
+    class Meta:
+        db_table = '"pokeapi"."moves"'
+        ordering = ["id"]
+
+
+class CrawledResource(models.Model):
+    """Raw PokeAPI document of a resource kind without a dedicated model.
+
+    Filled by the reference-following crawler (see `ipc.crawler`), so resources
+    such as species, forms or items can be ingested before they get a schema.
+    """
+
+    # Registry kind, e.g. "pokemon-species" or "pokemon/encounters"
+    kind = models.TextField()
+    resource_id = models.IntegerField()
+    name = models.TextField(null=True, blank=True)
+    data = models.JSONField()
+    created = models.DateTimeField(default=timezone.now)
+    modified = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = '"pokeapi"."crawled_resources"'
+        unique_together = ["kind", "resource_id"]
+
+
+# PokeAPI stat name -> typed Pokemon column holding its base value
+STAT_COLUMNS = {
+    "hp": "hp",
+    "attack": "attack",
+    "defense": "defense",
+    "special-attack": "special_attack",
+    "special-defense": "special_defense",
+    "speed": "speed",
+}
+
+
 class Pokemon(TrackingleModel):
     name = models.TextField(unique=True)
     base_experience = models.IntegerField(null=True, blank=True)
@@ -40,24 +179,80 @@ class Pokemon(TrackingleModel):
     order = models.IntegerField()
     weight = models.IntegerField()
 
-    # JSON fields for complex nested data that doesn't need querying
-    forms = models.JSONField(default=list)
-    held_items = models.JSONField(default=list)
-    location_area_encounters = models.URLField(max_length=500)
-    moves = models.JSONField(default=list)
-    species_data = models.JSONField(default=dict)
+    # Top-level sprite URLs (shown in lists), heavy JSON lives in `details`
     sprites = models.JSONField(default=dict)
-    stats = models.JSONField(default=list)
+
+    # Denormalized relation names (ordered by slot) kept in sync by ingestion,
+    # GIN indexed so multi-criteria searches don't need joins or DISTINCT
+    type_names = ArrayField(models.TextField(), default=list)
+    ability_names = ArrayField(models.TextField(), default=list)
+
+    # Base stats extracted from `stats` so filters and leaderboards run in SQL
+    hp = models.IntegerField(default=0, db_index=True)
+    attack = models.IntegerField(default=0, db_index=True)
+    defense = models.IntegerField(default=0, db_index=True)
+    special_attack = models.IntegerField(default=0, db_index=True)
+    special_defense = models.IntegerField(default=0, db_index=True)
+    speed = models.IntegerField(default=0, db_index=True)
+    stat_total = models.IntegerField(default=0, db_index=True)
 
     # Many-to-many relationships
     types = models.ManyToManyField(PokemonType, through="PokemonTypeRelation")
     pokemon_abilities = models.ManyToManyField(
         PokemonAbility, through="PokemonAbilityRelation"
     )
+    pokemon_moves = models.ManyToManyField(Move, through="PokemonMoveRelation")
 
     class Meta:
         db_table = '"pokeapi"."pokemon"'
         ordering = ["id"]
+        indexes = [
+            GinIndex(fields=["type_names"], name="pokemon_type_names_gin"),
+            GinIndex(fields=["ability_names"], name="pokemon_ability_names_gin"),
+        ]
+
+
+class PokemonDetails(models.Model):
+    """Heavy JSON columns of a Pokemon, only joined for detail views.
+
+    Kept out of the `pokemon` table so list and search scans read narrow rows.
+    """
+
+    pokemon = models.OneToOneField(
+        Pokemon, on_delete=models.CASCADE, primary_key=True, related_name="details"
+    )
+    # JSON fields for complex nested data that doesn't need querying
+    forms = models.JSONField(default=list)
+    held_items = models.JSONField(default=list)
+    location_area_encounters = models.URLField(max_length=500)
+    species_data = models.JSONField(default=dict)
+    stats = models.JSONField(default=list)
+
+    class Meta:
+        db_table = '"pokeapi"."pokemon_details"'
+
+
+class PokemonSummary(models.Model):
+    """Denormalized `/pokemon/all` item kept in sync by ingestion.
+
+    Holds exactly the list columns, so list pages are one primary key ordered
+    scan of a single narrow table without relations.
+    """
+
+    pokemon = models.OneToOneField(
+        Pokemon, on_delete=models.CASCADE, primary_key=True, related_name="summary"
+    )
+    name = models.TextField()
+    height = models.IntegerField()
+    weight = models.IntegerField()
+    base_experience = models.IntegerField(null=True, blank=True)
+    sprites = models.JSONField(default=dict)
+    # Ordered by slot
+    type_names = ArrayField(models.TextField(), default=list)
+
+    class Meta:
+        db_table = '"pokeapi"."pokemon_summaries"'
+        ordering = ["pokemon"]
 
 
 class PokemonTypeRelation(models.Model):
@@ -89,3 +284,47 @@ class PokemonAbilityRelation(models.Model):
         db_table = '"pokeapi"."pokemon_ability_relations"'
         unique_together = ["pokemon", "slot"]
         ordering = ["pokemon", "slot"]
+
+
+class PokemonMoveRelation(models.Model):
+    # Both foreign keys are covered by the composite indexes below
+    pokemon = models.ForeignKey(
+        Pokemon, on_delete=models.CASCADE, related_name="move_relations", db_index=False
+    )
+    move = models.ForeignKey(
+        Move, on_delete=models.CASCADE, related_name="pokemon_relations", db_index=False
+    )
+    # Position in the PokeAPI move list of the Pokemon
+    position = models.IntegerField()
+
+    class Meta:
+        db_table = '"pokeapi"."pokemon_move_relations"'
+        # (pokemon, move) serves moves of a Pokemon and shared moves,
+        # (move, pokemon) serves Pokemon learning a move
+        unique_together = ["pokemon", "move"]
+        ordering = ["pokemon", "position"]
+        indexes = [
+            models.Index(fields=["move", "pokemon"], name="pokemon_move_rel_move_idx"),
+        ]
+
+
+class Tombstone(models.Model):
+    """Resource deleted by ingestion, kept for the changes feed."""
+
+    # Resource kind, one of `CHANGE_KINDS`
+    kind = models.TextField()
+    resource_id = models.IntegerField()
+    name = models.TextField()
+    deleted = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = '"pokeapi"."tombstones"'
+        unique_together = ["kind", "resource_id"]
+
+
+# Resource kinds reported by the changes feed
+CHANGE_KINDS: dict[str, type[TrackingleModel]] = {
+    "pokemon": Pokemon,
+    "ability": PokemonAbility,
+    "type": PokemonType,
+}
@@ -1,55 +1,120 @@
-from django.db.models import QuerySet
+from datetime import datetime
+from typing import Sequence
 
-from django_pokeapi.apps.pokeapi import models
+import numpy as np
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import Case, F, Q, QuerySet, Value, When
+from django.db.models.functions import Concat
 
+from django_pokeapi.apps.common.db_router import use_primary
+from django_pokeapi.apps.pokeapi import models, pokemon_cache
+from django_pokeapi.apps.pokeapi.dataset import get_dataset_version
+from django_pokeapi.apps.pokeapi.enums import PokemonStat, SearchMatch
+
+from .damage import get_damage_tables
 from .dto.api_dto import (
     AbilityDTO,
+    AbilityLanguageRequestDTO,
+    AbilitySearchRequestDTO,
+    AbilitySearchResultDTO,
+    ChangeDTO,
+    ChangesDTO,
+    ChangesRequestDTO,
+    DamageEstimateDTO,
+    DamageRankingDTO,
+    DamageRankingRequestDTO,
+    DefensiveProfileDTO,
+    MoveDTO,
+    PokemonBatchComparisonDTO,
     PokemonComparisonDTO,
     PokemonComparisonSummaryDTO,
+    PokemonLeaderboardRequestDTO,
     PokemonListDTO,
     PokemonRequestDTO,
+    PokemonSearchRequestDTO,
+    PokemonSimilarRequestDTO,
+    PokemonStatFilterRequestDTO,
+    PokemonStatsDTO,
+    PokemonTypesDTO,
+    SharedMovesDTO,
+    SimilarPokemonDTO,
+    TeamCoverageDTO,
+    TeamDefenseSummaryDTO,
+    TeamOffenseSummaryDTO,
     TypeDTO,
+    TypeEffectivenessDTO,
 )
+from .dto.encoded import EncodedRows, PreEncodedList, dump_json
+from .dto.projection import project_dto, project_queryset
 from .ipc.dto.pokemon import PokemonDTO
+from .similarity import get_pokemon_vectors
+from .snapshot import get_snapshot
+from .type_chart import TypeMatchups, get_type_matchups
+
+
+def _paginate(
+    query: QuerySet | Sequence, offset: int, limit: int
+) -> QuerySet | Sequence:
+    """Apply offset/limit pagination (when limit is 0, everything from offset)."""
+    if not limit:
+        return query[offset:]
+    return query[offset : offset + limit]
+
+
+# Column of each `PokemonListDTO` field in the summary table
+_SUMMARY_COLUMNS = {
+    "id": "pokemon_id",
+    "name": "name",
+    "height": "height",
+    "weight": "weight",
+    "base_experience": "base_experience",
+    "sprites": "sprites",
+    "types": "type_names",
+}
 
 
 def get_pokemon_list(
     offset: int,
     limit: int,
-) -> list[PokemonListDTO]:
-    """Get optimized Pokemon list with related data and pagination.
+    fields: frozenset[str] | None = None,
+) -> PreEncodedList | EncodedRows:
+    """Get Pokemon list page with its encoded JSON.
+
+    Without a snapshot the page is read from the summary table maintained by
+    ingestion (a single primary key ordered scan) and encoded as it is.
 
     Args:
         offset: Starting position (which Pokemon ID to start from)
         limit: Maximum number of Pokemon to return (when set to 0, all Pokemon are returned)
+        fields: Fields to load and return (None for all of them)
 
     Returns:
-        list[PokemonListDTO] with prefetched relations and applied pagination
+        Pokemon list items (`PokemonListDTO` or rows of its requested fields)
+        with applied pagination
     """
-    # Optimize database queries using select_related and prefetch_related
-    pokemon_query = (
-        models.Pokemon.objects.select_related()
-        .prefetch_related(
-            "type_relations__pokemon_type",
-            "ability_relations__ability",
+    if snapshot := get_snapshot():
+        if fields is None:
+            return snapshot.page(snapshot.pokemon_list, offset, limit)
+        return EncodedRows(
+            project_dto(pokemon, fields).model_dump(exclude_unset=True)
+            for pokemon in _paginate(snapshot.pokemon_list, offset, limit)
         )
-        .order_by("id")  # Ensure consistent ordering for offset/limit
-    )
 
-    # Apply pagination - if limit is 0, return all Pokemon from offset
-    if not limit:
-        pokemon_models = pokemon_query[offset:]
-    else:
-        pokemon_models = pokemon_query[offset : offset + limit]
-
-    return [PokemonListDTO.from_model(pokemon) for pokemon in pokemon_models]
+    names = [name for name in _SUMMARY_COLUMNS if fields is None or name in fields]
+    rows = models.PokemonSummary.objects.order_by("pokemon_id").values_list(
+        *(_SUMMARY_COLUMNS[name] for name in names)
+    )
+    return EncodedRows(dict(zip(names, row)) for row in _paginate(rows, offset, limit))
 
 
-def get_pokemon(pokemon_request: PokemonRequestDTO) -> PokemonDTO:
+def get_pokemon(
+    pokemon_request: PokemonRequestDTO, fields: frozenset[str] | None = None
+) -> PokemonDTO:
     """Get Pokemon by id or name with optimized queries.
 
     Args:
         pokemon_request: Request DTO containing id or name filter
+        fields: Fields to load and return (None for all of them)
 
     Returns:
         PokemonDTO instance
@@ -57,9 +122,18 @@ def get_pokemon(pokemon_request: PokemonRequestDTO) -> PokemonDTO:
     if not pokemon_request.id and not pokemon_request.name:
         raise ValueError("Either id or name must be provided")
 
-    query = models.Pokemon.objects.select_related().prefetch_related(
-        "type_relations__pokemon_type",
-        "ability_relations__ability",
+    if snapshot := get_snapshot():
+        if pokemon_request.id:
+            record = snapshot.pokemon_by_id.get(pokemon_request.id)
+        else:
+            record = snapshot.pokemon_by_name.get(pokemon_request.name.lower())
+        if record is None:
+            raise models.Pokemon.DoesNotExist("Pokemon matching query does not exist.")
+        return project_dto(record.detail, fields)
+
+    # Only columns and relations of the requested fields are loaded
+    query = project_queryset(
+        models.Pokemon.objects.all(), PokemonDTO.PROJECTED_FIELDS, fields
     )
 
     if pokemon_request.id:
@@ -67,98 +141,429 @@ def get_pokemon(pokemon_request: PokemonRequestDTO) -> PokemonDTO:
     else:
         pokemon = query.get(name__iexact=pokemon_request.name)
 
-    return PokemonDTO.from_model(pokemon)
+    return PokemonDTO.from_model(pokemon, fields)
+
 
+def get_pokemon_batch(identifiers: list[str]) -> list[tuple[str, bytes | None]]:
+    """Get many Pokemon by id or name at once.
 
-def search_pokemon_by_type(type_name: str) -> QuerySet[PokemonDTO]:
-    """Search Pokemon by type name.
+    Served from the dataset snapshot when enabled. Otherwise the Redis cache
+    (scoped to the dataset version) is read first and only the misses are
+    loaded, with one query and one shared prefetch, and cached.
 
     Args:
-        type_name: Type name to search for
+        identifiers: Pokemon names or IDs (numeric strings are treated as IDs)
 
     Returns:
-        QuerySet of Pokemon with the specified type
+        (identifier, encoded `PokemonDTO` JSON or None when not found) pairs in
+        the order they were requested
     """
-    return (
-        models.Pokemon.objects.select_related()
-        .prefetch_related("types", "pokemon_abilities")
-        .filter(types__name__iexact=type_name)
-        .distinct()
-        .order_by("id")
+    lookups = [_pokemon_lookup(value) for value in identifiers]
+    keys = [key for _, key in lookups]
+
+    if snapshot := get_snapshot():
+        found: dict[str, bytes] = {}
+        for is_id, key in lookups:
+            if is_id:
+                record = snapshot.pokemon_by_id.get(int(key))
+            else:
+                record = snapshot.pokemon_by_name.get(key)
+            if record is not None:
+                # pylint: disable-next=protected-access
+                found[key] = record.detail._encoded.content
+        return [(value, found.get(key)) for value, key in zip(identifiers, keys)]
+
+    version = get_dataset_version()
+    # Canonical key -> whether it is an ID
+    unique_keys = {key: is_id for is_id, key in lookups}
+    found = (
+        pokemon_cache.get_many(version, list(unique_keys))
+        if version is not None
+        else {}
     )
 
+    if missing := {
+        key: is_id for key, is_id in unique_keys.items() if key not in found
+    }:
+        # Cached for the whole version, so not read from a lagging replica
+        pokemon_query = project_queryset(
+            models.Pokemon.objects.all(), PokemonDTO.PROJECTED_FIELDS
+        ).filter(
+            Q(id__in=[int(key) for key, is_id in missing.items() if is_id])
+            | Q(name__in=[key for key, is_id in missing.items() if not is_id])
+        )
+
+        loaded: dict[str, bytes] = {}
+        with use_primary():
+            for pokemon in pokemon_query:
+                content = dump_json(PokemonDTO.from_model(pokemon))
+                loaded[str(pokemon.id)] = content
+                loaded[pokemon.name.lower()] = content
+
+        if version is not None:
+            pokemon_cache.set_many(version, loaded)
+        found.update(loaded)
 
-def search_pokemon_by_ability(ability_name: str) -> QuerySet[PokemonDTO]:
-    """Search Pokemon by ability name.
+    return [(value, found.get(key)) for value, key in zip(identifiers, keys)]
+
+
+def _filter_by_names(
+    query: QuerySet[models.Pokemon],
+    field: str,
+    names: list[str],
+    match: SearchMatch,
+) -> QuerySet[models.Pokemon]:
+    """Filter Pokemon by one of the denormalized name array columns.
+
+    Both `@>` (contains) and `&&` (overlap) are served by the GIN index
+    on the array column.
 
     Args:
-        ability_name: Ability name to search for
+        query: Pokemon queryset to filter
+        field: Array column name (`type_names` or `ability_names`)
+        names: Names to search for
+        match: Whether all (AND) or any (OR) of the names must be present
 
     Returns:
-        QuerySet of Pokemon with the specified ability
+        Filtered queryset
     """
-    return (
-        models.Pokemon.objects.select_related()
-        .prefetch_related("types", "pokemon_abilities")
-        .filter(pokemon_abilities__name__iexact=ability_name)
-        .distinct()
-        .order_by("id")
+    if not names:
+        return query
+
+    names = [name.lower() for name in names]
+    if match == SearchMatch.ANY:
+        return query.filter(**{f"{field}__overlap": names})
+
+    return query.filter(**{f"{field}__contains": names})
+
+
+def _search_query(search: PokemonSearchRequestDTO) -> QuerySet[models.Pokemon]:
+    """Build Pokemon queryset filtered by the type/ability search criteria."""
+    query = _filter_by_names(
+        models.Pokemon.objects.all(), "type_names", search.types, search.type_match
+    )
+    return _filter_by_names(
+        query, "ability_names", search.abilities, search.ability_match
+    )
+
+
+def search_pokemon(
+    search: PokemonSearchRequestDTO, offset: int, limit: int
+) -> list[PokemonListDTO]:
+    """Search Pokemon by type and/or ability names.
+
+    Types and abilities are combined with AND, names within each group
+    according to `type_match`/`ability_match`.
+
+    Args:
+        search: Search criteria
+        offset: Starting position
+        limit: Maximum number of Pokemon to return (when set to 0, all are returned)
+
+    Returns:
+        list[PokemonListDTO] of matching Pokemon ordered by id
+    """
+    query = project_queryset(
+        _search_query(search).order_by("id"), PokemonListDTO.PROJECTED_FIELDS
+    )
+
+    return [
+        PokemonListDTO.from_model(pokemon)
+        for pokemon in _paginate(query, offset, limit)
+    ]
+
+
+def search_pokemon_by_type(
+    type_names: list[str], match: SearchMatch, offset: int, limit: int
+) -> list[PokemonListDTO]:
+    """Search Pokemon by type names.
+
+    Args:
+        type_names: Type names to search for
+        match: Whether all or any of the types must be present
+        offset: Starting position
+        limit: Maximum number of Pokemon to return (when set to 0, all are returned)
+
+    Returns:
+        list[PokemonListDTO] of Pokemon with the specified types
+    """
+    return search_pokemon(
+        PokemonSearchRequestDTO(types=type_names, type_match=match), offset, limit
+    )
+
+
+def search_pokemon_by_ability(
+    ability_names: list[str], match: SearchMatch, offset: int, limit: int
+) -> list[PokemonListDTO]:
+    """Search Pokemon by ability names.
+
+    Args:
+        ability_names: Ability names to search for
+        match: Whether all or any of the abilities must be present
+        offset: Starting position
+        limit: Maximum number of Pokemon to return (when set to 0, all are returned)
+
+    Returns:
+        list[PokemonListDTO] of Pokemon with the specified abilities
+    """
+    return search_pokemon(
+        PokemonSearchRequestDTO(abilities=ability_names, ability_match=match),
+        offset,
+        limit,
+    )
+
+
+## STATS
+
+# Columns needed to build PokemonStatsDTO
+_STATS_DTO_COLUMNS = (
+    "id",
+    "name",
+    "type_names",
+    *models.STAT_COLUMNS.values(),
+    "stat_total",
+)
+
+
+def filter_pokemon_by_stats(
+    filters: PokemonStatFilterRequestDTO, offset: int, limit: int
+) -> list[PokemonStatsDTO]:
+    """Filter Pokemon by base stat ranges, optionally sorted by a stat.
+
+    All range and type/ability filters are combined with AND and evaluated
+    against the indexed stat columns in SQL.
+
+    Args:
+        filters: Stat ranges, type/ability criteria and ordering
+        offset: Starting position
+        limit: Maximum number of Pokemon to return (when set to 0, all are returned)
+
+    Returns:
+        list[PokemonStatsDTO] of matching Pokemon
+    """
+    query = _search_query(filters).only(*_STATS_DTO_COLUMNS)
+
+    for stat in PokemonStat:
+        # Query parameters use the short stat name (`min_total`, `min_special_attack`)
+        param = stat.value.replace("-", "_")
+        minimum = getattr(filters, f"min_{param}")
+        maximum = getattr(filters, f"max_{param}")
+        if minimum is not None:
+            query = query.filter(**{f"{stat.column}__gte": minimum})
+        if maximum is not None:
+            query = query.filter(**{f"{stat.column}__lte": maximum})
+
+    if filters.order_by:
+        column = filters.order_by.column
+        query = query.order_by(f"-{column}" if filters.descending else column, "id")
+    else:
+        query = query.order_by("id")
+
+    return [
+        PokemonStatsDTO.from_model(pokemon)
+        for pokemon in _paginate(query, offset, limit)
+    ]
+
+
+def get_stat_leaderboard(
+    leaderboard: PokemonLeaderboardRequestDTO,
+) -> list[PokemonStatsDTO]:
+    """Get top-k Pokemon by a base stat, optionally filtered by types/abilities.
+
+    Args:
+        leaderboard: Stat to rank by, number of entries and type/ability criteria
+
+    Returns:
+        list[PokemonStatsDTO] ordered from the highest stat value
+    """
+    query = (
+        _search_query(leaderboard)
+        .only(*_STATS_DTO_COLUMNS)
+        .order_by(f"-{leaderboard.stat.column}", "id")
+    )
+    return [PokemonStatsDTO.from_model(pokemon) for pokemon in query[: leaderboard.k]]
+
+
+## COMPARISON
+
+# Columns needed to build PokemonComparisonSummaryDTO (stats come from typed columns)
+_COMPARISON_COLUMNS = (
+    "id",
+    "name",
+    "height",
+    "weight",
+    "base_experience",
+    "type_names",
+    *models.STAT_COLUMNS.values(),
+)
+
+
+def _pokemon_lookup(identifier: str) -> tuple[bool, str]:
+    """Tell a Pokemon ID from a name and get its canonical lookup key.
+
+    Only ASCII digits form an ID (e.g. "007" -> (True, "7")), anything else
+    (including other Unicode digits) is a lower-cased name.
+    """
+    if identifier.isascii() and identifier.isdigit():
+        return True, str(int(identifier))
+    return False, identifier.lower()
+
+
+def _get_comparison_pokemon(identifiers: list[str]) -> list[models.Pokemon]:
+    """Load Pokemon for comparison in one query, in the order they were requested.
+
+    Args:
+        identifiers: Pokemon names or IDs (numeric strings are treated as IDs)
+
+    Returns:
+        List of Pokemon with only the comparison columns loaded
+
+    Raises:
+        models.Pokemon.DoesNotExist: If any of the Pokemon is not found
+    """
+    lookups = [_pokemon_lookup(value) for value in identifiers]
+    ids = {int(key) for is_id, key in lookups if is_id}
+    names = {key for is_id, key in lookups if not is_id}
+
+    pokemon_models = models.Pokemon.objects.filter(
+        Q(id__in=ids) | Q(name__in=names)
+    ).only(*_COMPARISON_COLUMNS)
+
+    by_key: dict[str, models.Pokemon] = {}
+    for pokemon in pokemon_models:
+        by_key[str(pokemon.id)] = pokemon
+        by_key[pokemon.name] = pokemon
+
+    missing = [
+        value for value, (_, key) in zip(identifiers, lookups) if key not in by_key
+    ]
+    if missing:
+        raise models.Pokemon.DoesNotExist(f"Pokemon not found: {', '.join(missing)}")
+
+    return [by_key[key] for _, key in lookups]
+
+
+def _comparison_summary(pokemon: models.Pokemon) -> PokemonComparisonSummaryDTO:
+    return PokemonComparisonSummaryDTO(
+        id=pokemon.id,
+        name=pokemon.name,
+        height=pokemon.height,
+        weight=pokemon.weight,
+        base_experience=pokemon.base_experience,
+        stats={
+            stat_name: getattr(pokemon, column)
+            for stat_name, column in models.STAT_COLUMNS.items()
+        },
+        types=pokemon.type_names,
     )
 
 
+def _stat_matrix(pokemon_models: list[models.Pokemon]) -> np.ndarray:
+    """Build (pokemon x stat) matrix of base stats in STAT_COLUMNS order."""
+    return np.array(
+        [
+            [getattr(pokemon, column) for column in models.STAT_COLUMNS.values()]
+            for pokemon in pokemon_models
+        ],
+        dtype=np.int32,
+    ).reshape(len(pokemon_models), len(models.STAT_COLUMNS))
+
+
 def compare_pokemon_stats(
     pokemon1_name: str, pokemon2_name: str
 ) -> PokemonComparisonDTO:
     """Compare stats between two Pokemon.
 
     Args:
-        pokemon1_name: First Pokemon request DTO
-        pokemon2_name: Second Pokemon request DTO
+        pokemon1_name: First Pokemon name or ID
+        pokemon2_name: Second Pokemon name or ID
 
     Returns:
         Comparison data with stats, types, and differences
     """
-    pokemon1 = get_pokemon(PokemonRequestDTO(name=pokemon1_name))
-    pokemon2 = get_pokemon(PokemonRequestDTO(name=pokemon2_name))
-
-    # Extract stats for comparison from DTO
-    stats1 = {stat.stat.name: stat.base_stat for stat in pokemon1.stats}
-    stats2 = {stat.stat.name: stat.base_stat for stat in pokemon2.stats}
-
-    # Extract types from DTO
-    types1 = [pokemon_type.type.name for pokemon_type in pokemon1.types]
-    types2 = [pokemon_type.type.name for pokemon_type in pokemon2.types]
-
-    comparison = PokemonComparisonDTO(
-        pokemon1=PokemonComparisonSummaryDTO(
-            id=pokemon1.id,
-            name=pokemon1.name,
-            height=pokemon1.height,
-            weight=pokemon1.weight,
-            base_experience=pokemon1.base_experience,
-            stats=stats1,
-            types=types1,
-        ),
-        pokemon2=PokemonComparisonSummaryDTO(
-            id=pokemon2.id,
-            name=pokemon2.name,
-            height=pokemon2.height,
-            weight=pokemon2.weight,
-            base_experience=pokemon2.base_experience,
-            stats=stats2,
-            types=types2,
-        ),
-        stat_differences={},
+    pokemon1, pokemon2 = _get_comparison_pokemon([pokemon1_name, pokemon2_name])
+    differences = np.subtract(*_stat_matrix([pokemon1, pokemon2]))
+
+    return PokemonComparisonDTO(
+        pokemon1=_comparison_summary(pokemon1),
+        pokemon2=_comparison_summary(pokemon2),
+        stat_differences=dict(zip(models.STAT_COLUMNS, differences.tolist())),
     )
 
-    # Calculate stat differences
-    for stat_name in stats1.keys():
-        if stat_name in stats2:
-            comparison.stat_differences[stat_name] = (
-                stats1[stat_name] - stats2[stat_name]
-            )
 
-    return comparison
+def compare_pokemon_batch(identifiers: list[str]) -> PokemonBatchComparisonDTO:
+    """Compare base stats of N Pokemon pairwise with a single database query.
+
+    Args:
+        identifiers: Pokemon names or IDs
+
+    Returns:
+        Summaries in request order and per-stat difference matrices, where
+        `stat_differences[stat][i][j]` is pokemon i minus pokemon j
+    """
+    pokemon_models = _get_comparison_pokemon(identifiers)
+    stats = _stat_matrix(pokemon_models)
+
+    # (n, 1, s) - (1, n, s) -> (n, n, s) difference of every pair for every stat
+    differences = stats[:, np.newaxis, :] - stats[np.newaxis, :, :]
+
+    return PokemonBatchComparisonDTO(
+        pokemon=[_comparison_summary(pokemon) for pokemon in pokemon_models],
+        stat_differences={
+            stat_name: differences[:, :, index].tolist()
+            for index, stat_name in enumerate(models.STAT_COLUMNS)
+        },
+    )
+
+
+## SIMILARITY
+
+
+def get_similar_pokemon(
+    similar_request: PokemonSimilarRequestDTO,
+) -> list[SimilarPokemonDTO]:
+    """Get Pokemon with the most similar base stats (k nearest neighbours).
+
+    One vectorized distance computation over the cached feature matrices,
+    filters are applied as masks.
+
+    Args:
+        similar_request: Reference Pokemon (id or name), k, distance options
+            and filters
+
+    Returns:
+        list[SimilarPokemonDTO] ordered by distance
+
+    Raises:
+        models.Pokemon.DoesNotExist: If the reference Pokemon is not found
+    """
+    identifier = str(similar_request.id) if similar_request.id else similar_request.name
+    if not identifier:
+        raise ValueError("Either id or name must be provided")
+
+    vectors = get_pokemon_vectors()
+    row = vectors.pokemon_rows.get(identifier.lower())
+    if row is None:
+        raise models.Pokemon.DoesNotExist(f"Pokemon not found: {identifier}")
+
+    rows, distances = vectors.nearest(
+        row,
+        similar_request.k,
+        include_types=similar_request.include_types,
+        include_size=similar_request.include_size,
+        same_type=similar_request.same_type,
+        max_base_experience=similar_request.max_base_experience,
+    )
+
+    return [
+        SimilarPokemonDTO(
+            id=int(vectors.pokemon_ids[neighbour]),
+            name=vectors.pokemon_names[neighbour],
+            types=list(vectors.pokemon_type_names[neighbour]),
+            distance=float(distance),
+        )
+        for neighbour, distance in zip(rows, distances)
+    ]
 
 
 ## TYPES
@@ -170,6 +575,9 @@ def get_all_types() -> list[TypeDTO]:
     Returns:
         List of type names sorted by id
     """
+    if snapshot := get_snapshot():
+        return snapshot.page(snapshot.types, 0, 0)
+
     pokemon_types = models.PokemonType.objects.all().order_by("id")
     return [TypeDTO.from_model(pokemon_type) for pokemon_type in pokemon_types]
 
@@ -183,43 +591,460 @@ def get_type_details(type_name: str) -> TypeDTO:
     Returns:
         Type details
     """
+    if snapshot := get_snapshot():
+        if (pokemon_type := snapshot.types_by_name.get(type_name)) is None:
+            raise models.PokemonType.DoesNotExist(
+                "PokemonType matching query does not exist."
+            )
+        return pokemon_type
+
     pokemon_type = models.PokemonType.objects.get(name=type_name)
     return TypeDTO.from_model(pokemon_type)
 
 
+## TYPE MATCHUPS
+
+
+def _pokemon_row(matchups: TypeMatchups, identifier: str) -> int:
+    row = matchups.pokemon_rows.get(identifier.lower())
+    if row is None:
+        raise models.Pokemon.DoesNotExist(f"Pokemon not found: {identifier}")
+    return row
+
+
+def _pokemon_types_kwargs(matchups: TypeMatchups, row: int) -> dict:
+    return {
+        "id": int(matchups.pokemon_ids[row]),
+        "name": matchups.pokemon_names[row],
+        "types": matchups.pokemon_type_names(row),
+    }
+
+
+def get_type_effectiveness(
+    type_name: str, min_multiplier: float | None, offset: int, limit: int
+) -> list[TypeEffectivenessDTO]:
+    """Get multiplier of an attacking type against every Pokemon.
+
+    Computed for all Pokemon at once from the cached type matrices.
+
+    Args:
+        type_name: Attacking type name
+        min_multiplier: Only return Pokemon taking at least this multiplier
+        offset: Starting position
+        limit: Maximum number of Pokemon to return (when set to 0, all are returned)
+
+    Returns:
+        list[TypeEffectivenessDTO] ordered by Pokemon ID
+
+    Raises:
+        models.PokemonType.DoesNotExist: If the type is unknown
+    """
+    matchups = get_type_matchups()
+    attacking = matchups.type_index.get(type_name.lower())
+    if attacking is None:
+        raise models.PokemonType.DoesNotExist(f"Type not found: {type_name}")
+
+    multipliers = matchups.defending_multipliers(
+        np.array([attacking]), matchups.pokemon_types
+    )[0]
+    rows = np.arange(len(multipliers))
+    if min_multiplier is not None:
+        rows = rows[multipliers >= min_multiplier]
+
+    rows = rows[offset : offset + limit] if limit else rows[offset:]
+    return [
+        TypeEffectivenessDTO(
+            **_pokemon_types_kwargs(matchups, row),
+            multiplier=float(multipliers[row]),
+        )
+        for row in rows.tolist()
+    ]
+
+
+def get_defensive_profile(identifier: str) -> DefensiveProfileDTO:
+    """Get multipliers of every attacking type against a Pokemon.
+
+    Args:
+        identifier: Pokemon name or ID
+
+    Returns:
+        DefensiveProfileDTO instance
+    """
+    matchups = get_type_matchups()
+    row = _pokemon_row(matchups, identifier)
+
+    multipliers = matchups.defending_multipliers(
+        np.arange(len(matchups.type_names)), matchups.pokemon_types[[row]]
+    )[:, 0]
+
+    return DefensiveProfileDTO(
+        **_pokemon_types_kwargs(matchups, row),
+        multipliers=dict(zip(matchups.type_names, multipliers.tolist())),
+    )
+
+
+def get_damage_ranking(ranking_request: DamageRankingRequestDTO) -> DamageRankingDTO:
+    """Rank all Pokemon by expected damage of their best STAB type against a defender.
+
+    One vectorized computation over the cached stat and type matrices.
+
+    Args:
+        ranking_request: Defender (id or name), level, move power and limit
+
+    Returns:
+        DamageRankingDTO with attackers ordered by expected damage
+
+    Raises:
+        models.Pokemon.DoesNotExist: If the defender is not found
+    """
+    identifier = str(ranking_request.id) if ranking_request.id else ranking_request.name
+    if not identifier:
+        raise ValueError("Either id or name must be provided")
+
+    tables = get_damage_tables()
+    matchups = tables.matchups
+    defender = _pokemon_row(matchups, identifier)
+
+    estimates = tables.estimate(defender, ranking_request.level, ranking_request.power)
+    ranking = np.argsort(-estimates.damage, kind="stable")
+    if ranking_request.limit:
+        ranking = ranking[: ranking_request.limit]
+
+    # Columns are converted at once, values come straight from the typed matrices,
+    # so attackers skip validation
+    type_names = matchups.type_names + (None,)
+    columns = zip(
+        ranking.tolist(),
+        estimates.stab_type[ranking].tolist(),
+        estimates.special[ranking].tolist(),
+        estimates.multiplier[ranking].tolist(),
+        estimates.damage[ranking].round(1).tolist(),
+        estimates.damage_percent[ranking].round(1).tolist(),
+    )
+    return DamageRankingDTO.model_construct(
+        defender=PokemonTypesDTO(**_pokemon_types_kwargs(matchups, defender)),
+        defender_hp=estimates.defender_hp,
+        level=ranking_request.level,
+        power=ranking_request.power,
+        attackers=[
+            DamageEstimateDTO.model_construct(
+                **_pokemon_types_kwargs(matchups, row),
+                stab_type=type_names[stab_type],
+                category="special" if special else "physical",
+                multiplier=multiplier,
+                damage=damage,
+                damage_percent=damage_percent,
+            )
+            for row, stab_type, special, multiplier, damage, damage_percent in columns
+        ],
+    )
+
+
+def get_team_coverage(identifiers: list[str]) -> TeamCoverageDTO:
+    """Summarize team weaknesses and offensive coverage of its STAB types.
+
+    Args:
+        identifiers: Team member names or IDs
+
+    Returns:
+        TeamCoverageDTO instance
+    """
+    matchups = get_type_matchups()
+    rows = [_pokemon_row(matchups, identifier) for identifier in identifiers]
+    all_types = np.arange(len(matchups.type_names))
+
+    # (types, members) multipliers of every attacking type against each member
+    taken = matchups.defending_multipliers(all_types, matchups.pokemon_types[rows])
+    weak = (taken > 1).sum(axis=1)
+    resistant = ((taken > 0) & (taken < 1)).sum(axis=1)
+    immune = (taken == 0).sum(axis=1)
+
+    # Team STAB types (without the neutral padding)
+    stab = np.unique(matchups.pokemon_types[rows])
+    stab = stab[stab < len(matchups.type_names)]
+
+    # Best STAB multiplier against each single type and against every Pokemon
+    # (0 when no member has a stored type)
+    offense = matchups.matrix[stab][:, all_types].max(axis=0, initial=0.0)
+    best = matchups.defending_multipliers(stab, matchups.pokemon_types).max(
+        axis=0, initial=0.0
+    )
+
+    return TeamCoverageDTO(
+        members=[
+            PokemonTypesDTO(**_pokemon_types_kwargs(matchups, row)) for row in rows
+        ],
+        defense={
+            type_name: TeamDefenseSummaryDTO(
+                weak=int(weak[index]),
+                resistant=int(resistant[index]),
+                immune=int(immune[index]),
+            )
+            for index, type_name in enumerate(matchups.type_names)
+        },
+        offense=dict(zip(matchups.type_names, offense.tolist())),
+        pokemon_coverage=TeamOffenseSummaryDTO(
+            super_effective=int((best > 1).sum()),
+            neutral=int((best == 1).sum()),
+            not_very_effective=int(((best > 0) & (best < 1)).sum()),
+            no_effect=int((best == 0).sum()),
+        ),
+    )
+
+
+## MOVES
+
+
+def get_pokemon_learning_move(
+    move_name: str, offset: int, limit: int
+) -> list[PokemonListDTO]:
+    """Get Pokemon which learn the move.
+
+    Args:
+        move_name: Move name
+        offset: Starting position
+        limit: Maximum number of Pokemon to return (when set to 0, all are returned)
+
+    Returns:
+        list[PokemonListDTO] ordered by id
+
+    Raises:
+        models.Move.DoesNotExist: If the move is not found
+    """
+    move = models.Move.objects.only("id").get(name=move_name.lower())
+
+    # Served by the (move, pokemon) index of the relation table
+    query = project_queryset(
+        models.Pokemon.objects.filter(move_relations__move_id=move.id).order_by("id"),
+        PokemonListDTO.PROJECTED_FIELDS,
+    )
+
+    return [
+        PokemonListDTO.from_model(pokemon)
+        for pokemon in _paginate(query, offset, limit)
+    ]
+
+
+def get_shared_moves(identifier1: str, identifier2: str) -> SharedMovesDTO:
+    """Get moves learned by both Pokemon.
+
+    Args:
+        identifier1: Name or ID of the first Pokemon
+        identifier2: Name or ID of the second Pokemon
+
+    Returns:
+        SharedMovesDTO with the moves ordered by id
+
+    Raises:
+        models.Pokemon.DoesNotExist: If any of the Pokemon is not found
+    """
+    pokemon1, pokemon2 = _get_comparison_pokemon([identifier1, identifier2])
+
+    # One join of the relation table per Pokemon, both on the (pokemon, move) index
+    moves = (
+        models.Move.objects.filter(pokemon_relations__pokemon_id=pokemon1.id)
+        .filter(pokemon_relations__pokemon_id=pokemon2.id)
+        .only("id", "name")
+        .order_by("id")
+    )
+
+    return SharedMovesDTO(
+        pokemon1=pokemon1.name,
+        pokemon2=pokemon2.name,
+        moves=[MoveDTO(id=move.id, name=move.name) for move in moves],
+    )
+
+
 ## ABILITIES
 
 
-def get_all_abilities(offset: int, limit: int) -> list[AbilityDTO]:
+def _localized_abilities(
+    localization: AbilityLanguageRequestDTO, fields: frozenset[str] | None
+) -> QuerySet[models.PokemonAbility]:
+    """Abilities with only the requested fields and texts in the requested language."""
+    query = models.PokemonAbility.objects.localized(
+        localization.lang,
+        localization.version_group,
+        effects=fields is None or "effect_entries" in fields,
+        flavor_texts=fields is None or "flavor_text_entries" in fields,
+    )
+    return project_queryset(query, AbilityDTO.PROJECTED_FIELDS, fields)
+
+
+def get_all_abilities(
+    offset: int,
+    limit: int,
+    localization: AbilityLanguageRequestDTO,
+    fields: frozenset[str] | None = None,
+) -> list[AbilityDTO]:
     """Get all Pokemon abilities with pagination.
 
     Args:
         offset: Starting position (which Ability ID to start from)
         limit: Maximum number of Abilities to return (when set to 0, all Abilities are returned)
+        localization: Language (and version group) of the effect and flavor texts
+        fields: Fields to load and return (None for all of them)
 
     Returns:
         list[AbilityDTO] with applied pagination
     """
-    # Optimize database queries and ensure consistent ordering
-    abilities_query = models.PokemonAbility.objects.all().order_by("id")
+    if localization.is_default and (snapshot := get_snapshot()):
+        if fields is None:
+            return snapshot.page(snapshot.abilities, offset, limit)
+        return [
+            project_dto(ability, fields)
+            for ability in _paginate(snapshot.abilities, offset, limit)
+        ]
 
-    # Apply pagination - if limit is 0, return all abilities from offset
-    if not limit:
-        abilities_models = abilities_query[offset:]
-    else:
-        abilities_models = abilities_query[offset : offset + limit]
+    # Ensure consistent ordering
+    abilities_query = _localized_abilities(localization, fields).order_by("id")
+    abilities_models = _paginate(abilities_query, offset, limit)
 
-    return [AbilityDTO.from_model(ability) for ability in abilities_models]
+    return [AbilityDTO.from_model(ability, fields) for ability in abilities_models]
 
 
-def get_ability_details(ability_name: str) -> AbilityDTO:
+def get_ability_details(
+    ability_name: str,
+    localization: AbilityLanguageRequestDTO,
+    fields: frozenset[str] | None = None,
+) -> AbilityDTO:
     """Get detailed ability information.
 
     Args:
         ability_name: Ability name
+        localization: Language (and version group) of the effect and flavor texts
+        fields: Fields to load and return (None for all of them)
 
     Returns:
         Ability details
     """
-    ability = models.PokemonAbility.objects.get(name__iexact=ability_name)
-    return AbilityDTO.from_model(ability)
+    if localization.is_default and (snapshot := get_snapshot()):
+        ability = snapshot.abilities_by_name.get(ability_name.lower())
+        if ability is None:
+            raise models.PokemonAbility.DoesNotExist(
+                "PokemonAbility matching query does not exist."
+            )
+        return project_dto(ability, fields)
+
+    ability = _localized_abilities(localization, fields).get(name__iexact=ability_name)
+    return AbilityDTO.from_model(ability, fields)
+
+
+def search_abilities(
+    search: AbilitySearchRequestDTO, offset: int, limit: int
+) -> list[AbilitySearchResultDTO]:
+    """Full-text search of abilities by name, effect and flavor text.
+
+    Matching, ranking and highlighting run in PostgreSQL over the GIN indexed
+    search documents of the language.
+
+    Args:
+        search: Query (web search syntax, e.g. `raises speed -hail`) and language
+        offset: Starting position
+        limit: Maximum number of abilities to return (when set to 0, all are returned)
+
+    Returns:
+        list[AbilitySearchResultDTO] ordered by rank
+    """
+    config = models.TEXT_SEARCH_CONFIGS.get(search.lang, "simple")
+    query = SearchQuery(search.q, config=config, search_type="websearch")
+
+    documents = (
+        models.AbilitySearchDocument.objects.filter(
+            language=search.lang, search_vector=query
+        )
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            headline=SearchHeadline(
+                Concat("effect", Value(" "), "flavor_text"),
+                query,
+                config=config,
+                start_sel="<b>",
+                stop_sel="</b>",
+                max_words=35,
+                min_words=15,
+            ),
+        )
+        .order_by("-rank", "ability_id")
+        .values("ability_id", "ability__name", "rank", "headline")
+    )
+
+    return [
+        AbilitySearchResultDTO(
+            id=document["ability_id"],
+            name=document["ability__name"],
+            language=search.lang,
+            rank=document["rank"],
+            headline=document["headline"],
+        )
+        for document in _paginate(documents, offset, limit)
+    ]
+
+
+def get_changes(
+    changes_request: ChangesRequestDTO, committed_until: datetime
+) -> ChangesDTO:
+    """Get resources created, updated or deleted by ingestion in a time window.
+
+    The window ends at `committed_until` at the latest, changes stamped later
+    may belong to an ingestion that has not committed yet (and would be
+    skipped by the next poll starting at the returned `until`).
+
+    Args:
+        changes_request: Window start (exclusive), end (inclusive) and pagination
+        committed_until: Time up to which all ingestion changes are committed
+            (see `dataset.get_committed_until`)
+
+    Returns:
+        ChangesDTO: Changes ordered by change time, kind and ID
+    """
+    since = changes_request.since
+    until = max(since, min(changes_request.until or committed_until, committed_until))
+
+    # Aliases are shared by the united queries (and differ from all field names)
+    queries = [
+        model.objects.filter(modified__gt=since, modified__lte=until).values(
+            change_kind=Value(kind),
+            change_id=F("id"),
+            change_name=F("name"),
+            action=Case(
+                When(created__gt=since, then=Value("created")),
+                default=Value("updated"),
+            ),
+            changed=F("modified"),
+        )
+        for kind, model in models.CHANGE_KINDS.items()
+    ]
+    queries.append(
+        models.Tombstone.objects.filter(deleted__gt=since, deleted__lte=until).values(
+            change_kind=F("kind"),
+            change_id=F("resource_id"),
+            change_name=F("name"),
+            action=Value("deleted"),
+            changed=F("deleted"),
+        )
+    )
+    changes = queries[0].union(*queries[1:], all=True)
+
+    # The returned `until` becomes the next `since`, so rows committed before it
+    # must be visible, which a lagging replica does not guarantee
+    with use_primary():
+        return ChangesDTO(
+            since=since,
+            until=until,
+            count=changes.count(),
+            changes=[
+                ChangeDTO(
+                    kind=change["change_kind"],
+                    id=change["change_id"],
+                    name=change["change_name"],
+                    action=change["action"],
+                    changed=change["changed"],
+                )
+                for change in _paginate(
+                    changes.order_by("changed", "change_kind", "change_id"),
+                    changes_request.offset,
+                    changes_request.limit,
+                )
+            ],
+        )
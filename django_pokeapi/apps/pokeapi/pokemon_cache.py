@@ -0,0 +1,59 @@
+import logging
+
+from redis.exceptions import RedisError
+
+from django_pokeapi.apps.common import redis, redis_key
+
+_log = logging.getLogger(__name__)
+
+# Entries of older dataset versions are never read again, let them expire
+POKEMON_CACHE_TTL = 24 * 60 * 60
+
+
+def _key(version: int, identifier: str) -> str:
+    return redis_key("pokemon", version, identifier)
+
+
+def get_many(version: int, identifiers: list[str]) -> dict[str, bytes]:
+    """Get encoded Pokemon details of the dataset version in one round trip.
+
+    Args:
+        version: Dataset version
+        identifiers: Pokemon IDs or lowercase names
+
+    Returns:
+        Encoded `PokemonDTO` JSON by identifier (misses are left out)
+    """
+    if not identifiers:
+        return {}
+
+    try:
+        values = redis.mget([_key(version, identifier) for identifier in identifiers])
+    except RedisError as error:
+        _log.warning("Unable to read cached Pokemon: %s", error)
+        return {}
+
+    return {
+        identifier: value
+        for identifier, value in zip(identifiers, values)
+        if value is not None
+    }
+
+
+def set_many(version: int, pokemon: dict[str, bytes]) -> None:
+    """Cache encoded Pokemon details of the dataset version.
+
+    Args:
+        version: Dataset version
+        pokemon: Encoded `PokemonDTO` JSON by Pokemon ID and/or lowercase name
+    """
+    if not pokemon:
+        return
+
+    try:
+        pipeline = redis.pipeline(transaction=False)
+        for identifier, content in pokemon.items():
+            pipeline.set(_key(version, identifier), content, ex=POKEMON_CACHE_TTL)
+        pipeline.execute()
+    except RedisError as error:
+        _log.warning("Unable to cache Pokemon: %s", error)
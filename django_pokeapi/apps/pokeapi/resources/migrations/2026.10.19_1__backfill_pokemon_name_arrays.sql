@@ -0,0 +1,19 @@
+update pokeapi.pokemon p
+set type_names = coalesce(
+        (
+            select array_agg(t.name order by r.slot)
+            from pokeapi.pokemon_type_relations r
+            join pokeapi.pokemon_types t on t.id = r.pokemon_type_id
+            where r.pokemon_id = p.id
+        ),
+        '{}'
+    ),
+    ability_names = coalesce(
+        (
+            select array_agg(a.name order by r.slot)
+            from pokeapi.pokemon_ability_relations r
+            join pokeapi.abilities a on a.id = r.ability_id
+            where r.pokemon_id = p.id
+        ),
+        '{}'
+    );
@@ -0,0 +1,23 @@
+with base_stats as (
+    select
+        p.id,
+        coalesce(max((s ->> 'base_stat')::int) filter (where s -> 'stat' ->> 'name' = 'hp'), 0) as hp,
+        coalesce(max((s ->> 'base_stat')::int) filter (where s -> 'stat' ->> 'name' = 'attack'), 0) as attack,
+        coalesce(max((s ->> 'base_stat')::int) filter (where s -> 'stat' ->> 'name' = 'defense'), 0) as defense,
+        coalesce(max((s ->> 'base_stat')::int) filter (where s -> 'stat' ->> 'name' = 'special-attack'), 0) as special_attack,
+        coalesce(max((s ->> 'base_stat')::int) filter (where s -> 'stat' ->> 'name' = 'special-defense'), 0) as special_defense,
+        coalesce(max((s ->> 'base_stat')::int) filter (where s -> 'stat' ->> 'name' = 'speed'), 0) as speed
+    from pokeapi.pokemon p
+    cross join lateral jsonb_array_elements(p.stats) s
+    group by p.id
+)
+update pokeapi.pokemon p
+set hp = b.hp,
+    attack = b.attack,
+    defense = b.defense,
+    special_attack = b.special_attack,
+    special_defense = b.special_defense,
+    speed = b.speed,
+    stat_total = b.hp + b.attack + b.defense + b.special_attack + b.special_defense + b.speed
+from base_stats b
+where b.id = p.id;
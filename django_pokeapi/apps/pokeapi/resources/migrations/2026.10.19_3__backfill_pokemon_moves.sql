@@ -0,0 +1,21 @@
+-- Move ids are taken from the PokeAPI resource URL (.../move/<id>/)
+create temporary table pokemon_moves_backfill on commit drop as
+select p.id as pokemon_id,
+    (regexp_match(m.value -> 'move' ->> 'url', '/(\d+)/?$'))[1]::integer as move_id,
+    m.value -> 'move' ->> 'name' as move_name,
+    m.ordinality - 1 as position
+from pokeapi.pokemon p
+cross join lateral jsonb_array_elements(p.moves) with ordinality m;
+
+insert into pokeapi.moves (id, name, created)
+select distinct on (move_id) move_id, move_name, now()
+from pokemon_moves_backfill
+where move_id is not null
+order by move_id
+on conflict do nothing;
+
+insert into pokeapi.pokemon_move_relations (pokemon_id, move_id, position)
+select pokemon_id, move_id, min(position)
+from pokemon_moves_backfill
+where move_id is not null
+group by pokemon_id, move_id;
@@ -0,0 +1,45 @@
+-- Text search configurations must match `models.TEXT_SEARCH_CONFIGS`
+insert into pokeapi.ability_search_documents (
+    ability_id, language, config, name, effect, flavor_text
+)
+select a.id,
+    l.language,
+    case l.language
+        when 'de' then 'german'
+        when 'en' then 'english'
+        when 'es' then 'spanish'
+        when 'fr' then 'french'
+        when 'it' then 'italian'
+        else 'simple'
+    end,
+    replace(a.name, '-', ' '),
+    coalesce(
+        (
+            select string_agg(e ->> 'effect' || ' ' || (e ->> 'short_effect'), ' ')
+            from jsonb_array_elements(a.effect_entries) e
+            where e -> 'language' ->> 'name' = l.language
+        ),
+        ''
+    ),
+    coalesce(
+        (
+            select string_agg(distinct regexp_replace(f ->> 'flavor_text', '\s+', ' ', 'g'), ' ')
+            from jsonb_array_elements(a.flavor_text_entries) f
+            where f -> 'language' ->> 'name' = l.language
+        ),
+        ''
+    )
+from pokeapi.abilities a
+cross join lateral (
+    select e -> 'language' ->> 'name' as language
+    from jsonb_array_elements(a.effect_entries) e
+    union
+    select f -> 'language' ->> 'name'
+    from jsonb_array_elements(a.flavor_text_entries) f
+) l
+where l.language is not null;
+
+update pokeapi.ability_search_documents
+set search_vector = setweight(to_tsvector(config::regconfig, name), 'A')
+    || setweight(to_tsvector(config::regconfig, effect), 'B')
+    || setweight(to_tsvector(config::regconfig, flavor_text), 'C');
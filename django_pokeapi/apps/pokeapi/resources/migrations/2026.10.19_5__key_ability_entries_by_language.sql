@@ -0,0 +1,28 @@
+-- [entry, ...] -> {"<language>": [entry, ...]} keeping the PokeAPI order
+update pokeapi.abilities a
+set effect_entries = coalesce(
+        (
+            select jsonb_object_agg(language, entries)
+            from (
+                select e.value -> 'language' ->> 'name' as language,
+                    jsonb_agg(e.value order by e.ordinality) as entries
+                from jsonb_array_elements(a.effect_entries) with ordinality e
+                group by 1
+            ) grouped
+        ),
+        '{}'
+    ),
+    flavor_text_entries = coalesce(
+        (
+            select jsonb_object_agg(language, entries)
+            from (
+                select f.value -> 'language' ->> 'name' as language,
+                    jsonb_agg(f.value order by f.ordinality) as entries
+                from jsonb_array_elements(a.flavor_text_entries) with ordinality f
+                group by 1
+            ) grouped
+        ),
+        '{}'
+    )
+where jsonb_typeof(a.effect_entries) = 'array'
+    or jsonb_typeof(a.flavor_text_entries) = 'array';
@@ -0,0 +1,6 @@
+-- Rows written by bulk ingestion never had `modified` set, report them as
+-- changed when they were created
+update pokeapi.pokemon set modified = created where modified is null;
+update pokeapi.abilities set modified = created where modified is null;
+update pokeapi.pokemon_types set modified = created where modified is null;
+update pokeapi.moves set modified = created where modified is null;
@@ -0,0 +1,7 @@
+-- Move heavy JSON columns of existing Pokemon into the details side table
+insert into pokeapi.pokemon_details (
+    pokemon_id, forms, held_items, location_area_encounters, species_data, stats
+)
+select id, forms, held_items, location_area_encounters, species_data, stats
+from pokeapi.pokemon
+on conflict (pokemon_id) do nothing;
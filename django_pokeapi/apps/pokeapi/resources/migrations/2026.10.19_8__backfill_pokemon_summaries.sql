@@ -0,0 +1,7 @@
+-- List summaries of existing Pokemon
+insert into pokeapi.pokemon_summaries (
+    pokemon_id, name, height, weight, base_experience, sprites, type_names
+)
+select id, name, height, weight, base_experience, sprites, type_names
+from pokeapi.pokemon
+on conflict (pokemon_id) do nothing;
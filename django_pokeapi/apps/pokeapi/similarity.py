@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.dataset import cached_per_version
+
+# Weight of the type difference (0 for the same types, 1 for no shared type)
+# relative to one standard deviation of a single base stat
+TYPE_DISTANCE_WEIGHT = 2.0
+
+
+def _standardize(values: np.ndarray) -> np.ndarray:
+    """Scale columns to zero mean and unit variance (constant columns to zero)."""
+    std = values.std(axis=0)
+    return (values - values.mean(axis=0)) / np.where(std > 0, std, 1.0)
+
+
+@dataclass(frozen=True)
+class PokemonVectors:
+    """Feature matrices of every Pokemon for nearest-neighbour queries.
+
+    Base stats and size (log height and weight) are standardized per column,
+    so every stat contributes equally to the euclidean distance.
+    """
+
+    pokemon_ids: np.ndarray  # (pokemon,) int32
+    pokemon_names: tuple[str, ...]
+    pokemon_type_names: tuple[tuple[str, ...], ...]
+    pokemon_rows: dict[str, int]  # name or str(id) -> row
+
+    stats: np.ndarray  # (pokemon, 6) float32, standardized base stats
+    size: np.ndarray  # (pokemon, 2) float32, standardized log height and weight
+    types: np.ndarray  # (pokemon, types) float32, one-hot encoded types
+    base_experience: np.ndarray  # (pokemon,) int32, -1 when unknown
+
+    def nearest(
+        self,
+        row: int,
+        k: int,
+        include_types: bool = False,
+        include_size: bool = False,
+        same_type: bool = False,
+        max_base_experience: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find Pokemon closest to the Pokemon at `row` (excluding itself).
+
+        Args:
+            row: Row of the reference Pokemon
+            k: Maximum number of Pokemon to return
+            include_types: Add type difference (1 - Jaccard index) to the distance
+            include_size: Add height and weight difference to the distance
+            same_type: Only Pokemon sharing at least one type
+            max_base_experience: Only Pokemon with at most this base experience
+                (Pokemon with unknown base experience are left out)
+
+        Returns:
+            (rows, distances) ordered by distance
+        """
+        squared = np.square(self.stats - self.stats[row]).sum(axis=1)
+        if include_size:
+            squared += np.square(self.size - self.size[row]).sum(axis=1)
+
+        mask = np.ones(len(squared), dtype=bool)
+        mask[row] = False
+
+        if include_types or same_type:
+            shared = self.types @ self.types[row]
+            if same_type:
+                mask &= shared > 0
+            if include_types:
+                union = self.types.sum(axis=1) + self.types[row].sum() - shared
+                jaccard = np.divide(
+                    shared, union, out=np.ones_like(shared), where=union > 0
+                )
+                squared += np.square(TYPE_DISTANCE_WEIGHT * (1.0 - jaccard))
+
+        if max_base_experience is not None:
+            mask &= (self.base_experience >= 0) & (
+                self.base_experience <= max_base_experience
+            )
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > k:
+            nearest = np.argpartition(squared[candidates], k - 1)[:k]
+            candidates = candidates[nearest]
+
+        candidates = candidates[np.argsort(squared[candidates], kind="stable")]
+        return candidates, np.sqrt(squared[candidates])
+
+
+def build_pokemon_vectors(
+    pokemon: list[tuple],
+) -> PokemonVectors:
+    """Build feature matrices from stored Pokemon.
+
+    Args:
+        pokemon: (id, name, type names, base experience, height, weight,
+            *base stats in `models.STAT_COLUMNS` order) of every Pokemon
+
+    Returns:
+        PokemonVectors instance
+    """
+    type_index: dict[str, int] = {}
+    for entry in pokemon:
+        for type_name in entry[2]:
+            type_index.setdefault(type_name, len(type_index))
+
+    types = np.zeros((len(pokemon), len(type_index)), dtype=np.float32)
+    pokemon_rows: dict[str, int] = {}
+    for row, entry in enumerate(pokemon):
+        types[row, [type_index[type_name] for type_name in entry[2]]] = 1.0
+        pokemon_rows[entry[1]] = row
+        pokemon_rows[str(entry[0])] = row
+
+    stats = np.array([entry[6:] for entry in pokemon], dtype=np.float64)
+    size = np.log1p(np.array([entry[4:6] for entry in pokemon], dtype=np.float64))
+
+    return PokemonVectors(
+        pokemon_ids=np.array([entry[0] for entry in pokemon], dtype=np.int32),
+        pokemon_names=tuple(entry[1] for entry in pokemon),
+        pokemon_type_names=tuple(tuple(entry[2]) for entry in pokemon),
+        pokemon_rows=pokemon_rows,
+        stats=_standardize(
+            stats.reshape(len(pokemon), len(models.STAT_COLUMNS))
+        ).astype(np.float32),
+        size=_standardize(size.reshape(len(pokemon), 2)).astype(np.float32),
+        types=types,
+        base_experience=np.array(
+            [-1 if entry[3] is None else entry[3] for entry in pokemon], dtype=np.int32
+        ),
+    )
+
+
+@cached_per_version
+def get_pokemon_vectors() -> PokemonVectors:
+    """Get Pokemon feature matrices for the current dataset version."""
+    return build_pokemon_vectors(
+        list(
+            models.Pokemon.objects.order_by("id").values_list(
+                "id",
+                "name",
+                "type_names",
+                "base_experience",
+                "height",
+                "weight",
+                *models.STAT_COLUMNS.values(),
+            )
+        )
+    )
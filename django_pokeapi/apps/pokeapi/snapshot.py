@@ -0,0 +1,244 @@
+import logging
+import threading
+import time
+from typing import Sequence
+
+from django.conf import settings
+from django.db import close_old_connections
+from redis.exceptions import RedisError
+
+from django_pokeapi.apps.common import redis, redis_key
+from django_pokeapi.apps.common.db_router import use_primary
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.dataset import (
+    DATASET_VERSION_CHANNEL,
+    get_dataset_version,
+)
+from django_pokeapi.apps.pokeapi.dto.api_dto import AbilityDTO, PokemonListDTO, TypeDTO
+from django_pokeapi.apps.pokeapi.dto.encoded import PreEncodedList, PreEncodedMixin
+from django_pokeapi.apps.pokeapi.dto.projection import project_queryset
+from django_pokeapi.apps.pokeapi.ipc.dto.pokemon import PokemonDTO
+
+_log = logging.getLogger(__name__)
+
+# Delay before re-subscribing after losing the Redis connection
+RESUBSCRIBE_DELAY = 5.0
+
+# JSON bytes of pages kept pre-encoded per snapshot (their compressed variants
+# come on top, each smaller than the JSON)
+PAGE_CACHE_BYTES = 16 * 1024**2
+
+
+class PokemonRecord:
+    __slots__ = ("id", "name", "detail", "list_item")
+
+    def __init__(
+        self, pokemon_id: int, name: str, detail: PokemonDTO, list_item: PokemonListDTO
+    ) -> None:
+        self.id = pokemon_id
+        self.name = name
+        self.detail = detail
+        self.list_item = list_item
+
+
+class DatasetSnapshot:
+    """Immutable in-memory copy of the read-only dataset.
+
+    Records are ordered by id and indexed by id and (lowercase) name. Every DTO
+    carries its pre-encoded JSON. Ability texts are in the default language.
+    """
+
+    __slots__ = (
+        "version",
+        "pokemon",
+        "pokemon_list",
+        "pokemon_by_id",
+        "pokemon_by_name",
+        "types",
+        "types_by_name",
+        "abilities",
+        "abilities_by_name",
+        "_pages",
+        "_pages_bytes",
+        "_pages_lock",
+    )
+
+    def __init__(
+        self,
+        version: int | None,
+        pokemon: list[PokemonRecord],
+        types: list[TypeDTO],
+        abilities: list[AbilityDTO],
+    ) -> None:
+        self.version = version
+        self.pokemon = tuple(pokemon)
+        self.pokemon_list = tuple(record.list_item for record in pokemon)
+        self.pokemon_by_id = {record.id: record for record in pokemon}
+        self.pokemon_by_name = {record.name.lower(): record for record in pokemon}
+        self.types = tuple(types)
+        self.types_by_name = {pokemon_type.name: pokemon_type for pokemon_type in types}
+        self.abilities = tuple(abilities)
+        self.abilities_by_name = {
+            ability.name.lower(): ability for ability in abilities
+        }
+        self._pages: dict[tuple[int, int, int], PreEncodedList] = {}
+        self._pages_bytes = 0
+        self._pages_lock = threading.Lock()
+
+    def page(
+        self, items: Sequence[PreEncodedMixin], offset: int, limit: int
+    ) -> PreEncodedList:
+        """Get a page of snapshot DTOs together with its pre-encoded JSON array.
+
+        Canonical pages (the whole sequence and pages at multiples of their
+        limit) are cached for the lifetime of the snapshot, up to
+        `PAGE_CACHE_BYTES` (oldest dropped first), so their JSON array (and its
+        compressed variants) is built once per dataset version. Other pages are
+        built per request, so arbitrary offsets can't fill the memory.
+
+        Args:
+            items: One of the snapshot sequences (e.g. `pokemon_list`)
+            offset: Starting position
+            limit: Maximum number of items (when set to 0, all items are returned)
+
+        Returns:
+            Items of the page
+        """
+        end = min(offset + limit, len(items)) if limit else len(items)
+        if offset >= end:
+            return PreEncodedList(())
+        if offset % (limit or len(items)):
+            return PreEncodedList(items[offset:end])
+
+        key = (id(items), offset, end)
+        page = self._pages.get(key)
+        if page is None:
+            page = PreEncodedList(items[offset:end])
+            # pylint: disable-next=protected-access
+            size = len(page._encoded.content)
+            if size > PAGE_CACHE_BYTES:
+                return page
+
+            with self._pages_lock:
+                if key in self._pages:
+                    return self._pages[key]
+                while self._pages and self._pages_bytes + size > PAGE_CACHE_BYTES:
+                    evicted = self._pages.pop(next(iter(self._pages)))
+                    # pylint: disable-next=protected-access
+                    self._pages_bytes -= len(evicted._encoded.content)
+                self._pages[key] = page
+                self._pages_bytes += size
+        return page
+
+    @classmethod
+    def load(cls) -> "DatasetSnapshot":
+        """Load snapshot of the current dataset from the database."""
+        start = time.perf_counter()
+        version = get_dataset_version()
+
+        # Full rows (both detail and list DTOs are built from them) together with
+        # the relation prefetches of the detail DTO
+        pokemon_query = project_queryset(
+            models.Pokemon.objects.order_by("id"), PokemonDTO.PROJECTED_FIELDS
+        ).defer(None)
+        pokemon = [
+            PokemonRecord(
+                pokemon.id,
+                pokemon.name,
+                PokemonDTO.from_model(pokemon).encode(),
+                PokemonListDTO.from_model(pokemon).encode(),
+            )
+            for pokemon in pokemon_query
+        ]
+        types = [
+            TypeDTO.from_model(pokemon_type).encode()
+            for pokemon_type in models.PokemonType.objects.order_by("id")
+        ]
+        abilities = [
+            AbilityDTO.from_model(ability).encode()
+            for ability in project_queryset(
+                models.PokemonAbility.objects.localized(models.DEFAULT_LANGUAGE),
+                AbilityDTO.PROJECTED_FIELDS,
+            ).order_by("id")
+        ]
+
+        snapshot = cls(version, pokemon, types, abilities)
+        _log.info(
+            "Loaded dataset snapshot %s (%d Pokemon, %d types, %d abilities) in %.2fs",
+            version,
+            len(pokemon),
+            len(types),
+            len(abilities),
+            time.perf_counter() - start,
+        )
+        return snapshot
+
+
+_snapshot: DatasetSnapshot | None = None
+_lock = threading.Lock()
+_listener: threading.Thread | None = None
+
+
+def get_snapshot() -> DatasetSnapshot | None:
+    """Get the current dataset snapshot of this worker.
+
+    The snapshot is loaded on first use, together with a background listener
+    replacing it whenever a new dataset version is published.
+
+    Returns:
+        DatasetSnapshot, None when snapshot reads are disabled
+    """
+    if not settings.SNAPSHOT_READS:
+        return None
+
+    if _snapshot is None:
+        with _lock:
+            if _snapshot is None:
+                _reload()
+                _start_listener()
+
+    return _snapshot
+
+
+def _reload() -> None:
+    global _snapshot  # pylint: disable=global-statement
+
+    # Readers keep using the previous snapshot until the new one is swapped in.
+    # It is kept for the whole version, so it must not come from a lagging replica.
+    with use_primary():
+        _snapshot = DatasetSnapshot.load()
+
+
+def _start_listener() -> None:
+    global _listener  # pylint: disable=global-statement
+
+    if _listener is None:
+        _listener = threading.Thread(
+            target=_listen, name="dataset-snapshot-listener", daemon=True
+        )
+        _listener.start()
+
+
+def _listen() -> None:
+    """Reload the snapshot on every published dataset version (runs forever)."""
+    while True:
+        try:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(redis_key(DATASET_VERSION_CHANNEL))
+
+            # Catch up with versions published while not subscribed
+            if _snapshot is None or _snapshot.version != get_dataset_version():
+                _reload()
+
+            for message in pubsub.listen():
+                if _snapshot is None or _snapshot.version != int(message["data"]):
+                    _reload()
+                close_old_connections()
+        except RedisError as error:
+            _log.warning("Dataset version subscription failed: %s", error)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            _log.error("Dataset snapshot reload failed", exc_info=error)
+        finally:
+            close_old_connections()
+
+        time.sleep(RESUBSCRIBE_DELAY)
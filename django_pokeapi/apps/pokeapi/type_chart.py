@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from django_pokeapi.apps.pokeapi import models
+from django_pokeapi.apps.pokeapi.dataset import cached_per_version
+
+# damage_relations key -> multiplier of the attacking type against the listed types
+_DAMAGE_MULTIPLIERS = {
+    "double_damage_to": 2.0,
+    "half_damage_to": 0.5,
+    "no_damage_to": 0.0,
+}
+
+
+@dataclass(frozen=True)
+class TypeMatchups:
+    """Dense type effectiveness matrix together with the types of every Pokemon.
+
+    `matrix[a, d]` is the multiplier of attacking type `a` against defending
+    type `d`. It has one extra neutral (1.0) column, index `len(type_names)`,
+    which pads `pokemon_types` for single-typed Pokemon so any dual-type
+    multiplier is just the product of two matrix lookups.
+    """
+
+    type_names: tuple[str, ...]
+    type_index: dict[str, int]
+    matrix: np.ndarray  # (types, types + 1) float32
+
+    pokemon_ids: np.ndarray  # (pokemon,) int32
+    pokemon_names: tuple[str, ...]
+    pokemon_types: np.ndarray  # (pokemon, 2) int, padded with the neutral column
+    pokemon_rows: dict[str, int]  # name or str(id) -> row
+
+    def defending_multipliers(
+        self, attacking: np.ndarray, defending: np.ndarray
+    ) -> np.ndarray:
+        """Multipliers of attacking types against (dual-)typed defenders.
+
+        Args:
+            attacking: (a,) attacking type indices
+            defending: (d, 2) padded type indices of the defenders
+
+        Returns:
+            (a, d) multipliers
+        """
+        return self.matrix[attacking][:, defending].prod(axis=2)
+
+    def pokemon_type_names(self, row: int) -> list[str]:
+        return [
+            self.type_names[index]
+            for index in self.pokemon_types[row]
+            if index < len(self.type_names)
+        ]
+
+
+def build_type_matchups(
+    pokemon_types: list[models.PokemonType],
+    pokemon: list[tuple[int, str, list[str]]],
+) -> TypeMatchups:
+    """Build type matchup matrices from stored damage relations.
+
+    Args:
+        pokemon_types: Pokemon types with `damage_relations`
+        pokemon: (id, name, type names) of every Pokemon
+
+    Returns:
+        TypeMatchups instance
+    """
+    type_names = tuple(pokemon_type.name for pokemon_type in pokemon_types)
+    type_index = {name: index for index, name in enumerate(type_names)}
+    neutral = len(type_names)
+
+    matrix = np.ones((len(type_names), len(type_names) + 1), dtype=np.float32)
+    for pokemon_type in pokemon_types:
+        row = type_index[pokemon_type.name]
+        for relation, multiplier in _DAMAGE_MULTIPLIERS.items():
+            for target in pokemon_type.damage_relations.get(relation, []):
+                if target["name"] in type_index:
+                    matrix[row, type_index[target["name"]]] = multiplier
+
+    padded_types = np.full((len(pokemon), 2), neutral, dtype=np.intp)
+    pokemon_rows: dict[str, int] = {}
+    for row, (pokemon_id, name, names) in enumerate(pokemon):
+        indices = [
+            type_index[type_name] for type_name in names if type_name in type_index
+        ][:2]
+        padded_types[row, : len(indices)] = indices
+        pokemon_rows[name] = row
+        pokemon_rows[str(pokemon_id)] = row
+
+    return TypeMatchups(
+        type_names=type_names,
+        type_index=type_index,
+        matrix=matrix,
+        pokemon_ids=np.array([entry[0] for entry in pokemon], dtype=np.int32),
+        pokemon_names=tuple(entry[1] for entry in pokemon),
+        pokemon_types=padded_types,
+        pokemon_rows=pokemon_rows,
+    )
+
+
+@cached_per_version
+def get_type_matchups() -> TypeMatchups:
+    """Get type matchup matrices for the current dataset version."""
+    return build_type_matchups(
+        list(models.PokemonType.objects.order_by("id")),
+        list(
+            models.Pokemon.objects.order_by("id").values_list(
+                "id", "name", "type_names"
+            )
+        ),
+    )
@@ -1,2 +1,3 @@
 from .celery import *
 from .django import *
+from .pokeapi import *
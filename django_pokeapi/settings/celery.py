@@ -3,6 +3,8 @@
 from .common import env
 
 REDIS_URL = env.str("REDIS_URL")
+# Prefix of application keys and channels (lets instances share one Redis)
+REDIS_KEY_PREFIX = env.str("REDIS_KEY_PREFIX", default="pokeapi")
 
 # Celery Configuration
 CELERY_BROKER_URL = REDIS_URL
@@ -11,14 +11,33 @@ ENVIRONMENT = env.str("ENVIRONMENT")
 INSTALLED_APPS = [
     "ninja",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_pokeapi.apps.common",
     "django_pokeapi.apps.pokeapi",
 ]
 
 MIDDLEWARE = [
+    # Outermost, so the profile covers compression and the size sent
+    "django_pokeapi.apps.common.middleware.ProfilingMiddleware",
+    "django_pokeapi.apps.common.middleware.CompressionMiddleware",
+    "django_pokeapi.apps.common.middleware.ReplicaReadsMiddleware",
     "django.middleware.common.CommonMiddleware",
 ]
 
+# Response compression (smaller bodies are sent uncompressed)
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_LEVELS = {
+    "zstd": env.int("COMPRESSION_ZSTD_LEVEL", default=3),
+    "br": env.int("COMPRESSION_BROTLI_LEVEL", default=5),
+    "gzip": env.int("COMPRESSION_GZIP_LEVEL", default=6),
+}
+
+# Per-request profiling (`ProfilingMiddleware`), off by default. A share of the
+# profiled requests also gets a cProfile dump written to `PROFILING_DIR`.
+PROFILING = env.bool("PROFILING", default=False)
+PROFILING_SAMPLE_RATE = env.float("PROFILING_SAMPLE_RATE", default=0.0)
+PROFILING_DIR = env.str("PROFILING_DIR", default="profiles")
+
 ROOT_URLCONF = "django_pokeapi.urls.urls"
 WSGI_APPLICATION = "django_pokeapi.wsgi.application"
 
@@ -48,6 +67,21 @@ DATABASES = {
     },
 }
 
+# Optional read replicas ("host" or "host:port", comma separated). Reads of
+# read-only API requests go to them, ingestion and everything else use `default`.
+DB_REPLICA_HOSTS = env.list("DB_REPLICA_HOSTS", default=[])
+# Replicas lagging more seconds behind are skipped (reads fall back to `default`)
+DB_REPLICA_MAX_LAG = env.float("DB_REPLICA_MAX_LAG", default=5.0)
+for _index, _replica in enumerate(DB_REPLICA_HOSTS, start=1):
+    _host, _, _port = _replica.partition(":")
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "PORT": int(_port) if _port else DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["django_pokeapi.apps.common.db_router.ReplicaRouter"]
+
 # Logging configuration
 LOGGING_LEVEL: str = env.str("LOGGING_LEVEL")
 
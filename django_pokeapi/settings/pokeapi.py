@@ -0,0 +1,9 @@
+from .common import env
+
+# Serve read endpoints from an in-process dataset snapshot instead of PostgreSQL.
+# Workers reload it when `populate_db` publishes a new dataset version.
+SNAPSHOT_READS = env.bool("SNAPSHOT_READS", default=False)
+
+# Render DTOs built by `operations` without validating them against the
+# endpoint's response schema again (switch off to compare or debug)
+TRUSTED_RESPONSES = env.bool("TRUSTED_RESPONSES", default=True)
@@ -5,8 +5,24 @@ from django.http import HttpRequest
 from ninja import NinjaAPI
 from ninja.renderers import BaseRenderer, JSONRenderer
 
+from django_pokeapi.apps.common.profiling import RENDER, timed
 from django_pokeapi.apps.pokeapi.api.pokeapi import router
 
+# Integers orjson can serialize (signed and unsigned 64-bit)
+ORJSON_INT_MIN = -(2**63)
+ORJSON_INT_MAX = 2**64 - 1
+
+
+def _has_big_int(data: typing.Any) -> bool:
+    """Check whether (nested) data holds an integer out of the orjson range."""
+    if isinstance(data, int):
+        return not ORJSON_INT_MIN <= data <= ORJSON_INT_MAX
+    if isinstance(data, dict):
+        return any(_has_big_int(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_big_int(value) for value in data)
+    return False
+
 
 class ORJSONRenderer(BaseRenderer):
     """Custom JSON renderer using orjson for better performance."""
@@ -19,16 +35,20 @@ class ORJSONRenderer(BaseRenderer):
     def render(
         self, request: HttpRequest, data: typing.Any, *, response_status: typing.Any
     ) -> bytes:
-        """Render data to JSON using orjson with fallback to default renderer."""
-        try:
-            return orjson.dumps(data)
-        except TypeError as error:
-            # Handle large integer overflow by falling back to default renderer
-            if "Integer exceeds 64-bit range" in str(error):
+        """Render data to JSON using orjson with fallback to default renderer.
+
+        orjson only supports 64-bit integers, data with larger ones (e.g. echoed
+        query parameters in validation errors) is rendered by the default renderer.
+        """
+        with timed(RENDER):
+            try:
+                return orjson.dumps(data)
+            except orjson.JSONEncodeError:
+                if not _has_big_int(data):
+                    raise
                 return self.backup_renderer.render(
                     request, data, response_status=response_status
                 )
-            raise error
 
 
 api = NinjaAPI(